@@ -1,12 +1,27 @@
 import sqlite3
+import time
 from datetime import datetime, timedelta
 import pytz # Make sure pytz is installed: pip install pytz
+import sys
+from contextlib import nullcontext
+from perfTools import tracer
+from taskRecords import Task, RecurringTask
 
 class DatabaseManager:
     def __init__(self, db_name='timePlanDB.db'):
         self.db_name = db_name
         self.conn = None
         self.cursor = None
+        self._task_listeners = []  # Called with the IDs of tasks that were written
+        self.task_index = None  # taskIndex.TaskIndex, see enable_task_index()
+        self.archive = None  # taskArchive.TaskArchive, see enable_archive()
+        self._task_cache = {}  # (user_id, filter_type, local date, records) -> rows
+        self._task_cache_day = None
+        self.task_cache_hits = 0
+        self.task_cache_misses = 0
+        self.add_task_listener(self._invalidate_task_cache)
+        self._data_version = None  # Last PRAGMA data_version seen, see check_external_changes()
+        self._change_counts = {}
         self._connect()
         self.create_tables()
 
@@ -20,7 +35,6 @@ class DatabaseManager:
             except sqlite3.Error as e:
                 print(f"Database connection error (attempt {i+1}/{retries}): {e}")
                 if i < retries - 1:
-                    import time
                     time.sleep(1) # Wait a bit before retrying
         self.conn = None
         self.cursor = None
@@ -31,45 +45,254 @@ class DatabaseManager:
             self.conn.close()
             print("Database connection closed.")
 
+    def add_task_listener(self, callback):
+        """Register callback(task_ids, user_id) to run after tasks are added, changed or deleted.
+
+        task_ids and user_id are None when the write could have touched any task.
+        """
+        self._task_listeners.append(callback)
+
+    def _notify_tasks_changed(self, task_ids=None, user_id=None):
+        for callback in self._task_listeners:
+            callback(task_ids, user_id)
+
+    def _task_owner(self, task_id):
+        """Return the user_id of a task, or None if it does not exist."""
+        result = self._fetch_one("SELECT user_id FROM tasks WHERE task_id = ?", (task_id,))
+        return result[0] if result else None
+
+    # --- Change detection across connections ---
+    # PRAGMA data_version only changes when another connection commits, so a
+    # poll costs one pragma read while nothing happens. On a change the
+    # per-table write counters in table_changes (kept by triggers, see
+    # _migrate_v5_change_counters) tell which views actually need a refresh,
+    # in one small read however large the tables are.
+    WATCHED_TABLES = ("tasks", "recurring_tasks", "task_category", "priority")
+
+    def check_external_changes(self):
+        """Return the set of WATCHED_TABLES another connection changed since the last check.
+
+        The first call only records the current data_version. Counters are
+        read lazily, so the first change reports every table, and a
+        table is also reported if this connection changed it since then.
+        Caches fed by the tasks table are invalidated before returning.
+        """
+        result = self._fetch_one("PRAGMA data_version")
+        if result is None:
+            return set()
+        version = result[0]
+        if self._data_version is None or version == self._data_version:
+            self._data_version = version
+            return set()
+
+        self._data_version = version
+        changed = set()
+        counters = dict(self._fetch_all("SELECT table_name, change_count FROM table_changes"))
+        for table in self.WATCHED_TABLES:
+            count = counters.get(table)
+            if self._change_counts.get(table) != count:
+                changed.add(table)
+            self._change_counts[table] = count
+
+        if changed & {"tasks", "task_category", "priority"}:
+            self._notify_tasks_changed()
+        return changed
+
+    # --- get_tasks result cache ---
+    # Filter results are cached per (user, filter, Asia/Manila date). Any task
+    # write for a user drops that user's entries; the date in the key makes
+    # entries expire at local midnight, when Today/Next 7 Days/Missed change.
+    def _invalidate_task_cache(self, task_ids, user_id):
+        if user_id is None:
+            self._task_cache.clear()
+        else:
+            for key in [key for key in self._task_cache if key[0] == user_id]:
+                del self._task_cache[key]
+
+    def get_task_cache_stats(self):
+        """Return hit/miss counts, hit rate and the approximate memory held by cached rows."""
+        lookups = self.task_cache_hits + self.task_cache_misses
+        size = sys.getsizeof(self._task_cache)
+        for rows in self._task_cache.values():
+            size += sys.getsizeof(rows)
+            for row in rows:
+                size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+        return {
+            "entries": len(self._task_cache),
+            "hits": self.task_cache_hits,
+            "misses": self.task_cache_misses,
+            "hit_rate": self.task_cache_hits / lookups if lookups else 0.0,
+            "bytes": size,
+        }
+
+    def enable_task_index(self):
+        """Serve get_tasks filters from an in-memory NumPy index; returns False if numpy is missing."""
+        if self.task_index is None:
+            from taskIndex import TaskIndex, np
+            if np is None:
+                print("numpy is not installed; task filters will query SQLite directly.")
+                return False
+            self.task_index = TaskIndex(self)
+        return True
+
+    def enable_archive(self, path=None, horizon_days=90):
+        """Attach the archive database that old Completed/Missed tasks are moved into."""
+        if self.archive is None:
+            from taskArchive import TaskArchive
+            try:
+                self.archive = TaskArchive(self, path, horizon_days)
+            except sqlite3.Error as e:
+                print(f"Could not attach the task archive: {e}")
+                return False
+        return True
+
+    def history_source(self):
+        """Table expression for history views: hot and archived tasks as one UNION."""
+        if self.archive is None:
+            return "tasks"
+        return """(
+            SELECT task_id, task_title, description, priority_id, due_date, user_id, category_id,
+                   created_at, updated_at FROM main.tasks
+            UNION ALL
+            SELECT task_id, task_title, description, priority_id, due_date, user_id, category_id,
+                   created_at, updated_at FROM archive.archived_tasks
+        )"""
+
+    def get_task_history(self, user_id, category_name=None, title_like=None):
+        """All of a user's tasks including archived ones, most recent due date first.
+
+        title_like is a case-insensitive LIKE pattern for the title.
+        """
+        query = f"""
+            SELECT t.task_id, t.task_title, t.description, p.priority_name, t.due_date, tc.category_name
+            FROM {self.history_source()} t
+            JOIN task_category tc ON t.category_id = tc.category_id
+            LEFT JOIN priority p ON t.priority_id = p.priority_id
+            WHERE t.user_id = ?
+        """
+        params = [user_id]
+        if title_like:
+            query += "AND LOWER(t.task_title) LIKE ? "
+            params.append(title_like.lower())
+        if category_name:
+            query += "AND tc.category_name = ? "
+            params.append(category_name)
+        query += "ORDER BY t.due_date DESC, t.task_id DESC"
+        return self._fetch_all(query, params)
+
+    def is_archived(self, task_id):
+        """Whether task_id only exists in the archive; archived tasks are read-only."""
+        if self.archive is None:
+            return False
+        row = self._fetch_one("""
+            SELECT EXISTS (SELECT 1 FROM archive.archived_tasks WHERE task_id = ?)
+               AND NOT EXISTS (SELECT 1 FROM main.tasks WHERE task_id = ?)
+        """, (task_id, task_id))
+        return bool(row and row[0])
+
+    def _trace_sql(self, query):
+        """Span for one statement, named after the DatabaseManager method that issued it."""
+        if not tracer.enabled:
+            return nullcontext()
+        caller = sys._getframe(2).f_code.co_name
+        return tracer.span(caller, "db", sql=" ".join(query.split())[:200])
+
     def _execute_query(self, query, params=()):
         if not self.conn:
             if not self._connect(): # Attempt to reconnect if not connected
                 print("Failed to execute query: Not connected to database.")
                 return False
         try:
-            self.cursor.execute(query, params)
-            self.conn.commit()
+            with self._trace_sql(query):
+                self.cursor.execute(query, params)
+                self.conn.commit()
             return True
         except sqlite3.Error as e:
             print(f"Database query error: {e} for query: {query} with params: {params}")
             self.conn.rollback() # Rollback changes on error
             return False
 
-    def _fetch_all(self, query, params=()):
+    def _fetch_all(self, query, params=(), row_factory=None):
         if not self.conn:
             if not self._connect():
                 return []
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
+            # A row_factory gets its own cursor so the shared one keeps returning tuples
+            cursor = self.cursor if row_factory is None else self.conn.cursor()
+            cursor.row_factory = row_factory
+            with self._trace_sql(query):
+                cursor.execute(query, params)
+                return cursor.fetchall()
         except sqlite3.Error as e:
             print(f"Database fetch error: {e} for query: {query} with params: {params}")
             return []
 
-    def _fetch_one(self, query, params=()):
+    def _fetch_one(self, query, params=(), row_factory=None):
         if not self.conn:
             if not self._connect():
                 return None
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchone()
+            cursor = self.cursor if row_factory is None else self.conn.cursor()
+            cursor.row_factory = row_factory
+            with self._trace_sql(query):
+                cursor.execute(query, params)
+                return cursor.fetchone()
         except sqlite3.Error as e:
             print(f"Database fetch error: {e} for query: {query} with params: {params}")
             return None
 
+    # --- Schema migrations ---
+    # Each entry brings the schema from version N-1 to N. The current version
+    # is stored in PRAGMA user_version, so an up-to-date database only needs
+    # that single pragma read on startup.
+    MIGRATIONS = [
+        (1, "_migrate_v1_base_schema"),
+        (2, "_migrate_v2_task_counters"),
+        (3, "_migrate_v3_maintenance"),
+        (4, "_migrate_v4_import_checkpoints"),
+        (5, "_migrate_v5_change_counters"),
+    ]
+    SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+    def get_schema_version(self):
+        result = self._fetch_one("PRAGMA user_version")
+        return result[0] if result else 0
+
     def create_tables(self):
+        """Create or upgrade the schema by running any pending migrations."""
+        current_version = self.get_schema_version()
+        if current_version >= self.SCHEMA_VERSION:
+            return True
+        return self._run_migrations(current_version)
+
+    def _run_migrations(self, current_version):
+        """Run all migrations newer than current_version in one transaction."""
+        pending = [(version, name) for version, name in self.MIGRATIONS if version > current_version]
+        total_start = time.perf_counter()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            for version, name in pending:
+                start = time.perf_counter()
+                getattr(self, name)(self.cursor)
+                self.cursor.execute(f"PRAGMA user_version = {int(version)}")
+                print(f"Applied schema migration {version} ({name}) in {(time.perf_counter() - start) * 1000:.1f} ms")
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Schema migration failed, database left at version {current_version}: {e}")
+            return False
+        print(f"Database schema upgraded from version {current_version} to {self.SCHEMA_VERSION} "
+              f"in {(time.perf_counter() - total_start) * 1000:.1f} ms")
+        return True
+
+    def _migrate_v1_base_schema(self, cursor):
+        """Base schema: users, categories, priorities, tasks and recurring tasks.
+
+        Every statement is idempotent so databases created before versioning
+        (user_version 0) are upgraded in place.
+        """
         # Create users table
-        self._execute_query("""
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS users (
                 user_id          INTEGER PRIMARY KEY AUTOINCREMENT UNIQUE NOT NULL,
                 username    TEXT    UNIQUE NOT NULL,
@@ -78,7 +301,7 @@ class DatabaseManager:
         """)
 
         # Create task_category table
-        self._execute_query("""
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS task_category (
                 category_id   INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL UNIQUE,
                 category_name TEXT    NOT NULL UNIQUE
@@ -86,7 +309,7 @@ class DatabaseManager:
         """)
 
         # Create priority table
-        self._execute_query("""
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS priority (
                 priority_id   INTEGER PRIMARY KEY AUTOINCREMENT UNIQUE NOT NULL,
                 priority_name TEXT    NOT NULL UNIQUE,
@@ -99,14 +322,13 @@ class DatabaseManager:
             ("Urgent", 1),
             ("Not urgent", 2)
         ]
-        for priority_name, level in default_priorities:
-            self._execute_query(
-                "INSERT OR IGNORE INTO priority (priority_name, priority_level) VALUES (?, ?)",
-                (priority_name, level)
-            )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO priority (priority_name, priority_level) VALUES (?, ?)",
+            default_priorities
+        )
 
         # Create tasks table (STATUS COLUMN REMOVED IN PREVIOUS STEP, REMAINS GONE)
-        self._execute_query("""
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS tasks (
                 task_id     INTEGER PRIMARY KEY AUTOINCREMENT UNIQUE NOT NULL,
                 task_title       TEXT    NOT NULL,
@@ -121,7 +343,7 @@ class DatabaseManager:
         """)
 
         # Create recurring_tasks table (No status column here either)
-        self._execute_query("""
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS recurring_tasks (
                 rtask_id                    INTEGER PRIMARY KEY AUTOINCREMENT,
                 rtask_title                 TEXT    NOT NULL,
@@ -136,18 +358,326 @@ class DatabaseManager:
         """)
         
         # Add a default user if none exists (for testing/initial setup)
-        if not self._fetch_one("SELECT * FROM users WHERE user_id = 1"):
-            self.add_user("default_user", "password123")
+        if not cursor.execute("SELECT 1 FROM users WHERE user_id = 1").fetchone():
+            cursor.execute(
+                "INSERT OR IGNORE INTO users (username, password) VALUES (?, ?)",
+                ("default_user", "password123")
+            )
         
         # Add default categories: "On-going", "Missed", "Completed"
-        default_categories = ["On-going", "Missed", "Completed"]
-        existing_categories = [row[0] for row in self.get_task_categories()]
-        for cat in default_categories:
-            if cat not in existing_categories:
-                self.add_category(cat)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO task_category (category_name) VALUES (?)",
+            [("On-going",), ("Missed",), ("Completed",)]
+        )
         
-        # Update database schema for any missing columns
-        self.update_database_schema()
+        # Add timestamp columns missing from older task tables. SQLite does not
+        # allow ALTER TABLE ... ADD COLUMN with a CURRENT_TIMESTAMP default, so
+        # the columns are added without one and back-filled.
+        column_names = [column[1] for column in cursor.execute("PRAGMA table_info(tasks)").fetchall()]
+        for column in ("created_at", "updated_at"):
+            if column not in column_names:
+                print(f"Adding {column} column to tasks table...")
+                cursor.execute(f"ALTER TABLE tasks ADD COLUMN {column} DATETIME")
+                cursor.execute(f"UPDATE tasks SET {column} = CURRENT_TIMESTAMP WHERE {column} IS NULL")
+
+    def _migrate_v2_task_counters(self, cursor):
+        """Per-user task counts by category and by due date, kept exact by triggers.
+
+        task_counters replaces COUNT/SUM(CASE ...) scans for dashboards and
+        badges; task_day_counters does the same for the calendar. Rows whose
+        count drops to zero are deleted.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS task_counters (
+                user_id     INTEGER NOT NULL,
+                category_id INTEGER NOT NULL,
+                task_count  INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, category_id)
+            ) WITHOUT ROWID;
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS task_day_counters (
+                user_id     INTEGER NOT NULL,
+                due_date    TEXT    NOT NULL,
+                category_id INTEGER NOT NULL,
+                task_count  INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, due_date, category_id)
+            ) WITHOUT ROWID;
+        """)
+
+        # The same statements are used to count a row in (NEW) and out (OLD)
+        add_new = """
+            INSERT INTO task_counters (user_id, category_id, task_count) VALUES (NEW.user_id, NEW.category_id, 1)
+                ON CONFLICT (user_id, category_id) DO UPDATE SET task_count = task_count + 1;
+            INSERT INTO task_day_counters (user_id, due_date, category_id, task_count)
+                SELECT NEW.user_id, NEW.due_date, NEW.category_id, 1 WHERE NEW.due_date IS NOT NULL
+                ON CONFLICT (user_id, due_date, category_id) DO UPDATE SET task_count = task_count + 1;
+        """
+        remove_old = """
+            UPDATE task_counters SET task_count = task_count - 1
+                WHERE user_id = OLD.user_id AND category_id = OLD.category_id;
+            DELETE FROM task_counters
+                WHERE user_id = OLD.user_id AND category_id = OLD.category_id AND task_count <= 0;
+            UPDATE task_day_counters SET task_count = task_count - 1
+                WHERE user_id = OLD.user_id AND due_date = OLD.due_date AND category_id = OLD.category_id;
+            DELETE FROM task_day_counters
+                WHERE user_id = OLD.user_id AND due_date = OLD.due_date AND category_id = OLD.category_id
+                AND task_count <= 0;
+        """
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS tasks_counters_insert AFTER INSERT ON tasks
+            BEGIN {add_new} END;
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS tasks_counters_delete AFTER DELETE ON tasks
+            BEGIN {remove_old} END;
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS tasks_counters_update AFTER UPDATE OF user_id, category_id, due_date ON tasks
+            BEGIN {remove_old} {add_new} END;
+        """)
+        self._rebuild_task_counters(cursor)
+
+    def _migrate_v5_change_counters(self, cursor):
+        """A write counter per WATCHED_TABLES entry, bumped by triggers, for check_external_changes."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS table_changes (
+                table_name   TEXT    PRIMARY KEY NOT NULL,
+                change_count INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+        for table in self.WATCHED_TABLES:
+            cursor.execute("INSERT OR IGNORE INTO table_changes (table_name) VALUES (?)", (table,))
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_changes_{event.lower()} AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE table_changes SET change_count = change_count + 1 WHERE table_name = '{table}';
+                    END
+                """)
+
+    def _rebuild_task_counters(self, cursor):
+        cursor.execute("DELETE FROM task_counters")
+        cursor.execute("DELETE FROM task_day_counters")
+        cursor.execute("""
+            INSERT INTO task_counters (user_id, category_id, task_count)
+            SELECT user_id, category_id, COUNT(*) FROM tasks GROUP BY user_id, category_id
+        """)
+        cursor.execute("""
+            INSERT INTO task_day_counters (user_id, due_date, category_id, task_count)
+            SELECT user_id, due_date, category_id, COUNT(*) FROM tasks
+            WHERE due_date IS NOT NULL GROUP BY user_id, due_date, category_id
+        """)
+
+    def check_task_counters(self, repair=True):
+        """Compare the counter tables with a full scan of tasks; rebuild them if they differ.
+
+        Returns True if the counters were already consistent.
+        """
+        expected = set(self._fetch_all(
+            "SELECT user_id, category_id, COUNT(*) FROM tasks GROUP BY user_id, category_id"))
+        actual = set(self._fetch_all("SELECT user_id, category_id, task_count FROM task_counters"))
+        expected_days = set(self._fetch_all(
+            "SELECT user_id, due_date, category_id, COUNT(*) FROM tasks "
+            "WHERE due_date IS NOT NULL GROUP BY user_id, due_date, category_id"))
+        actual_days = set(self._fetch_all(
+            "SELECT user_id, due_date, category_id, task_count FROM task_day_counters"))
+        if expected == actual and expected_days == actual_days:
+            return True
+
+        print(f"Task counters out of sync ({len(expected ^ actual)} category rows, "
+              f"{len(expected_days ^ actual_days)} day rows differ)")
+        if repair:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self._rebuild_task_counters(self.cursor)
+                self.conn.commit()
+                print("Task counters rebuilt.")
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                print(f"Error rebuilding task counters: {e}")
+        return False
+
+    def get_category_counts(self, user_id):
+        """Return {category_name: number of tasks} for a user from the counter table."""
+        rows = self._fetch_all("""
+            SELECT tc.category_name, c.task_count
+            FROM task_counters c
+            JOIN task_category tc ON c.category_id = tc.category_id
+            WHERE c.user_id = ?
+        """, (user_id,))
+        return dict(rows)
+
+    def get_day_counts(self, user_id, start_date=None, end_date=None, category_name=None):
+        """Return {'YYYY-MM-DD': number of tasks due} for a user, optionally limited to a range/category."""
+        query = """
+            SELECT d.due_date, SUM(d.task_count)
+            FROM task_day_counters d
+            JOIN task_category tc ON d.category_id = tc.category_id
+            WHERE d.user_id = ?
+        """
+        params = [user_id]
+        if start_date:
+            query += " AND d.due_date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND d.due_date <= ?"
+            params.append(end_date)
+        if category_name:
+            query += " AND tc.category_name = ?"
+            params.append(category_name)
+        query += " GROUP BY d.due_date"
+        return dict(self._fetch_all(query, params))
+
+    def get_filter_counts(self, user_id):
+        """Return the number of tasks each get_tasks filter would show, read from the counters."""
+        today = self._get_current_local_date()
+        today_str = self._format_date(today)
+        week_str = self._format_date(today + timedelta(days=7))
+        categories = self.get_category_counts(user_id)
+        ongoing_days = self.get_day_counts(user_id, category_name="On-going")
+        past_due = sum(count for day, count in ongoing_days.items() if day < today_str)
+        return {
+            "Today": ongoing_days.get(today_str, 0),
+            "Next 7 Days": sum(count for day, count in ongoing_days.items() if today_str <= day <= week_str),
+            "All Tasks": sum(categories.values()),
+            "On-going": categories.get("On-going", 0) - past_due,  # Past-due ones are hidden there
+            "Completed": categories.get("Completed", 0),
+            "Missed": categories.get("Missed", 0),
+        }
+
+    # --- Maintenance ---
+    # run_maintenance_step() does one short job per call. The app only calls
+    # it while the user is idle (see TimePlanApp._maintenance_tick), so a
+    # long step never delays input. The one-time rebuild for incremental
+    # auto_vacuum rewrites the whole file under an exclusive lock, so it is
+    # not a step at all: see convert_to_incremental_vacuum.
+    OPTIMIZE_INTERVAL_HOURS = 6
+    ANALYZE_INTERVAL_HOURS = 24 * 7
+    AUTO_VACUUM_RETRY_HOURS = 24  # After a failed conversion, e.g. SQLITE_BUSY
+    VACUUM_STEP_PAGES = 128  # Pages released per incremental_vacuum step
+
+    def _migrate_v3_maintenance(self, cursor):
+        """When each maintenance job last ran."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS maintenance (
+                name     TEXT PRIMARY KEY NOT NULL,
+                last_run REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+    def _migrate_v4_import_checkpoints(self, cursor):
+        """Resume points for taskImport, and the index its duplicate check looks up."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS import_checkpoints (
+                source       TEXT    NOT NULL,
+                user_id      INTEGER NOT NULL,
+                fingerprint  TEXT    NOT NULL,
+                records_done INTEGER NOT NULL DEFAULT 0,
+                imported     INTEGER NOT NULL DEFAULT 0,
+                duplicates   INTEGER NOT NULL DEFAULT 0,
+                rejected     INTEGER NOT NULL DEFAULT 0,
+                finished     INTEGER NOT NULL DEFAULT 0,
+                updated_at   REAL,
+                PRIMARY KEY (source, user_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS tasks_user_title ON tasks (user_id, task_title, due_date)")
+
+    def _maintenance_due(self, name, interval_hours):
+        row = self._fetch_one("SELECT last_run FROM maintenance WHERE name = ?", (name,))
+        return row is None or time.time() - row[0] >= interval_hours * 3600
+
+    def _record_maintenance(self, name):
+        self._execute_query("""
+            INSERT INTO maintenance (name, last_run) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET last_run = excluded.last_run
+        """, (name, time.time()))
+
+    def _maintenance_schemas(self):
+        return ["main", "archive"] if self.archive is not None else ["main"]
+
+    def _freelist_count(self, schema):
+        row = self._fetch_one(f"PRAGMA {schema}.freelist_count")
+        return row[0] if row else 0  # _fetch_one returns None on errors such as SQLITE_BUSY
+
+    def _auto_vacuum_mode(self, schema):
+        # The pragma answers from the header cached at the last read, which is stale
+        # after another connection's VACUUM; any read of the schema refreshes it
+        self._fetch_one(f"SELECT 1 FROM {schema}.sqlite_master LIMIT 1")
+        row = self._fetch_one(f"PRAGMA {schema}.auto_vacuum")
+        return row[0] if row else None
+
+    def needs_auto_vacuum_conversion(self):
+        """Whether the file still has to be rebuilt for incremental auto_vacuum and no attempt is recent."""
+        if not self.conn or self.db_name == ":memory:":
+            return False
+        return (self._auto_vacuum_mode("main") not in (2, None)
+                and self._maintenance_due("auto_vacuum", self.AUTO_VACUUM_RETRY_HOURS))
+
+    def convert_to_incremental_vacuum(self):
+        """Switch the file to incremental auto_vacuum with a full VACUUM; returns True on success.
+
+        auto_vacuum can only be turned on for an existing file by rebuilding
+        it, which holds an exclusive lock for the whole rebuild. Callers run
+        it before anything else uses the database (TimePlanApp does it at
+        startup, before the first page loads). The attempt is recorded
+        first, so a failure is retried after AUTO_VACUUM_RETRY_HOURS rather
+        than on every start.
+        """
+        self._record_maintenance("auto_vacuum")
+        start = time.perf_counter()
+        pages_before = self._fetch_one("PRAGMA page_count")[0]
+        try:
+            self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self.conn.execute("VACUUM main")
+        except sqlite3.Error as e:
+            print(f"Maintenance (enable incremental auto_vacuum) failed: {e}")
+            return False
+        reclaimed = pages_before - self._fetch_one("PRAGMA page_count")[0]
+        print(f"Maintenance: enable incremental auto_vacuum took {(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"{reclaimed} pages reclaimed")
+        return True
+
+    def run_maintenance_step(self):
+        """Run the next maintenance job that is due; returns its name, or None if nothing was due.
+
+        Jobs in order: PRAGMA optimize, ANALYZE, and incremental_vacuum of
+        VACUUM_STEP_PAGES free pages per call (only once the file uses
+        incremental auto_vacuum, see convert_to_incremental_vacuum).
+        """
+        if not self.conn:
+            return None
+        self.conn.commit()  # The vacuum pragmas cannot run inside a transaction
+        start = time.perf_counter()
+        job = None
+        reclaimed = 0
+        try:
+            if self._maintenance_due("optimize", self.OPTIMIZE_INTERVAL_HOURS):
+                job = "optimize"
+                self.conn.execute("PRAGMA optimize")
+                self._record_maintenance(job)
+            elif self._maintenance_due("analyze", self.ANALYZE_INTERVAL_HOURS):
+                job = "analyze"
+                self.conn.execute("ANALYZE")
+                self._record_maintenance(job)
+            else:
+                for schema in self._maintenance_schemas():
+                    free = self._freelist_count(schema)
+                    if free and self._auto_vacuum_mode(schema) == 2:
+                        job = f"incremental_vacuum {schema}"
+                        # The pragma frees one page per step; execute() would stop after the first
+                        # one, executescript() runs it to completion
+                        self.conn.executescript(f"PRAGMA {schema}.incremental_vacuum({self.VACUUM_STEP_PAGES});")
+                        reclaimed = free - self._freelist_count(schema)
+                        break
+        except sqlite3.Error as e:
+            print(f"Maintenance ({job}) failed: {e}")
+            return None
+        if job is not None:
+            print(f"Maintenance: {job} took {(time.perf_counter() - start) * 1000:.1f} ms, "
+                  f"{reclaimed} pages reclaimed")
+        return job
 
 
     # --- CRUD operations for Tasks ---
@@ -174,10 +704,33 @@ class DatabaseManager:
         if success:
             # Get the ID of the last inserted row
             last_id = self._fetch_one("SELECT last_insert_rowid()")
-            return last_id[0] if last_id else None
+            if last_id:
+                self._notify_tasks_changed([last_id[0]], user_id)
+                return last_id[0]
         return None
         
-    def get_tasks(self, user_id, filter_type='All Tasks'):
+    def get_tasks(self, user_id, filter_type='All Tasks', records=False):
+        """Return the tasks for filter_type as tuples, or as taskRecords.Task objects if records is set."""
+        philippines_timezone = pytz.timezone('Asia/Manila')
+        current_local_date = datetime.now(philippines_timezone)
+        current_local_date_str = current_local_date.strftime('%Y-%m-%d')
+
+        if self._task_cache_day != current_local_date_str:
+            # Local midnight passed: every cached result is for the wrong day
+            self._task_cache.clear()
+            self._task_cache_day = current_local_date_str
+        key = (user_id, filter_type, current_local_date_str, records)
+        rows = self._task_cache.get(key)
+        if rows is not None:
+            self.task_cache_hits += 1
+            return list(rows)
+
+        self.task_cache_misses += 1
+        rows = self._query_tasks(user_id, filter_type, current_local_date, Task.from_row if records else None)
+        self._task_cache[key] = rows
+        return list(rows)
+
+    def _query_tasks(self, user_id, filter_type, current_local_date, row_factory=None):
         query = """
             SELECT t.task_id, t.task_title, t.description, p.priority_name, t.due_date, tc.category_name
             FROM tasks t 
@@ -186,10 +739,17 @@ class DatabaseManager:
         """ \
                 "WHERE t.user_id = ? "
         params = [user_id]
-        
-        philippines_timezone = pytz.timezone('Asia/Manila')
-        current_local_date = datetime.now(philippines_timezone)
         current_local_date_str = current_local_date.strftime('%Y-%m-%d')
+
+        if self.task_index is not None:
+            # Filter and sort in memory; only the matching rows are read from SQLite
+            task_ids = self.task_index.filter(user_id, filter_type, current_local_date.date())
+            if len(task_ids) > 900 and len(task_ids) * 2 > self.task_index.count(user_id):
+                # Most of the user's tasks match: one scan beats several IN (...) lookups
+                rows = {row[0]: row for row in self._fetch_all(query, params, row_factory)}
+            else:
+                rows = {row[0]: row for row in self.get_tasks_by_ids(task_ids, row_factory)}
+            return [rows[task_id] for task_id in task_ids if task_id in rows]
         
         # Get the IDs of important categories
         completed_cat_id_row = self._fetch_one("SELECT category_id FROM task_category WHERE category_name = ?", ("Completed",))
@@ -242,13 +802,14 @@ class DatabaseManager:
             # For completed/missed tasks, sort by date (could be oldest first or newest first)
             query += "ORDER BY t.due_date DESC" # Most recently completed/missed first
         
-        return self._fetch_all(query, params)
+        return self._fetch_all(query, params, row_factory)
 
-    def get_task_by_id(self, task_id):
+    def get_task_by_id(self, task_id, records=False):
         """Get a specific task by its ID.
         
         Args:
             task_id: The ID of the task to retrieve
+            records: Return a taskRecords.Task instead of a tuple
             
         Returns:
             A tuple containing (task_id, title, description, priority, due_date, category_name)
@@ -256,12 +817,38 @@ class DatabaseManager:
         """
         query = """
             SELECT t.task_id, t.task_title, t.description, p.priority_name, t.due_date, tc.category_name 
-            FROM tasks t 
+            FROM {source} t 
             JOIN task_category tc ON t.category_id = tc.category_id 
             LEFT JOIN priority p ON t.priority_id = p.priority_id
             WHERE t.task_id = ?
         """
-        return self._fetch_one(query, (task_id,))
+        row_factory = Task.from_row if records else None
+        task = self._fetch_one(query.format(source="tasks"), (task_id,), row_factory)
+        if task is None and self.archive is not None:
+            # Archived tasks can still be opened from history views
+            task = self._fetch_one(query.format(source="archive.archived_tasks"), (task_id,), row_factory)
+        return task
+
+    def get_tasks_by_ids(self, task_ids, row_factory=None):
+        """Get several tasks in one query (per 900 IDs).
+
+        Returns rows in the same format as get_task_by_id, in no particular order.
+        """
+        rows = []
+        task_ids = list(task_ids)
+        # Stay under SQLite's default limit of 999 bound parameters per statement
+        for start in range(0, len(task_ids), 900):
+            chunk = task_ids[start:start + 900]
+            placeholders = ", ".join("?" for _ in chunk)
+            query = f"""
+                SELECT t.task_id, t.task_title, t.description, p.priority_name, t.due_date, tc.category_name
+                FROM tasks t
+                JOIN task_category tc ON t.category_id = tc.category_id
+                LEFT JOIN priority p ON t.priority_id = p.priority_id
+                WHERE t.task_id IN ({placeholders})
+            """
+            rows.extend(self._fetch_all(query, tuple(chunk), row_factory))
+        return rows
 
     def update_task_details(self, task_id, task_title=None, description=None, priority=None, due_date=None, category_id=None):
         updates = []
@@ -290,16 +877,27 @@ class DatabaseManager:
 
         query = f"UPDATE tasks SET {', '.join(updates)} WHERE task_id = ?"
         params.append(task_id)
-        return self._execute_query(query, tuple(params))
+        # rowcount is 0 for IDs that are not in tasks, e.g. archived ones
+        success = self._execute_query(query, tuple(params)) and self.cursor.rowcount > 0
+        if success:
+            self._notify_tasks_changed([task_id], self._task_owner(task_id))
+        return success
 
     # New method to update a task's category (for "completing" or "uncompleting" tasks)
     def update_task_category(self, task_id, new_category_id):
         query = "UPDATE tasks SET category_id = ? WHERE task_id = ?"
-        return self._execute_query(query, (new_category_id, task_id))
+        success = self._execute_query(query, (new_category_id, task_id)) and self.cursor.rowcount > 0
+        if success:
+            self._notify_tasks_changed([task_id], self._task_owner(task_id))
+        return success
 
     def delete_task(self, task_id):
+        owner = self._task_owner(task_id)  # Looked up first; the row is gone afterwards
         query = "DELETE FROM tasks WHERE task_id = ?"
-        return self._execute_query(query, (task_id,))
+        success = self._execute_query(query, (task_id,)) and self.cursor.rowcount > 0
+        if success:
+            self._notify_tasks_changed([task_id], owner)
+        return success
 
     # --- CRUD operations for Task Categories ---
     def get_task_categories(self):
@@ -347,7 +945,12 @@ class DatabaseManager:
                 updated_at = CURRENT_TIMESTAMP
             WHERE task_id = ?
         """
-        return self._execute_query(query, (task_title, description, priority_id, formatted_date, category_id, task_id))
+        success = self._execute_query(
+            query, (task_title, description, priority_id, formatted_date, category_id, task_id)
+        ) and self.cursor.rowcount > 0
+        if success:
+            self._notify_tasks_changed([task_id], self._task_owner(task_id))
+        return success
 
     # --- Priority Management Methods ---
     def get_priority_id_by_name(self, priority_name):
@@ -377,12 +980,14 @@ class DatabaseManager:
         ph_tz = self._get_ph_timezone()
         return datetime.now(ph_tz).date()
     
+    DATE_FORMAT = '%Y-%m-%d'  # How dates are stored; taskImport validates against it too
+
     def _parse_date(self, date_str):
         """Convert string date to datetime.date object"""
         if not date_str:
             return None
         try:
-            return datetime.strptime(date_str, '%Y-%m-%d').date()
+            return datetime.strptime(date_str, self.DATE_FORMAT).date()
         except ValueError:
             print(f"Invalid date format: {date_str}. Expected format: YYYY-MM-DD")
             return None
@@ -422,18 +1027,24 @@ class DatabaseManager:
             AND due_date IS NOT NULL
         """
         
-        return self._execute_query(query, (missed_category_id, ongoing_category_id, current_local_date))
+        success = self._execute_query(query, (missed_category_id, ongoing_category_id, current_local_date))
+        if success:
+            self._notify_tasks_changed()
+        return success
 
     # --- Recurring Tasks Management ---
-    def get_recurring_tasks(self, user_id):
-        """Get all recurring tasks for a user and calculate their current status."""
+    def get_recurring_tasks(self, user_id, records=False):
+        """Get all recurring tasks for a user and calculate their current status.
+
+        With records set the rows are taskRecords.RecurringTask objects instead of tuples.
+        """
         query = """
             SELECT rtask_id, rtask_title, description, start_date, recurrence_pattern, last_completed_date, status
             FROM recurring_tasks
             WHERE user_id = ?
             ORDER BY start_date
         """
-        tasks = self._fetch_all(query, (user_id,))
+        tasks = self._fetch_all(query, (user_id,), RecurringTask.from_row if records else None)
         
         # Update the status of each task based on its recurrence pattern and last completed date
         updated_tasks = []
@@ -451,6 +1062,10 @@ class DatabaseManager:
                 )
             
             # Include the updated status in the result
+            if records:
+                task.status = correct_status
+                updated_tasks.append(task)
+                continue
             updated_task = (rtask_id, rtask_title, description, start_date, recurrence_pattern, last_completed_date, correct_status)
             updated_tasks.append(updated_task)
             
@@ -527,40 +1142,6 @@ class DatabaseManager:
         search_pattern = f"%{search_term}%"
         return self._fetch_all(query, (user_id, search_pattern, search_pattern))
 
-    def update_database_schema(self):
-        """Update database schema to add missing columns."""
-        # Check if updated_at column exists in tasks table
-        table_info = self._fetch_all("PRAGMA table_info(tasks)")
-        column_names = [column[1] for column in table_info]
-        
-        if 'updated_at' not in column_names:
-            print("Adding updated_at column to tasks table...")
-            # Add updated_at column
-            alter_query = """
-                ALTER TABLE tasks 
-                ADD COLUMN updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            """
-            if self._execute_query(alter_query):
-                print("Successfully added updated_at column to tasks table.")
-            else:
-                print("Failed to add updated_at column to tasks table.")
-        else:
-            print("updated_at column already exists in tasks table.")
-        
-        if 'created_at' not in column_names:
-            print("Adding created_at column to tasks table...")
-            # Add created_at column
-            alter_query = """
-                ALTER TABLE tasks 
-                ADD COLUMN created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            """
-            if self._execute_query(alter_query):
-                print("Successfully added created_at column to tasks table.")
-            else:
-                print("Failed to add created_at column to tasks table.")
-        else:
-            print("created_at column already exists in tasks table.")
-
     def is_recurring_task(self, task_id):
         """Check if a task is marked as recurring by checking if it exists in the recurring_tasks table."""
         query = """
@@ -569,6 +1150,10 @@ class DatabaseManager:
         result = self._fetch_one(query, (task_id,))
         return result[0] > 0 if result else False
 
+    def get_recurring_task_ids(self):
+        """Return the set of IDs that is_recurring_task would report as recurring, in one query."""
+        return {row[0] for row in self._fetch_all("SELECT rtask_id FROM recurring_tasks")}
+
     def _calculate_recurring_task_status(self, recurrence_pattern, last_completed_date):
         """
         Calculate the current status of a recurring task based on its recurrence pattern and last completion date.
@@ -0,0 +1,295 @@
+"""Online backups of the TimePlan database.
+
+Usage: python dbBackup.py {backup,list,verify,restore} [options]
+
+Snapshots are taken with sqlite3's online backup API a few hundred pages
+at a time, so the app can keep reading and writing while a backup runs.
+"""
+import argparse
+import glob
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+
+class BackupBusy(Exception):
+    """Concurrent writes kept restarting the backup; try again when the database is quieter."""
+
+
+class BackupManager:
+    """Takes, rotates, verifies and restores snapshots of one SQLite database.
+
+    Each snapshot is copied PAGES_PER_STEP pages per step with a short pause
+    between steps, so the source is only locked for the duration of one step
+    and writers in the app are never blocked for long. A snapshot is written
+    to a .tmp file, checked with PRAGMA integrity_check and only then renamed
+    into place next to a .sha256 file holding its checksum.
+
+    SQLite restarts a stepped backup whenever another connection writes to
+    the source. After MAX_RESTARTS the attempt is given up with BackupBusy
+    rather than redone in one step, which would hold the read lock for the
+    whole copy and block (or, in WAL mode, grow the log of) the app's
+    writes. Background backups then wait RETRY_DELAY seconds, doubling per
+    failure up to MAX_RETRY_DELAY, before is_due reports them due again.
+
+    When the task archive file (see taskArchive) exists it is snapshotted
+    too, as prefix-..._archive.db next to the main snapshot, and verified,
+    rotated and restored together with it. The main file is copied first:
+    an archive batch that lands between the two copies then shows up in
+    both snapshots, which TaskArchive._recover cleans up, instead of in
+    neither.
+    """
+
+    PAGES_PER_STEP = 256
+    STEP_PAUSE = 0.005  # Seconds between steps, lets writers in between
+    MAX_RESTARTS = 5
+    RETRY_DELAY = 60
+    MAX_RETRY_DELAY = 3600
+
+    ARCHIVE_SUFFIX = "_archive"
+
+    def __init__(self, db_name='timePlanDB.db', backup_dir='backups', keep=7, archive_path=None):
+        self.db_name = db_name
+        # Same default location as TaskArchive uses
+        self.archive_path = archive_path or os.path.splitext(db_name)[0] + self.ARCHIVE_SUFFIX + ".db"
+        self.backup_dir = backup_dir
+        self.keep = keep
+        self.prefix = os.path.splitext(os.path.basename(db_name))[0]
+        self._thread = None
+        self.last_error = None
+        self._busy_failures = 0
+        self._retry_at = 0
+
+    # --- Snapshots ---
+
+    def backup(self, progress=None, rotate=True):
+        """Write a new snapshot and return its path; progress(copied, total) is called per step."""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        stamp = time.time()
+        path = self._snapshot_path(stamp)
+        while os.path.exists(path):  # Never overwrite a snapshot, e.g. the one being restored
+            stamp += 0.001
+            path = self._snapshot_path(stamp)
+        start = time.perf_counter()
+        copies = [(self._copy(self.db_name, path, progress), path)]
+        try:
+            if os.path.exists(self.archive_path):
+                archive = self._archive_snapshot(path)
+                copies.insert(0, (self._copy(self.archive_path, archive, progress), archive))
+        except (BackupBusy, sqlite3.Error, OSError):
+            os.remove(copies[-1][0])
+            raise
+        # The main snapshot goes last, so list_backups never lists one without its archive
+        for tmp_path, target in copies:
+            self._publish(tmp_path, target)
+        print(f"Backed up {self.db_name} to {path} in {time.perf_counter() - start:.2f} s")
+        if rotate:
+            self.rotate()
+        return path
+
+    def _copy(self, source_path, path, progress=None):
+        """Copy one database file to path + ".tmp" in steps and check it; returns the .tmp path."""
+        tmp_path = path + ".tmp"
+        restarts = 0
+        last_remaining = None
+
+        def step(status, remaining, total):
+            nonlocal restarts, last_remaining
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts >= self.MAX_RESTARTS:
+                    raise BackupBusy(f"{source_path} was written to during {restarts} backup attempts")
+            last_remaining = remaining
+            if progress:
+                progress(total - remaining, total)
+            time.sleep(self.STEP_PAUSE)
+
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(tmp_path)
+        try:
+            try:
+                source.backup(target, pages=self.PAGES_PER_STEP, progress=step)
+                result = target.execute("PRAGMA integrity_check").fetchone()[0]
+            finally:
+                target.close()
+                source.close()
+        except BackupBusy:
+            os.remove(tmp_path)
+            raise
+        if result != "ok":
+            os.remove(tmp_path)
+            raise sqlite3.DatabaseError(f"Backup failed integrity check: {result}")
+        return tmp_path
+
+    def _publish(self, tmp_path, path):
+        os.replace(tmp_path, path)
+        with open(path + ".sha256", "w") as f:
+            f.write(f"{self._checksum(path)}  {os.path.basename(path)}\n")
+
+    def _snapshot_path(self, stamp):
+        # Names sort in creation order: prefix-YYYYmmdd-HHMMSS-mmm.db
+        name = time.strftime(f"{self.prefix}-%Y%m%d-%H%M%S", time.localtime(stamp))
+        return os.path.join(self.backup_dir, f"{name}-{int(stamp * 1000) % 1000:03d}.db")
+
+    def _archive_snapshot(self, path):
+        return os.path.splitext(path)[0] + self.ARCHIVE_SUFFIX + ".db"
+
+    def start_background(self, progress=None, on_done=None):
+        """Run backup() on a worker thread; on_done(path or None) is called from that thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return False
+
+        def run():
+            path = None
+            try:
+                path = self.backup(progress)
+                self._busy_failures = 0
+            except BackupBusy as e:
+                self.last_error = e
+                self._busy_failures += 1
+                delay = min(self.RETRY_DELAY * 2 ** (self._busy_failures - 1), self.MAX_RETRY_DELAY)
+                self._retry_at = time.time() + delay
+                print(f"Background backup postponed, {e}; retrying in {delay} s")
+            except (sqlite3.Error, OSError) as e:
+                self.last_error = e
+                print(f"Background backup failed: {e}")
+            if on_done:
+                on_done(path)
+
+        self._thread = threading.Thread(target=run, name="db-backup", daemon=True)
+        self._thread.start()
+        return True
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def list_backups(self):
+        """Return snapshot paths of the main database, oldest first."""
+        paths = glob.glob(os.path.join(self.backup_dir, f"{self.prefix}-*.db"))
+        return sorted(path for path in paths if not path.endswith(self.ARCHIVE_SUFFIX + ".db"))
+
+    def is_due(self, interval_hours):
+        """Whether the newest snapshot is older than interval_hours (or there is none).
+
+        Stays False while a busy backup is waiting out its retry delay.
+        """
+        if time.time() < self._retry_at:
+            return False
+        backups = self.list_backups()
+        if not backups:
+            return True
+        return time.time() - os.path.getmtime(backups[-1]) >= interval_hours * 3600
+
+    def rotate(self):
+        """Delete all but the newest `keep` snapshots."""
+        backups = self.list_backups()
+        for path in backups[:max(len(backups) - self.keep, 0)]:
+            archive = self._archive_snapshot(path)
+            for stale in (path, path + ".sha256", archive, archive + ".sha256"):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            print(f"Removed old backup {path}")
+
+    # --- Verification and restore ---
+
+    @staticmethod
+    def _checksum(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def verify(self, path):
+        """Check a snapshot (and its archive snapshot, if any) against its .sha256 file and SQLite's integrity check."""
+        archive = self._archive_snapshot(path)
+        if os.path.exists(archive) and not self._verify_file(archive):
+            return False
+        return self._verify_file(path)
+
+    def _verify_file(self, path):
+        try:
+            with open(path + ".sha256") as f:
+                expected = f.read().split()[0]
+        except (OSError, IndexError):
+            print(f"No checksum found for {path}")
+            return False
+        if self._checksum(path) != expected:
+            print(f"Checksum mismatch for {path}")
+            return False
+        conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+        try:
+            result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        finally:
+            conn.close()
+        if result != "ok":
+            print(f"Integrity check failed for {path}: {result}")
+            return False
+        return True
+
+    def restore(self, path):
+        """Replace the database contents with a verified snapshot.
+
+        The current database is backed up first, and the snapshot is copied
+        in through the backup API rather than over the file, so connections
+        that are still open see the restored data instead of a torn file.
+        The archive file is restored from the archive snapshot taken with
+        it; snapshots from before archiving was enabled have none and leave
+        the archive as it is.
+        """
+        if not self.verify(path):
+            raise ValueError(f"Refusing to restore unverified backup: {path}")
+        self.backup(rotate=False)  # Rotating here could delete the snapshot being restored
+        archive = self._archive_snapshot(path)
+        if os.path.exists(archive):
+            self._restore_file(archive, self.archive_path)
+            print(f"Restored {self.archive_path} from {archive}")
+        self._restore_file(path, self.db_name)
+        print(f"Restored {self.db_name} from {path}")
+
+    def _restore_file(self, snapshot, target_path):
+        source = sqlite3.connect(f"file:{os.path.abspath(snapshot)}?mode=ro", uri=True)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target, pages=self.PAGES_PER_STEP)
+        finally:
+            target.close()
+            source.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TimePlan database backups")
+    parser.add_argument("command", choices=["backup", "list", "verify", "restore"])
+    parser.add_argument("path", nargs="?", help="snapshot to verify or restore (verify defaults to all)")
+    parser.add_argument("--db", default="timePlanDB.db", help="database file")
+    parser.add_argument("--dir", default="backups", help="backup directory")
+    parser.add_argument("--keep", type=int, default=7, help="number of snapshots to keep")
+    args = parser.parse_args()
+
+    manager = BackupManager(args.db, args.dir, args.keep)
+    if args.command == "backup":
+        try:
+            manager.backup(progress=lambda copied, total: print(f"{copied}/{total} pages", end="\r", flush=True))
+        except BackupBusy as e:
+            print(f"Backup gave up: {e}; try again later")
+            raise SystemExit(1)
+    elif args.command == "list":
+        for path in manager.list_backups():
+            archive = manager._archive_snapshot(path)
+            extra = f" + archive {os.path.getsize(archive) / 1024:.0f} KiB" if os.path.exists(archive) else ""
+            print(f"{path}  {os.path.getsize(path) / 1024:.0f} KiB{extra}")
+    elif args.command == "verify":
+        paths = [args.path] if args.path else manager.list_backups()
+        failed = [path for path in paths if not manager.verify(path)]
+        print(f"{len(paths) - len(failed)}/{len(paths)} backups verified")
+        raise SystemExit(1 if failed else 0)
+    elif args.command == "restore":
+        if not args.path:
+            parser.error("restore needs the path of a snapshot")
+        manager.restore(args.path)
+
+
+if __name__ == "__main__":
+    main()
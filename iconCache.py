@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+
+
+def prepare_icon(path, size):
+    """Open the image at path, center-crop it to a square and resize it to size."""
+    from PIL import Image
+
+    img = Image.open(path)
+    w, h = img.size
+    side = min(w, h)
+    left = (w - side) // 2
+    top = (h - side) // 2
+    return img.crop((left, top, left + side, top + side)).resize(size, Image.LANCZOS)
+
+
+class IconCache:
+    """On-disk cache of icons that are already cropped and resized.
+
+    Cached files are content-addressed: the name is the SHA-1 of the source
+    PNG plus the target size, so a changed icon gets a new cache entry. An
+    index keyed by source path remembers each file's mtime and size, so the
+    source is only re-hashed when it changes on disk.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILE)
+        self.index = self._load_index()
+        self._index_dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _source_digest(self, path):
+        """Return the SHA-1 of path, re-hashing only if its mtime or size changed."""
+        st = os.stat(path)
+        entry = self.index.get(path)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return entry["sha1"]
+
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self.index[path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha1": digest}
+        self._index_dirty = True
+        return digest
+
+    def load(self, path, size):
+        """Return the processed PIL image for path at size, using the cache when possible."""
+        from PIL import Image
+
+        digest = self._source_digest(path)
+        cached_path = os.path.join(self.cache_dir, f"{digest}_{size[0]}x{size[1]}.png")
+        if os.path.exists(cached_path):
+            try:
+                img = Image.open(cached_path)
+                img.load()
+                self.hits += 1
+                return img
+            except OSError:
+                pass  # Corrupt entry, rebuild it below
+
+        self.misses += 1
+        img = prepare_icon(path, size)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            img.save(cached_path, format="PNG", optimize=True)
+        except OSError as e:
+            print(f"Warning: Could not write icon cache entry {cached_path}: {e}")
+        return img
+
+    def save_index(self):
+        """Write the source index back to disk if it changed and drop stale entries."""
+        if not self._index_dirty:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump(self.index, f)
+            self._index_dirty = False
+
+            # Remove processed icons whose source file has since changed
+            live_digests = {entry["sha1"] for entry in self.index.values()}
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".png") and name.split("_", 1)[0] not in live_digests:
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError as e:
+            print(f"Warning: Could not write icon cache index: {e}")
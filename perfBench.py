@@ -0,0 +1,249 @@
+"""Offline benchmarks for TimePlan rendering and data paths.
+
+Usage: python perfBench.py <benchmark> [options]
+
+The UI benchmarks need a display (they create a hidden Tk root).
+"""
+import argparse
+import gc
+import time
+import tkinter.font as tkfont
+import tracemalloc
+
+
+def _measure(label, func):
+    """Run func once under tracemalloc and print its time and memory use."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms   peak {peak / 1024:9.1f} KiB")
+    return elapsed, peak, result
+
+
+def bench_styles(args):
+    """Build a task page with fresh CTkFonts per label versus the shared StyleRegistry."""
+    import customtkinter as ctk
+    from styleRegistry import StyleRegistry
+
+    root = ctk.CTk()
+    root.withdraw()
+
+    def build_page(font_factory):
+        page = ctk.CTkFrame(root)
+        for i in range(args.tasks):
+            card = ctk.CTkFrame(page)
+            ctk.CTkLabel(card, text=f"Task {i}", font=font_factory(size=18, weight="bold"))
+            ctk.CTkLabel(card, text="Not urgent", font=font_factory(size=14))
+            ctk.CTkLabel(card, text="Description", font=font_factory(size=14))
+            ctk.CTkLabel(card, text="On-going", font=font_factory(size=12, weight="bold"))
+            ctk.CTkLabel(card, text="Due: Today", font=font_factory(size=12))
+        root.update_idletasks()
+        return page
+
+    print(f"Rendering {args.tasks} task cards")
+    fonts_before = len(tkfont.names(root))
+    fresh_time, fresh_peak, page = _measure("fresh CTkFont per label", lambda: build_page(ctk.CTkFont))
+    fresh_fonts = len(tkfont.names(root)) - fonts_before
+    page.destroy()
+
+    styles = StyleRegistry()
+    fonts_before = len(tkfont.names(root))
+    shared_time, shared_peak, page = _measure("shared StyleRegistry fonts", lambda: build_page(styles.font))
+    shared_fonts = len(tkfont.names(root)) - fonts_before
+    page.destroy()
+
+    print(f"Tk fonts created: {fresh_fonts} fresh vs {shared_fonts} shared")
+    print(f"Saved {(fresh_time - shared_time) * 1000:.1f} ms and {(fresh_peak - shared_peak) / 1024:.1f} KiB")
+    root.destroy()
+
+
+def bench_dialogs(args):
+    """Open each add/edit dialog repeatedly; the first open builds it, later opens reuse it."""
+    import os
+    import tempfile
+    from test1 import TimePlanApp
+
+    # Work on a throwaway database so the benchmark never touches timePlanDB.db
+    os.chdir(tempfile.mkdtemp(prefix="timeplan_bench_"))
+    app = TimePlanApp()
+    app.withdraw()
+    app.update()  # Runs the deferred startup stage that opens the database
+    task_id = app.db_manager.add_task(app.current_user_id, "Benchmark task", None, "Urgent", None, app.on_going_category_id)
+    rtask_id = app.db_manager.add_recurring_task(app.current_user_id, "Benchmark habit", None, None, "daily")
+    app.show_task_detail(task_id)
+
+    openers = {
+        "add_task": (app.show_add_task_dialog, lambda: app.add_task_fields["dialog"]),
+        "edit_task": (lambda: app.show_edit_task_form(task_id), None),
+        "add_habit": (app.show_add_recurring_task_dialog, lambda: app.add_habit_fields["dialog"]),
+        "edit_habit": (lambda: app.show_edit_recurring_task_dialog(rtask_id), lambda: app.edit_habit_fields["dialog"]),
+    }
+    for opener, get_dialog in openers.values():
+        for _ in range(args.repeat):
+            opener()
+            app.update_idletasks()
+            if get_dialog:
+                app._close_dialog(get_dialog())
+
+    print(f"{'dialog':<12} {'first open (build)':>20} {'reopen mean':>14}")
+    for name, times in app.dialog_open_times.items():
+        first = times[0][0]
+        reopen = [ms for ms, built in times if not built]
+        mean = sum(reopen) / len(reopen) if reopen else float("nan")
+        print(f"{name:<12} {first:17.1f} ms {mean:11.1f} ms")
+    app.destroy()
+
+
+def bench_refresh(args):
+    """Replay a burst of refresh requests per tick, rebuilding directly versus through the RenderScheduler."""
+    import os
+    import tempfile
+    import time
+    from test1 import TimePlanApp
+
+    os.chdir(tempfile.mkdtemp(prefix="timeplan_bench_"))
+    app = TimePlanApp()
+    app.withdraw()
+    app.update()
+    task_id = None
+    for i in range(args.tasks):
+        task_id = app.db_manager.add_task(app.current_user_id, f"Task {i}", None, "Urgent", None, app.on_going_category_id)
+    app.update()
+
+    # One "tick" as seen in the app: a save refreshes list + detail, and a
+    # window drag delivers a run of <Configure> events
+    def burst(refresh):
+        for _ in range(3):
+            refresh("list", "All Tasks")
+            refresh("detail", task_id)
+        for _ in range(20):
+            refresh("layout")
+
+    handlers = app.render_scheduler._handlers
+    for label, refresh in (("direct", lambda region, *a: handlers[region](*a)),
+                           ("scheduled", app.render_scheduler.mark_dirty)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            burst(refresh)
+            app.update()
+        elapsed = (time.perf_counter() - start) * 1000 / args.repeat
+        print(f"{label:<10} {elapsed:9.1f} ms per tick")
+    print(f"scheduler: {app.render_scheduler.stats()}")
+    app.destroy()
+
+
+def bench_filters(args):
+    """Time every get_tasks filter: plain SQL, the in-memory task index and the result cache."""
+    import os
+    import random
+    import tempfile
+    from datetime import datetime, timedelta
+    import pytz
+    from databaseManagement import DatabaseManager
+
+    path = os.path.join(tempfile.mkdtemp(prefix="timeplan_bench_"), "bench.db")
+    db = DatabaseManager(path)
+    now = datetime.now(pytz.timezone('Asia/Manila'))
+    today = now.date()
+    for i in range(args.tasks):
+        due = (today + timedelta(days=random.randint(-30, 30))).isoformat() if random.random() > 0.1 else None
+        db.add_task(1, f"Task {i}", None, random.choice(["Urgent", "Not urgent"]), due, random.randint(1, 3))
+
+    def per_call(func):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            func()
+        return (time.perf_counter() - start) * 1000 / args.repeat
+
+    filters = ['Today', 'Next 7 Days', 'All Tasks', 'On-going', 'Completed', 'Missed']
+    # _query_tasks bypasses the result cache so each layer is measured on its own
+    sql_times = {f: per_call(lambda: db._query_tasks(1, f, now)) for f in filters}
+    if not db.enable_task_index():
+        return
+    print(f"{'filter':<12} {'sqlite':>10} {'index':>10} {'mask+sort':>10} {'cached':>10}")
+    for f in filters:
+        index_ms = per_call(lambda: db._query_tasks(1, f, now))
+        mask_us = per_call(lambda: db.task_index.filter(1, f, today)) * 1000
+        cached_ms = per_call(lambda: db.get_tasks(1, f))
+        print(f"{f:<12} {sql_times[f]:7.2f} ms {index_ms:7.2f} ms {mask_us:7.1f} us {cached_ms:7.3f} ms")
+    print(f"index: {db.task_index.stats()}")
+    print(f"result cache: {db.get_task_cache_stats()}")
+
+
+def bench_records(args):
+    """Memory held by get_tasks results: tuples re-wrapped in dicts versus slotted Task records."""
+    import os
+    import random
+    import tempfile
+    from datetime import datetime, timedelta
+    import pytz
+    from databaseManagement import DatabaseManager
+    from taskRecords import Task
+
+    path = os.path.join(tempfile.mkdtemp(prefix="timeplan_bench_"), "bench.db")
+    db = DatabaseManager(path)
+    now = datetime.now(pytz.timezone('Asia/Manila'))
+    today = now.date()
+    rows = [
+        (1, f"Task {i}", f"Description {i}" if i % 2 else None, random.choice([1, 2]),
+         (today + timedelta(days=random.randint(-30, 30))).isoformat(), random.randint(1, 3))
+        for i in range(args.tasks)
+    ]
+    with db.conn:
+        db.conn.executemany(
+            "INSERT INTO tasks (user_id, task_title, description, priority_id, due_date, category_id) VALUES (?, ?, ?, ?, ?, ?)",
+            rows)
+
+    def retained(label, build):
+        """Build a result and report the memory it still holds once built."""
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        per_100k = current * 100_000 / max(len(result), 1)
+        print(f"{label:<28} {elapsed * 1000:9.1f} ms   {current / 1024:9.1f} KiB   {per_100k / 2**20:7.1f} MiB per 100k rows")
+        return current
+
+    def tuples_and_dicts():
+        # What show_calendar_page used to build: the tuple rows plus one dict per task
+        tasks = db._query_tasks(1, 'All Tasks', now)
+        dicts = [
+            {'id': task_id, 'title': title, 'description': description,
+             'priority': priority, 'due_date': due_date, 'category': category_name}
+            for task_id, title, description, priority, due_date, category_name in tasks
+        ]
+        return list(zip(tasks, dicts))
+
+    print(f"{args.tasks} task rows")
+    plain = retained("tuples + dicts", tuples_and_dicts)
+    compact = retained("Task records", lambda: db._query_tasks(1, 'All Tasks', now, Task.from_row))
+    print(f"Task records hold {compact / plain:.0%} of the tuples + dicts memory")
+
+
+BENCHMARKS = {
+    "dialogs": bench_dialogs,
+    "filters": bench_filters,
+    "records": bench_records,
+    "refresh": bench_refresh,
+    "styles": bench_styles,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TimePlan performance benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--tasks", type=int, default=2000, help="number of task rows to render")
+    parser.add_argument("--repeat", type=int, default=10, help="how many times to repeat each action")
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == "__main__":
+    main()
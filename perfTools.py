@@ -0,0 +1,341 @@
+import cProfile
+import functools
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Records how long each startup phase of the app takes.
+
+    Phases are timed with phase() as a context manager, or with mark() for
+    spans that start in one callback and end in another (e.g. waiting for the
+    first paint). When disabled every call is a no-op.
+    """
+
+    def __init__(self, enabled=False, start_time=None):
+        self.enabled = enabled
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.phases = []  # (name, start offset seconds, duration seconds, note)
+
+    @contextmanager
+    def phase(self, name, note=""):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name, start, note)
+
+    def mark(self, name, since, note="", until=None):
+        """Record a phase between the perf_counter() values since and until (default: now)."""
+        if self.enabled:
+            end = until if until is not None else time.perf_counter()
+            self.phases.append((name, since - self.start_time, end - since, note))
+
+    def report(self):
+        """Print the time per phase and the total time since process start."""
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self.start_time
+        print("Startup profile:")
+        print(f"  {'phase':<22} {'start':>9} {'duration':>10}")
+        for name, offset, duration, note in self.phases:
+            suffix = f"  ({note})" if note else ""
+            print(f"  {name:<22} {offset * 1000:7.1f}ms {duration * 1000:8.1f}ms{suffix}")
+        print(f"  {'total':<22} {'':>9} {total * 1000:8.1f}ms")
+
+
+class Tracer:
+    """Collects nested timing spans and writes them as a Chrome trace.
+
+    Spans are "complete" events (ph "X") in the Trace Event Format, so the
+    file opens in chrome://tracing or ui.perfetto.dev and nests by time on
+    each thread. When disabled, span() yields without recording anything.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.events = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name, cat="app", **args):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            event = {
+                "name": name, "cat": cat, "ph": "X",
+                "ts": round((start - self._origin) * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+                "pid": os.getpid(), "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def save(self, path):
+        """Write the recorded spans to path as Chrome trace JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        print(f"Trace with {len(self.events)} spans written to {path}")
+
+
+# Shared tracer for the app and DatabaseManager; enabled with test1.py --trace
+tracer = Tracer()
+
+
+def traced(name=None, cat="ui"):
+    """Decorator that records each call of the function as a span on the shared tracer."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _percentiles(values, points=(50, 90, 99)):
+    """Return {"p50": ..., ...} for a list of numbers (nearest-rank), or {} if empty."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {}
+    for p in points:
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        result[f"p{p}"] = round(ordered[index], 2)
+    result["max"] = round(ordered[-1], 2)
+    result["count"] = len(ordered)
+    return result
+
+
+class IdleTracker:
+    """Tracks how long ago the user last pressed a key, clicked, scrolled or moved the mouse.
+
+    Background work that should never compete with the user (database
+    maintenance, for one) checks idle_for() before each step.
+    """
+
+    INPUT_EVENTS = ("<KeyPress>", "<ButtonPress>", "<MouseWheel>", "<Motion>")
+
+    def __init__(self, widget):
+        self.last_input = time.monotonic()
+        for sequence in self.INPUT_EVENTS:
+            widget.bind_all(sequence, self._on_input, add="+")
+
+    def _on_input(self, event):
+        self.last_input = time.monotonic()
+
+    def idle_for(self):
+        """Seconds since the last input event."""
+        return time.monotonic() - self.last_input
+
+
+class StallWatchdog:
+    """Detects main-thread stalls in a Tk app and measures UI responsiveness.
+
+    A heartbeat scheduled with after() records how late the event loop runs
+    it. A background thread watches the heartbeat; when it has not fired for
+    longer than threshold seconds, the thread captures the main thread's
+    Python stack, so the log shows which handler (show_tasks_page, a search
+    callback, ...) was blocking. Input-to-paint latency is the time from a
+    click or key press until the event loop goes idle again.
+    """
+
+    MAX_SAMPLES = 2000
+    STACK_DEPTH = 12
+
+    def __init__(self, widget, threshold=0.25, interval=0.05):
+        self.widget = widget
+        self.threshold = threshold
+        self.interval = interval
+        self.loop_lag_ms = deque(maxlen=self.MAX_SAMPLES)
+        self.input_latency_ms = deque(maxlen=self.MAX_SAMPLES)
+        self.stalls = []  # {"at", "duration_ms", "stack"}
+        self._lock = threading.Lock()
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._open_stall = None
+        self._input_offset = None  # perf_counter ms minus event.time, smallest seen
+        self._running = False
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self.widget.after(int(self.interval * 1000), self._beat)
+        for sequence in ("<ButtonRelease>", "<KeyPress>"):
+            self.widget.bind_all(sequence, self._on_input, add="+")
+        self.widget.bind_all("<Motion>", self._calibrate_input_clock, add="+")
+        threading.Thread(target=self._watch, name="StallWatchdog", daemon=True).start()
+
+    def stop(self):
+        self._running = False
+
+    def _beat(self):
+        if not self._running:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            self.loop_lag_ms.append(max(0.0, (now - self._last_beat - self.interval) * 1000))
+            if self._open_stall is not None:
+                self._open_stall["duration_ms"] = round((now - self._last_beat) * 1000, 1)
+                print(f"Stall: main thread blocked for {self._open_stall['duration_ms']:.0f} ms")
+                self._open_stall = None
+            self._last_beat = now
+        self.widget.after(int(self.interval * 1000), self._beat)
+
+    def _watch(self):
+        while self._running:
+            time.sleep(self.interval)
+            with self._lock:
+                blocked = time.perf_counter() - self._last_beat
+                if blocked < self.threshold or self._open_stall is not None:
+                    continue
+                frame = sys._current_frames().get(self._main_thread_id)
+                stack = traceback.format_stack(frame)[-self.STACK_DEPTH:] if frame else []
+                self._open_stall = {"at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                                    "duration_ms": None, "stack": [line.rstrip() for line in stack]}
+                self.stalls.append(self._open_stall)
+            print(f"Stall: main thread blocked for over {self.threshold * 1000:.0f} ms in:")
+            print("".join(stack).rstrip())
+
+    def _calibrate_input_clock(self, event):
+        # event.time is a server clock in ms; the smallest gap seen between it
+        # and perf_counter (usually on a cheap <Motion> event) is taken as zero latency
+        offset = time.perf_counter() * 1000 - event.time
+        if self._input_offset is None or offset < self._input_offset:
+            self._input_offset = offset
+
+    def _on_input(self, event):
+        # "all" bindings run after the widget's own handler, so the handler
+        # time is recovered from the event timestamp rather than from now
+        self._calibrate_input_clock(event)
+        event_time = event.time
+        self.widget.after_idle(self._record_paint, event_time)
+
+    def _record_paint(self, event_time):
+        latency = time.perf_counter() * 1000 - event_time - self._input_offset
+        self.input_latency_ms.append(max(0.0, latency))
+
+    def summary(self):
+        """Return loop-lag and input-to-paint percentiles plus the recorded stalls."""
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold * 1000,
+                "loop_lag_ms": _percentiles(list(self.loop_lag_ms)),
+                "input_to_paint_ms": _percentiles(list(self.input_latency_ms)),
+                "stalls": list(self.stalls),
+            }
+
+    def export(self, path):
+        """Write summary() as JSON to path."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        print(f"Responsiveness metrics written to {path}")
+
+
+class ActionProfiler:
+    """Runs cProfile around the next N user actions (clicks or key presses).
+
+    Nothing is bound or profiled until start() is called, so the profiler can
+    stay in production builds. When the last action has been handled and the
+    UI is idle again, the stats are dumped to a .pstats file and the top
+    cumulative functions from the app's own modules are printed.
+    """
+
+    SUMMARY_MODULES = ("databaseManagement", "test1", "renderScheduler", "styleRegistry")
+    SUMMARY_LIMIT = 15
+
+    def __init__(self, widget, actions=5, out_dir="."):
+        self.widget = widget
+        self.actions = actions
+        self.out_dir = out_dir
+        self.profile = None
+        self._remaining = 0
+        self._bound = False
+        self._idle_job = None
+
+    @property
+    def running(self):
+        return self.profile is not None
+
+    def toggle(self, event=None):
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def start(self, actions=None):
+        if self.running:
+            return
+        self._remaining = actions or self.actions
+        if not self._bound:
+            for sequence in ("<ButtonRelease>", "<KeyPress>"):
+                self.widget.bind_all(sequence, self._on_input, add="+")
+            self._bound = True
+        print(f"Profiling the next {self._remaining} actions...")
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def _on_input(self, event):
+        if not self.running or event.state & 0x4:  # Ignore Control shortcuts, incl. the toggle key
+            return
+        if self._idle_job is None:
+            # Count the action once its handlers have run and the UI is idle again
+            self._idle_job = self.widget.after_idle(self._action_done)
+
+    def _action_done(self):
+        self._idle_job = None
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self.stop()
+
+    def stop(self):
+        """Stop profiling, write the .pstats file and print a summary; returns the file path."""
+        if not self.running:
+            return None
+        self.profile.disable()
+        profile, self.profile = self.profile, None
+
+        path = os.path.abspath(os.path.join(self.out_dir, time.strftime("profile_%Y%m%d_%H%M%S.pstats")))
+        try:
+            profile.dump_stats(path)
+            print(f"Profile written to {path}")
+        except OSError as e:
+            print(f"Error writing profile: {e}")
+            path = None
+        self.print_summary(pstats.Stats(profile))
+        return path
+
+    def print_summary(self, stats):
+        """Print the functions from SUMMARY_MODULES with the highest cumulative time."""
+        rows = []
+        for (filename, line, func), (cc, nc, tt, ct, callers) in stats.stats.items():
+            module = os.path.splitext(os.path.basename(filename))[0]
+            if module in self.SUMMARY_MODULES:
+                rows.append((ct, tt, nc, f"{module}.py:{line}({func})"))
+        rows.sort(reverse=True)
+        print(f"  {'cumulative':>11} {'own':>9} {'calls':>7}  function")
+        for ct, tt, nc, label in rows[:self.SUMMARY_LIMIT]:
+            print(f"  {ct * 1000:9.1f}ms {tt * 1000:7.1f}ms {nc:7d}  {label}")
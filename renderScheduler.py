@@ -0,0 +1,68 @@
+import traceback
+
+from perfTools import traced
+
+
+class RenderScheduler:
+    """Coalesces view refreshes into at most one rebuild per region per event-loop tick.
+
+    Callers mark a region dirty instead of rebuilding it directly. The first
+    request in a tick schedules a flush with after_idle; later requests for
+    the same region only replace its arguments. On flush each dirty region's
+    handler runs once, in REGIONS order, so the task list is rebuilt before
+    the detail pane that sits next to it.
+    """
+
+    REGIONS = ("layout", "list", "calendar", "habits", "detail")
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._handlers = {}
+        self._dirty = {}  # region -> args for its handler
+        self._job = None
+        self.requests = 0
+        self.rebuilds = 0
+
+    def register(self, region, handler):
+        if region not in self.REGIONS:
+            raise ValueError(f"Unknown render region: {region}")
+        self._handlers[region] = handler
+
+    def mark_dirty(self, region, *args):
+        """Request a rebuild of region; the latest arguments win within a tick."""
+        if region not in self._handlers:
+            raise ValueError(f"No handler registered for render region: {region}")
+        self.requests += 1
+        self._dirty[region] = args
+        if self._job is None:
+            self._job = self.widget.after_idle(self.flush)
+
+    def discard(self, region):
+        """Drop a pending rebuild, e.g. when the view it belongs to was closed."""
+        self._dirty.pop(region, None)
+
+    @traced("render flush", "render")
+    def flush(self):
+        """Run each dirty region's handler once.
+
+        A handler that raises is logged and skipped, so one broken region
+        does not leave the regions after it stale.
+        """
+        self._job = None
+        dirty, self._dirty = self._dirty, {}
+        for region in self.REGIONS:
+            if region in dirty:
+                self.rebuilds += 1
+                try:
+                    self._handlers[region](*dirty[region])
+                except Exception as e:
+                    print(f"Error rebuilding {region} region: {e}")
+                    traceback.print_exc()
+
+    def stats(self):
+        """Return request/rebuild counts and how many rebuilds coalescing saved."""
+        return {
+            "requests": self.requests,
+            "rebuilds": self.rebuilds,
+            "saved": self.requests - self.rebuilds - len(self._dirty),
+        }
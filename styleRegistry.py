@@ -0,0 +1,72 @@
+import os
+import customtkinter as ctk
+from iconCache import prepare_icon
+
+
+# Background / title color sets for task cards, keyed by card state
+CARD_COLORS = {
+    "On-going": ("white", "#333333"),
+    "Completed": ("#C8E6C9", "gray"),   # Light green
+    "Missed": ("#FFCDD2", "red"),       # Light red
+}
+
+
+class StyleRegistry:
+    """Creates each font, color set and image once and hands out shared instances.
+
+    Every ctk.CTkFont is a named Tk font, so building one per label on every
+    render leaves thousands of unused font objects behind. Widgets should ask
+    the registry for fonts instead of constructing them directly.
+    """
+
+    def __init__(self, icon_cache=None):
+        self.icon_cache = icon_cache  # Optional iconCache.IconCache for pre-processed icons
+        self._fonts = {}
+        self._images = {}
+        self.font_requests = 0
+        self.image_requests = 0
+
+    def font(self, size=None, weight=None, slant="roman", family=None):
+        """Return the shared CTkFont for the given size/weight/slant."""
+        self.font_requests += 1
+        key = (family, size, weight, slant)
+        font = self._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(family=family, size=size, weight=weight, slant=slant)
+            self._fonts[key] = font
+        return font
+
+    def card_colors(self, state):
+        """Return the (background, title) color set for a task card state."""
+        return CARD_COLORS.get(state, CARD_COLORS["On-going"])
+
+    def icon(self, path, size):
+        """Return a square, center-cropped CTkImage for the icon at path.
+
+        Returns None if the file does not exist. Each (path, size) pair is
+        only loaded once per registry, and only resized when the icon cache
+        has no up-to-date copy.
+        """
+        self.image_requests += 1
+        key = (path, size)
+        if key in self._images:
+            return self._images[key]
+
+        image = None
+        if os.path.exists(path):
+            if self.icon_cache is not None:
+                img = self.icon_cache.load(path, size)
+            else:
+                img = prepare_icon(path, size)
+            image = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+        self._images[key] = image
+        return image
+
+    def stats(self):
+        """Return how many shared objects exist versus how many were requested."""
+        return {
+            "fonts_created": len(self._fonts),
+            "font_requests": self.font_requests,
+            "images_created": len(self._images),
+            "image_requests": self.image_requests,
+        }
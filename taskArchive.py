@@ -0,0 +1,137 @@
+import os
+import sqlite3
+from datetime import timedelta
+
+
+class TaskArchive:
+    """Moves old Completed and Missed tasks out of `tasks` into an attached archive database.
+
+    The archive file is ATTACHed to the DatabaseManager connection as
+    "archive", so one transaction can cover both databases: every batch
+    copies its rows into archive.archived_tasks and deletes them from
+    main.tasks, and either both happen or neither does. A task is old when
+    its due date (or, without one, its last update) is more than
+    horizon_days ago. The job keeps no state of its own, so an interrupted
+    run simply continues with the next batch.
+    """
+
+    BATCH_SIZE = 500
+    COLUMNS = "task_id, task_title, description, priority_id, due_date, user_id, category_id, created_at, updated_at"
+
+    def __init__(self, db_manager, path=None, horizon_days=90):
+        self.db = db_manager
+        if path is None:
+            path = ":memory:" if db_manager.db_name == ":memory:" else os.path.splitext(db_manager.db_name)[0] + "_archive.db"
+        self.path = path
+        self.horizon_days = horizon_days
+        self.archived = 0
+        self.category_ids = [
+            category_id for category_id in (
+                db_manager.get_category_id_by_name("Completed"),
+                db_manager.get_category_id_by_name("Missed"),
+            ) if category_id
+        ]
+
+        conn = db_manager.conn
+        conn.commit()  # ATTACH is not allowed inside a transaction
+        conn.execute("ATTACH DATABASE ? AS archive", (path,))
+        # Only takes effect on a new, empty file; lets maintenance shrink the archive in steps
+        conn.execute("PRAGMA archive.auto_vacuum = INCREMENTAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive.archived_tasks (
+                task_id     INTEGER PRIMARY KEY NOT NULL,
+                task_title  TEXT    NOT NULL,
+                description TEXT,
+                priority_id INTEGER NOT NULL,
+                due_date    DATE,
+                user_id     INTEGER NOT NULL,
+                category_id INTEGER NOT NULL,
+                created_at  DATETIME,
+                updated_at  DATETIME,
+                archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS archive.archived_tasks_user ON archived_tasks (user_id, due_date)")
+        conn.commit()
+        self._recover()
+
+    def _recover(self):
+        # Only WAL mode can leave a batch half-done (its multi-database commits are not
+        # atomic); task IDs are never reused, so a row in both places was already archived
+        with self.db.conn:
+            cursor = self.db.conn.execute(
+                "DELETE FROM main.tasks WHERE task_id IN (SELECT task_id FROM archive.archived_tasks)"
+            )
+        if cursor.rowcount > 0:
+            print(f"Removed {cursor.rowcount} already archived tasks left by an interrupted run")
+            self.db._notify_tasks_changed(None)
+
+    def cutoff(self, today=None):
+        # Same Asia/Manila "today" as every other date decision in DatabaseManager
+        return ((today or self.db._get_current_local_date()) - timedelta(days=self.horizon_days)).isoformat()
+
+    def pending(self, today=None):
+        """Number of tasks old enough to be archived."""
+        if not self.category_ids:
+            return 0
+        placeholders = ", ".join("?" for _ in self.category_ids)
+        row = self.db._fetch_one(f"""
+            SELECT COUNT(*) FROM main.tasks
+            WHERE category_id IN ({placeholders})
+            AND date(COALESCE(due_date, updated_at)) < date(?)
+        """, (*self.category_ids, self.cutoff(today)))
+        return row[0] if row else 0
+
+    def archive_batch(self, today=None, batch_size=None):
+        """Move up to batch_size old tasks into the archive; returns how many were moved."""
+        if not self.category_ids:
+            return 0
+        placeholders = ", ".join("?" for _ in self.category_ids)
+        rows = self.db._fetch_all(f"""
+            SELECT task_id, user_id FROM main.tasks
+            WHERE category_id IN ({placeholders})
+            AND date(COALESCE(due_date, updated_at)) < date(?)
+            ORDER BY task_id
+            LIMIT ?
+        """, (*self.category_ids, self.cutoff(today), batch_size or self.BATCH_SIZE))
+        if not rows:
+            return 0
+
+        task_ids = [task_id for task_id, _ in rows]
+        placeholders = ", ".join("?" for _ in task_ids)
+        conn = self.db.conn
+        try:
+            with conn:  # Commits both databases together, or rolls both back
+                conn.execute(
+                    f"INSERT OR REPLACE INTO archive.archived_tasks ({self.COLUMNS}) "
+                    f"SELECT {self.COLUMNS} FROM main.tasks WHERE task_id IN ({placeholders})",
+                    task_ids,
+                )
+                conn.execute(f"DELETE FROM main.tasks WHERE task_id IN ({placeholders})", task_ids)
+        except sqlite3.Error as e:
+            print(f"Error archiving tasks: {e}")
+            return 0
+
+        by_user = {}
+        for task_id, user_id in rows:
+            by_user.setdefault(user_id, []).append(task_id)
+        for user_id, ids in by_user.items():
+            self.db._notify_tasks_changed(ids, user_id)
+        self.archived += len(rows)
+        return len(rows)
+
+    def run(self, today=None, max_batches=None):
+        """Archive batch after batch until nothing is left (or max_batches ran)."""
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = self.archive_batch(today)
+            if not moved:
+                break
+            total += moved
+            batches += 1
+        return total
+
+    def stats(self):
+        row = self.db._fetch_one("SELECT COUNT(*) FROM archive.archived_tasks")
+        return {"path": self.path, "archived_rows": row[0] if row else 0, "moved_this_session": self.archived}
@@ -0,0 +1,257 @@
+"""Streaming export of TimePlan tasks and habits.
+
+Usage: python taskExport.py OUT [--format {csv,jsonl,ics}] [--user ID] [--db FILE]
+
+Rows are read with fetchmany and encoded by generators that write straight
+to the output file, so memory use stays flat however many tasks there are.
+"""
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+
+# recurrence_pattern values used by the app -> iCalendar RRULE
+RRULES = {
+    "daily": "FREQ=DAILY",
+    "weekly": "FREQ=WEEKLY",
+    "monthly": "FREQ=MONTHLY",
+    "annual": "FREQ=YEARLY",
+    "annually": "FREQ=YEARLY",
+    "yearly": "FREQ=YEARLY",
+}
+
+
+def _ics_escape(text):
+    return (str(text).replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _ics_line(name, value):
+    """One content line, folded at 75 octets as RFC 5545 requires."""
+    text = f"{name}:{value}"
+    if len(text) <= 75 and text.isascii():
+        return text + "\r\n"
+    line = text.encode("utf-8")
+    chunks = []
+    while len(line) > 75:
+        cut = 75 if not chunks else 74  # Continuation lines start with a space
+        while cut > 0 and (line[cut] & 0xC0) == 0x80:  # Do not split a UTF-8 sequence
+            cut -= 1
+        chunks.append(line[:cut])
+        line = line[cut:]
+    chunks.append(line)
+    return "\r\n ".join(chunk.decode("utf-8") for chunk in chunks) + "\r\n"
+
+
+def _ics_date(value):
+    """'YYYY-MM-DD' (optionally with a time part) -> 'YYYYMMDD', or None."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value.split()[0], "%Y-%m-%d").strftime("%Y%m%d")
+    except ValueError:
+        return None
+
+
+def encode_csv(rows, columns):
+    """Yield the CSV text of a header line and one line per row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in itertools.chain((columns,), rows):
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def encode_jsonl(rows, columns, record_type):
+    for row in rows:
+        record = {"type": record_type}
+        record.update(zip(columns, row))
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class TaskExporter:
+    """Streams tasks, recurring tasks and habit completions out of a DatabaseManager.
+
+    Each source is a generator over its own cursor that reads FETCH_SIZE
+    rows at a time. Tasks include the archive when one is attached (see
+    DatabaseManager.history_source). The schema only keeps the latest
+    completion of each recurring task, so that is the completion history
+    that gets exported.
+    """
+
+    FETCH_SIZE = 1000
+    KINDS = ("tasks", "habits", "completions")
+    TASK_COLUMNS = ("task_id", "user_id", "title", "description", "priority", "due_date", "category", "created_at", "updated_at")
+    HABIT_COLUMNS = ("rtask_id", "user_id", "title", "description", "start_date", "recurrence_pattern", "last_completed_date", "status")
+    COMPLETION_COLUMNS = ("rtask_id", "user_id", "title", "completed_date")
+
+    def __init__(self, db_manager, user_id=None):
+        self.db = db_manager
+        self.user_id = user_id
+        self.counts = {}
+
+    def _stream(self, query, params=()):
+        cursor = self.db.conn.cursor()
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(self.FETCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def _user_filter(self, column):
+        if self.user_id is None:
+            return "", ()
+        return f"WHERE {column} = ?", (self.user_id,)
+
+    def tasks(self):
+        where, params = self._user_filter("t.user_id")
+        return self._stream(f"""
+            SELECT t.task_id, t.user_id, t.task_title, t.description, p.priority_name, t.due_date,
+                   tc.category_name, t.created_at, t.updated_at
+            FROM {self.db.history_source()} t
+            JOIN task_category tc ON t.category_id = tc.category_id
+            LEFT JOIN priority p ON t.priority_id = p.priority_id
+            {where}
+            ORDER BY t.task_id
+        """, params)
+
+    def habits(self):
+        where, params = self._user_filter("user_id")
+        return self._stream(f"""
+            SELECT rtask_id, user_id, rtask_title, description, start_date, recurrence_pattern,
+                   last_completed_date, status
+            FROM recurring_tasks
+            {where}
+            ORDER BY rtask_id
+        """, params)
+
+    def completions(self):
+        where, params = self._user_filter("user_id")
+        where = f"{where} AND" if where else "WHERE"
+        return self._stream(f"""
+            SELECT rtask_id, user_id, rtask_title, last_completed_date
+            FROM recurring_tasks
+            {where} last_completed_date IS NOT NULL
+            ORDER BY rtask_id
+        """, params)
+
+    def _counted(self, kind, rows):
+        self.counts[kind] = 0
+        for row in rows:
+            self.counts[kind] += 1
+            yield row
+
+    def _columns(self, kind):
+        return {"tasks": self.TASK_COLUMNS, "habits": self.HABIT_COLUMNS, "completions": self.COMPLETION_COLUMNS}[kind]
+
+    def encode_ics(self, kinds):
+        """Yield an iCalendar file: a VTODO per task, a VEVENT with an RRULE per habit."""
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        yield _ics_line("BEGIN", "VCALENDAR")
+        yield _ics_line("VERSION", "2.0")
+        yield _ics_line("PRODID", "-//TimePlan//Task Export//EN")
+        if "tasks" in kinds:
+            for task_id, user_id, title, description, priority, due_date, category, created_at, updated_at in \
+                    self._counted("tasks", self.tasks()):
+                yield _ics_line("BEGIN", "VTODO")
+                yield _ics_line("UID", f"task-{task_id}@timeplan")
+                yield _ics_line("DTSTAMP", stamp)
+                yield _ics_line("SUMMARY", _ics_escape(title))
+                if description:
+                    yield _ics_line("DESCRIPTION", _ics_escape(description))
+                due = _ics_date(due_date)
+                if due:
+                    yield _ics_line("DUE;VALUE=DATE", due)
+                if priority == "Urgent":
+                    yield _ics_line("PRIORITY", "1")
+                if category == "Completed":
+                    yield _ics_line("STATUS", "COMPLETED")
+                if category:
+                    yield _ics_line("CATEGORIES", _ics_escape(category))
+                yield _ics_line("END", "VTODO")
+        if "habits" in kinds:
+            for rtask_id, user_id, title, description, start_date, pattern, last_completed, status in \
+                    self._counted("habits", self.habits()):
+                start = _ics_date(start_date)
+                if not start:
+                    continue  # A VEVENT needs a start date
+                yield _ics_line("BEGIN", "VEVENT")
+                yield _ics_line("UID", f"habit-{rtask_id}@timeplan")
+                yield _ics_line("DTSTAMP", stamp)
+                yield _ics_line("SUMMARY", _ics_escape(title))
+                if description:
+                    yield _ics_line("DESCRIPTION", _ics_escape(description))
+                yield _ics_line("DTSTART;VALUE=DATE", start)
+                rrule = RRULES.get((pattern or "").strip().lower())
+                if rrule:
+                    yield _ics_line("RRULE", rrule)
+                yield _ics_line("END", "VEVENT")
+        yield _ics_line("END", "VCALENDAR")
+
+    def export(self, path, fmt="jsonl", kinds=KINDS):
+        """Write kinds to path and return {kind: rows written}.
+
+        CSV writes one file per kind (path_tasks.csv, ...); JSON Lines
+        tags every line with its "type"; .ics holds tasks and habits only.
+        """
+        start = time.perf_counter()
+        self.counts = {}
+        if fmt == "csv":
+            stem = os.path.splitext(path)[0]
+            for kind in kinds:
+                target = path if len(kinds) == 1 else f"{stem}_{kind}.csv"
+                rows = self._counted(kind, getattr(self, kind)())
+                with open(target, "w", encoding="utf-8", newline="") as f:
+                    f.writelines(encode_csv(rows, self._columns(kind)))
+        elif fmt == "jsonl":
+            with open(path, "w", encoding="utf-8") as f:
+                for kind in kinds:
+                    rows = self._counted(kind, getattr(self, kind)())
+                    f.writelines(encode_jsonl(rows, self._columns(kind), kind))
+        elif fmt == "ics":
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.writelines(self.encode_ics(kinds))
+        else:
+            raise ValueError(f"Unknown export format: {fmt}")
+
+        elapsed = time.perf_counter() - start
+        total = sum(self.counts.values())
+        rate = total / elapsed if elapsed > 0 else 0
+        print(f"Exported {total} rows ({', '.join(f'{n} {k}' for k, n in self.counts.items())}) "
+              f"to {path} in {elapsed:.2f} s, {rate:,.0f} rows/sec")
+        return dict(self.counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export TimePlan tasks and habits")
+    parser.add_argument("out", help="output file")
+    parser.add_argument("--format", choices=["csv", "jsonl", "ics"], help="defaults to the file extension")
+    parser.add_argument("--user", type=int, help="only this user's data")
+    parser.add_argument("--db", default="timePlanDB.db", help="database file")
+    parser.add_argument("--kinds", default=",".join(TaskExporter.KINDS), help="comma-separated: tasks,habits,completions")
+    args = parser.parse_args()
+
+    from databaseManagement import DatabaseManager
+
+    fmt = args.format or os.path.splitext(args.out)[1].lstrip(".").lower()
+    kinds = tuple(kind for kind in args.kinds.split(",") if kind)
+    db = DatabaseManager(args.db)
+    if os.path.exists(os.path.splitext(args.db)[0] + "_archive.db"):
+        db.enable_archive()  # Archived tasks are part of the export too
+    TaskExporter(db, args.user).export(args.out, fmt, kinds)
+    db._close()
+
+
+if __name__ == "__main__":
+    main()
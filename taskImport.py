@@ -0,0 +1,448 @@
+"""Streaming bulk import of tasks and habits.
+
+Usage: python taskImport.py IN --user ID [--format {csv,jsonl,ics}] [--db FILE] [--restart]
+
+Reads the files taskExport writes (and other tools' CSV, JSON Lines and
+iCalendar files) one record at a time, and inserts them in large
+transactions instead of one commit per add_task call. Progress is
+checkpointed in the database, so an interrupted import picks up where it
+stopped when it is run again.
+"""
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime
+
+
+# iCalendar RRULE FREQ -> recurrence_pattern values used by the app
+PATTERNS = {
+    "DAILY": "Daily",
+    "WEEKLY": "Weekly",
+    "MONTHLY": "Monthly",
+    "YEARLY": "Annual",
+}
+# Pattern names other tools (and older exports) use -> the app's
+PATTERN_NAMES = {
+    "daily": "Daily",
+    "weekly": "Weekly",
+    "monthly": "Monthly",
+    "annual": "Annual",
+    "annually": "Annual",
+    "yearly": "Annual",
+}
+# Column names accepted for each field, first match wins
+ALIASES = {
+    "title": ("title", "task_title", "rtask_title", "summary", "name"),
+    "description": ("description", "notes"),
+    "priority": ("priority", "priority_name"),
+    "due_date": ("due_date", "due"),
+    "category": ("category", "category_name"),
+    "start_date": ("start_date", "start"),
+    "recurrence_pattern": ("recurrence_pattern", "recurrence", "pattern"),
+}
+
+_ICS_ESCAPE = re.compile(r"\\(.)")
+_ICS_LIST_SEPARATOR = re.compile(r"(?<!\\),")
+
+
+def _field(record, name):
+    for key in ALIASES[name]:
+        value = record.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _record_kind(record, default="tasks"):
+    kind = record.get("type")
+    if kind:
+        return kind
+    return "habits" if _field(record, "recurrence_pattern") else default
+
+
+def parse_csv(f):
+    """Yield (kind, record) per CSV row; the header decides whether rows are tasks or habits."""
+    reader = csv.DictReader(f)
+    fields = set(reader.fieldnames or ())
+    if "completed_date" in fields:
+        kind = "completions"
+    elif fields.intersection(ALIASES["recurrence_pattern"]):
+        kind = "habits"
+    else:
+        kind = "tasks"
+    for row in reader:
+        yield row.get("type") or kind, row
+
+
+def parse_jsonl(f):
+    """Yield (kind, record) per line; lines that are not JSON objects come back as kind None."""
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield None, {"error": "not valid JSON"}
+            continue
+        if not isinstance(record, dict):
+            yield None, {"error": "not a JSON object"}
+            continue
+        yield _record_kind(record), record
+
+
+def _ics_unfold(f):
+    """Yield logical content lines, joining RFC 5545 folded continuations."""
+    current = None
+    for raw in f:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def _ics_unescape(value):
+    return _ICS_ESCAPE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def _ics_date(value):
+    """'YYYYMMDD' or 'YYYYMMDDTHHMMSS[Z]' -> 'YYYY-MM-DD'; anything else is passed on to fail validation."""
+    if len(value) >= 8 and value[:8].isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:8]}"
+    return value
+
+
+def parse_ics(f):
+    """Yield (kind, record) per VTODO and VEVENT.
+
+    A VTODO is a task due on its DUE date; a VEVENT with a daily, weekly,
+    monthly or yearly RRULE is a habit starting on DTSTART, and any other
+    VEVENT a task due on DTSTART.
+    """
+    component = None
+    props = {}
+    for line in _ics_unfold(f):
+        name, _, value = line.partition(":")
+        name = name.split(";", 1)[0].upper()
+        if name == "BEGIN" and value.upper() in ("VTODO", "VEVENT"):
+            component = value.upper()
+            props = {}
+        elif name == "END" and component is not None and value.upper() == component:
+            yield _ics_record(component, props)
+            component = None
+        elif component is not None and name not in props:
+            props[name] = value
+
+    if component is not None:
+        yield None, {"error": f"unterminated {component}"}
+
+
+def _ics_record(component, props):
+    record = {"title": _ics_unescape(props.get("SUMMARY", "")).strip()}
+    if props.get("DESCRIPTION"):
+        record["description"] = _ics_unescape(props["DESCRIPTION"])
+    if props.get("CATEGORIES"):
+        record["category"] = _ics_unescape(_ICS_LIST_SEPARATOR.split(props["CATEGORIES"])[0]).strip()
+    elif props.get("STATUS", "").upper() == "COMPLETED":
+        record["category"] = "Completed"
+    try:
+        # RFC 5545 priorities 1-4 are the high ones; 0 means undefined
+        record["priority"] = "Urgent" if 1 <= int(props.get("PRIORITY", 0)) <= 4 else "Not urgent"
+    except ValueError:
+        record["priority"] = "Not urgent"
+
+    if component == "VTODO":
+        if props.get("DUE"):
+            record["due_date"] = _ics_date(props["DUE"])
+        return "tasks", record
+
+    start = _ics_date(props.get("DTSTART", ""))
+    rrule = dict(part.partition("=")[::2] for part in props.get("RRULE", "").upper().split(";") if part)
+    pattern = PATTERNS.get(rrule.get("FREQ"))
+    if pattern:
+        record["start_date"] = start
+        record["recurrence_pattern"] = pattern
+        return "habits", record
+    if start:
+        record["due_date"] = start
+    return "tasks", record
+
+
+PARSERS = {"csv": parse_csv, "jsonl": parse_jsonl, "ics": parse_ics}
+
+
+class TaskImporter:
+    """Validates and inserts streamed records for one user in BATCH_SIZE transactions.
+
+    Category and priority names are resolved through caches filled once
+    per import; unknown categories are created, unknown or missing
+    priorities fall back to "Not urgent" like add_task. Dates must match
+    DatabaseManager.DATE_FORMAT, the rule _parse_date applies. A task is a
+    duplicate when the user already has one with the same title and due
+    date (habits: same title and pattern), including rows added earlier in
+    the same import; duplicates and invalid records are counted and
+    skipped. Habit completions are not imported.
+
+    Each batch commits together with its row in import_checkpoints, which
+    records how many input records are done. Running the same file again
+    skips that many records, so a killed import loses at most the batch
+    that was in flight.
+    """
+
+    BATCH_SIZE = 5000
+    MAX_REPORTED_REJECTS = 10
+    DATE_CACHE_SIZE = 100000
+
+    def __init__(self, db_manager, user_id, batch_size=None):
+        self.db = db_manager
+        self.user_id = user_id
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self._categories = None
+        self._priorities = None
+        self._dates = {}  # Raw date value -> stored form; strptime is the slowest part of validation
+        self.counts = {}
+
+    # --- Name caches ---
+
+    def _load_caches(self):
+        self._categories = {name: category_id for name, category_id in self.db.get_task_categories() or ()}
+        self._priorities = dict(self.db._fetch_all("SELECT priority_name, priority_id FROM priority") or ())
+
+    def _category_id(self, name):
+        if not name:
+            return self._categories.get("On-going", 1)
+        category_id = self._categories.get(name)
+        if category_id is None:
+            self.db.add_category(name)
+            category_id = self._categories[name] = self.db.get_category_id_by_name(name)
+        return category_id
+
+    def _priority_id(self, name):
+        priority_id = self._priorities.get(name) if name else None
+        return priority_id or self._priorities.get("Not urgent")
+
+    # --- Validation ---
+
+    def _date(self, value, required=False):
+        """Return value in the stored date format; raises ValueError when _parse_date would reject it."""
+        if value in (None, ""):
+            if required:
+                raise ValueError("date is missing")
+            return None
+        stored = self._dates.get(value)
+        if stored is None:
+            try:
+                parsed = datetime.strptime(str(value).strip(), self.db.DATE_FORMAT)
+            except ValueError:
+                raise ValueError(f"invalid date {value!r}, expected YYYY-MM-DD") from None
+            stored = parsed.strftime(self.db.DATE_FORMAT)  # Zero-padded, so dates still sort as text
+            if len(self._dates) >= self.DATE_CACHE_SIZE:
+                self._dates.clear()
+            self._dates[value] = stored
+        return stored
+
+    def _validate(self, kind, record):
+        """Return (kind, insert parameters); raises ValueError with the reason a record is rejected."""
+        if kind is None:
+            raise ValueError(record.get("error", "unreadable record"))
+        title = str(_field(record, "title") or "").strip()
+        if kind == "completions":
+            raise ValueError("habit completions are not imported")
+        if not title:
+            raise ValueError("title is missing")
+        description = _field(record, "description") or None
+        if kind == "tasks":
+            due_date = self._date(_field(record, "due_date"))
+            return kind, (self.user_id, title, description,
+                          self._priority_id(_field(record, "priority")), due_date,
+                          self._category_id(_field(record, "category")))
+        if kind == "habits":
+            pattern = PATTERN_NAMES.get(str(_field(record, "recurrence_pattern") or "").strip().lower())
+            if pattern is None:
+                raise ValueError(f"unknown recurrence pattern {_field(record, 'recurrence_pattern')!r}")
+            start_date = self._date(_field(record, "start_date"), required=True)
+            return kind, (self.user_id, title, description, start_date, pattern)
+        raise ValueError(f"unknown record type {kind!r}")
+
+    # --- Inserts ---
+
+    def _task_insert(self):
+        # executemany runs row by row, so NOT EXISTS also sees rows inserted earlier in the batch
+        exists = "SELECT 1 FROM main.tasks WHERE user_id = ?1 AND task_title = ?2 AND due_date IS ?5"
+        if self.db.archive is not None:
+            exists += " UNION ALL SELECT 1 FROM archive.archived_tasks " \
+                      "WHERE user_id = ?1 AND task_title = ?2 AND due_date IS ?5"
+        return f"""
+            INSERT INTO main.tasks (user_id, task_title, description, priority_id, due_date, category_id)
+            SELECT ?1, ?2, ?3, ?4, ?5, ?6
+            WHERE NOT EXISTS ({exists})
+        """
+
+    HABIT_INSERT = """
+        INSERT INTO recurring_tasks (user_id, rtask_title, description, start_date, recurrence_pattern)
+        SELECT ?1, ?2, ?3, ?4, ?5
+        WHERE NOT EXISTS (SELECT 1 FROM recurring_tasks
+                          WHERE user_id = ?1 AND rtask_title = ?2 AND recurrence_pattern = ?5)
+    """
+
+    def _insert_batch(self, tasks, habits):
+        """Insert one batch inside the caller's transaction; returns how many rows were new."""
+        conn = self.db.conn
+        inserted = 0
+        if tasks:
+            inserted += conn.executemany(self._task_insert(), tasks).rowcount
+        if habits:
+            inserted += conn.executemany(self.HABIT_INSERT, habits).rowcount
+        return inserted
+
+    def _save_checkpoint(self, source, fingerprint, records_done, imported, duplicates, rejected, finished):
+        self.db.conn.execute("""
+            INSERT INTO import_checkpoints
+                (source, user_id, fingerprint, records_done, imported, duplicates, rejected, finished, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source, user_id) DO UPDATE SET
+                fingerprint = excluded.fingerprint, records_done = excluded.records_done,
+                imported = excluded.imported, duplicates = excluded.duplicates,
+                rejected = excluded.rejected, finished = excluded.finished,
+                updated_at = excluded.updated_at
+        """, (source, self.user_id, fingerprint, records_done, imported, duplicates, rejected, int(finished), time.time()))
+
+    # --- Checkpoints ---
+
+    @staticmethod
+    def fingerprint(path):
+        """Size plus a hash of the first MiB: cheap, and changes when the file is replaced."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            digest.update(f.read(1024 * 1024))
+        return f"{os.path.getsize(path)}:{digest.hexdigest()}"
+
+    def checkpoint(self, path):
+        """Return the stored checkpoint row for path, or None."""
+        return self.db._fetch_one("""
+            SELECT fingerprint, records_done, imported, duplicates, rejected, finished
+            FROM import_checkpoints WHERE source = ? AND user_id = ?
+        """, (os.path.abspath(path), self.user_id))
+
+    # --- Import ---
+
+    def import_file(self, path, fmt=None, restart=False, progress=None):
+        """Import path and return the counts; progress(records_done, rows_per_sec) is called per batch.
+
+        fmt defaults to the file extension. restart ignores any checkpoint
+        and reads the file from the start (duplicates are still skipped).
+        """
+        fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+        if fmt not in PARSERS:
+            raise ValueError(f"Unknown import format: {fmt}")
+        source = os.path.abspath(path)
+        fingerprint = self.fingerprint(path)
+
+        skip, imported, duplicates, rejected = 0, 0, 0, 0
+        saved = None if restart else self.checkpoint(path)
+        if saved and saved[0] == fingerprint:
+            if saved[5]:
+                print(f"{path} was already imported ({saved[2]} rows); use restart to import it again")
+                return {"imported": saved[2], "duplicates": saved[3], "rejected": saved[4], "resumed_at": saved[1]}
+            skip, imported, duplicates, rejected = saved[1:5]
+            print(f"Resuming import of {path} after {skip} records")
+        elif saved:
+            print(f"{path} changed since the last import; starting over")
+
+        self._load_caches()
+        start = time.perf_counter()
+        done = saved_done = skip
+        tasks, habits = [], []
+        reported = 0
+
+        def flush(finished=False):
+            # The rows and the checkpoint that counts them commit together
+            nonlocal imported, duplicates, saved_done, tasks, habits
+            conn = self.db.conn
+            conn.commit()  # Nothing else should ride along in the batch transaction
+            with conn:
+                inserted = self._insert_batch(tasks, habits)
+                self._save_checkpoint(source, fingerprint, done, imported + inserted,
+                                      duplicates + len(tasks) + len(habits) - inserted, rejected, finished)
+            imported += inserted
+            duplicates += len(tasks) + len(habits) - inserted
+            saved_done = done
+            tasks, habits = [], []
+            if inserted:
+                self.db._notify_tasks_changed(None, self.user_id)
+
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as f:
+                for kind, record in itertools.islice(PARSERS[fmt](f), skip, None):
+                    done += 1
+                    try:
+                        kind, params = self._validate(kind, record)
+                    except ValueError as e:
+                        rejected += 1
+                        if reported < self.MAX_REPORTED_REJECTS:
+                            print(f"Skipping record {done}: {e}")
+                            reported += 1
+                        continue
+                    (tasks if kind == "tasks" else habits).append(params)
+                    if len(tasks) + len(habits) >= self.batch_size:
+                        flush()
+                        if progress:
+                            elapsed = time.perf_counter() - start
+                            progress(done, (done - skip) / elapsed if elapsed > 0 else 0)
+            flush(finished=True)
+        except KeyboardInterrupt:
+            print(f"\nImport interrupted; run it again to resume after record {saved_done}")
+            raise
+        except sqlite3.Error as e:
+            print(f"Import failed at record {done}: {e}")
+            raise
+
+        elapsed = time.perf_counter() - start
+        rate = (done - skip) / elapsed if elapsed > 0 else 0
+        if rejected > reported:
+            print(f"... {rejected - reported} more records skipped")
+        print(f"Imported {imported} rows from {path} ({duplicates} duplicates, {rejected} rejected) "
+              f"in {elapsed:.2f} s, {rate:,.0f} rows/sec")
+        self.counts = {"imported": imported, "duplicates": duplicates, "rejected": rejected, "resumed_at": skip}
+        return dict(self.counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import tasks and habits into TimePlan")
+    parser.add_argument("path", help="CSV, JSON Lines or .ics file")
+    parser.add_argument("--format", choices=sorted(PARSERS), help="defaults to the file extension")
+    parser.add_argument("--user", type=int, required=True, help="user the rows are imported for")
+    parser.add_argument("--db", default="timePlanDB.db", help="database file")
+    parser.add_argument("--batch", type=int, default=TaskImporter.BATCH_SIZE, help="rows per transaction")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and read the file from the start")
+    args = parser.parse_args()
+
+    from databaseManagement import DatabaseManager
+
+    db = DatabaseManager(args.db)
+    if os.path.exists(os.path.splitext(args.db)[0] + "_archive.db"):
+        db.enable_archive()  # So archived tasks count as duplicates too
+    importer = TaskImporter(db, args.user, args.batch)
+    try:
+        importer.import_file(
+            args.path, args.format, args.restart,
+            progress=lambda done, rate: print(f"{done} records, {rate:,.0f} rows/sec", end="\r", flush=True),
+        )
+    except KeyboardInterrupt:
+        raise SystemExit(130)
+    finally:
+        db._close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import sqlite3
+
+from taskRecords import NO_DUE_DATE, day_ordinal
+
+try:
+    import numpy as np
+except ImportError:  # The index is optional; DatabaseManager.get_tasks falls back to SQL
+    np = None
+
+
+class TaskIndex:
+    """Columnar in-memory copy of the task columns that get_tasks filters and sorts on.
+
+    Per user it keeps a task_id array, int32 day ordinals for due_date,
+    int32 category IDs and uint8 priority codes. Every filter of get_tasks is then a
+    vectorized mask plus lexsort over these arrays; SQLite is only queried
+    for the row details of the matching IDs. The index registers itself as
+    a task listener on the DatabaseManager and re-reads just the rows that
+    a write touched.
+    """
+
+    COLUMNS_QUERY = """
+        SELECT t.task_id, t.user_id, t.due_date, t.category_id, p.priority_level
+        FROM tasks t
+        LEFT JOIN priority p ON t.priority_id = p.priority_id
+    """
+
+    def __init__(self, db_manager):
+        if np is None:
+            raise ImportError("TaskIndex requires numpy")
+        self.db = db_manager
+        self._users = {}  # user_id -> {"task_id", "due", "category", "priority"} arrays
+        self.category_ids = {
+            name: db_manager.get_category_id_by_name(name)
+            for name in ("On-going", "Completed", "Missed")
+        }
+        db_manager.add_task_listener(self._on_tasks_changed)
+
+    @staticmethod
+    def _build_columns(rows):
+        # Priority code 0 stands for "no priority" (NULL sorts first in SQLite)
+        return {
+            "task_id": np.array([r[0] for r in rows], dtype=np.int64),
+            "due": np.array([day_ordinal(r[2]) for r in rows], dtype=np.int32),
+            # Category IDs grow with every category ever added (taskImport creates them), so no uint8
+            "category": np.array([r[3] for r in rows], dtype=np.int32),
+            "priority": np.array([0 if r[4] is None else min(r[4] + 1, 255) for r in rows], dtype=np.uint8),
+        }
+
+    def _columns(self, user_id):
+        columns = self._users.get(user_id)
+        if columns is None:
+            rows = self.db._fetch_all(self.COLUMNS_QUERY + "WHERE t.user_id = ?", (user_id,))
+            columns = self._build_columns(rows)
+            self._users[user_id] = columns
+        return columns
+
+    def _on_tasks_changed(self, task_ids, user_id=None):
+        """Re-read the given tasks (None means unknown: drop everything and reload lazily)."""
+        if task_ids is None:
+            self._users.clear()
+            return
+        if not self._users:
+            return
+        task_ids = list(task_ids)
+        rows = []
+        # Chunked like get_tasks_by_ids, to stay under SQLite's 999 bound parameters
+        for start in range(0, len(task_ids), 900):
+            chunk = task_ids[start:start + 900]
+            placeholders = ", ".join("?" for _ in chunk)
+            try:
+                # Not _fetch_all: it turns errors into an empty result, which would look like deleted rows
+                rows.extend(self.db.conn.execute(
+                    self.COLUMNS_QUERY + f"WHERE t.task_id IN ({placeholders})", tuple(chunk)).fetchall())
+            except sqlite3.Error as e:
+                # The write already committed; rebuild lazily rather than keep a wrong index
+                print(f"Task index refresh failed, rebuilding on next use: {e}")
+                self.invalidate()
+                return
+        changed = np.array(task_ids, dtype=np.int64)
+        for user_id, columns in self._users.items():
+            keep = ~np.isin(columns["task_id"], changed)
+            fresh = self._build_columns([r for r in rows if r[1] == user_id])
+            self._users[user_id] = {
+                name: np.concatenate((columns[name][keep], fresh[name])) for name in columns
+            }
+
+    def count(self, user_id):
+        return len(self._columns(user_id)["task_id"])
+
+    def invalidate(self):
+        self._users.clear()
+
+    def filter(self, user_id, filter_type, today):
+        """Return the task IDs for filter_type in the same order as the get_tasks SQL."""
+        columns = self._columns(user_id)
+        due = columns["due"]
+        category = columns["category"]
+        today = day_ordinal(today)
+        ongoing = self.category_ids["On-going"]
+
+        if filter_type == 'Today':
+            mask = (due == today) & (category == ongoing)
+        elif filter_type == 'Next 7 Days':
+            mask = (due >= today) & (due <= today + 7) & (category == ongoing)
+        elif filter_type == 'On-going' and ongoing:
+            mask = (category == ongoing) & (due >= today)  # NO_DUE_DATE passes, like due_date IS NULL
+        elif filter_type in ('Completed', 'Missed') and self.category_ids[filter_type]:
+            mask = category == self.category_ids[filter_type]
+        else:
+            mask = np.ones(len(due), dtype=bool)
+
+        ids = columns["task_id"][mask]
+        due = due[mask]
+        if filter_type in ('Completed', 'Missed'):
+            # due_date DESC; NULLs come last in SQLite's descending order
+            order = np.argsort(np.where(due == NO_DUE_DATE, NO_DUE_DATE, -due.astype(np.int64)), kind="stable")
+        else:
+            # NULL due dates last, then due date, then priority level
+            order = np.lexsort((columns["priority"][mask], due))
+        return ids[order].tolist()
+
+    def stats(self):
+        return {
+            "users": len(self._users),
+            "tasks": sum(len(c["task_id"]) for c in self._users.values()),
+            "bytes": sum(a.nbytes for c in self._users.values() for a in c.values()),
+        }
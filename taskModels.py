@@ -0,0 +1,83 @@
+class TreeviewModel:
+    """Feeds a ttk.Treeview from a paged row source instead of inserting everything up front.
+
+    fetch_page(after, limit) returns up to limit raw rows that sort after
+    the key `after` (None for the first page), and key(row) returns a row's
+    sort key. Paging by key instead of OFFSET lets each page be a range scan
+    of an index, so scrolling to the end of 100k rows never re-sorts and
+    skips the rows already shown. transform(row) turns a row into
+    (task_id, values, tags), or None to skip it. Only the first page is
+    inserted when the rows are set; further pages are inserted when the
+    view is scrolled near its end, so opening a view costs the same for 100
+    rows as for 100k.
+
+    No cursor is kept open between pages, so a paged view never holds a
+    read lock that would block other connections from writing.
+    """
+
+    PAGE_SIZE = 200
+    FETCH_THRESHOLD = 0.9  # Fetch the next page when the view shows past this fraction
+
+    def __init__(self, tree, task_ids=None, page_size=None):
+        self.tree = tree
+        self.page_size = page_size or self.PAGE_SIZE
+        # item_id -> task_id; may be a dict shared by several trees
+        self.task_ids = task_ids if task_ids is not None else {}
+        self._fetch_page = None
+        self._transform = None
+        self._key = None
+        self._last_key = None
+        self._exhausted = True
+        self._fetch_job = None
+
+        # Wrap the scrollbar callback so scrolling near the end pages in more rows
+        self._yscrollcommand = tree.cget("yscrollcommand")
+        tree.configure(yscrollcommand=self._on_yscroll)
+
+    def set_rows(self, fetch_page, transform, key):
+        """Replace the tree contents with a new row source and show its first page."""
+        self.clear()
+        self._fetch_page = fetch_page
+        self._transform = transform
+        self._key = key
+        self._exhausted = False
+        self.fetch_more()
+
+    def clear(self):
+        children = self.tree.get_children()
+        for item_id in children:
+            self.task_ids.pop(item_id, None)
+        if children:
+            self.tree.delete(*children)  # One Tcl call instead of one per row
+        self._last_key = None
+        self._exhausted = True
+
+    def can_fetch_more(self):
+        return not self._exhausted
+
+    def fetch_more(self):
+        """Insert the next page; skipped rows do not count towards it."""
+        self._fetch_job = None
+        inserted = 0
+        while inserted < self.page_size and not self._exhausted:
+            rows = self._fetch_page(self._last_key, self.page_size)
+            if rows:
+                self._last_key = self._key(rows[-1])
+            if len(rows) < self.page_size:
+                self._exhausted = True
+            for row in rows:
+                item = self._transform(row)
+                if item is None:
+                    continue
+                task_id, values, tags = item
+                item_id = self.tree.insert("", "end", values=values, tags=tags)
+                self.task_ids[item_id] = task_id
+                inserted += 1
+        return inserted
+
+    def _on_yscroll(self, first, last):
+        if self._yscrollcommand:
+            self.tree.tk.call(self._yscrollcommand, first, last)
+        # Also true for a first page that does not fill the view
+        if float(last) >= self.FETCH_THRESHOLD and not self._exhausted and self._fetch_job is None:
+            self._fetch_job = self.tree.after_idle(self.fetch_more)
@@ -0,0 +1,168 @@
+from datetime import date
+
+
+# Kept free of numpy: the UI imports this module at startup, taskIndex only when enabled
+_EPOCH = date(1970, 1, 1)
+NO_DUE_DATE = 2**31 - 1  # Sorts after every real date, like NULL in "NULLs last"
+
+
+def day_ordinal(value):
+    """Return days since 1970-01-01 for a date or 'YYYY-MM-DD' string, or NO_DUE_DATE."""
+    if not value:
+        return NO_DUE_DATE
+    if isinstance(value, str):
+        try:
+            value = date.fromisoformat(value)
+        except ValueError:
+            return NO_DUE_DATE
+    return (value - _EPOCH).days
+
+
+class _Codes:
+    """Interns a repeated column value (category, priority, ...) as a small int code."""
+
+    def __init__(self):
+        self.codes = {}
+        self.names = []
+
+    def code(self, name):
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+CATEGORIES = _Codes()
+PRIORITIES = _Codes()
+PATTERNS = _Codes()
+STATUSES = _Codes()
+
+
+class Task:
+    """One get_tasks/get_task_by_id row without a per-row __dict__.
+
+    Unpacks and indexes like the (task_id, title, description, priority,
+    due_date, category_name) tuple it replaces. due_day is the due date as
+    a day ordinal (see day_ordinal), so callers can compare dates
+    without parsing them again; category and priority are kept as codes.
+
+    Read-only: the get_tasks cache hands the same records to every caller,
+    so setting an attribute raises AttributeError like a tuple would.
+    """
+
+    __slots__ = ("task_id", "title", "description", "due_date", "due_day", "category_code", "priority_code")
+
+    def __init__(self, task_id, title, description, priority, due_date, category_name):
+        init = object.__setattr__
+        init(self, "task_id", task_id)
+        init(self, "title", title)
+        init(self, "description", description)
+        init(self, "priority_code", PRIORITIES.code(priority))
+        init(self, "due_date", due_date)
+        init(self, "due_day", day_ordinal(due_date))
+        init(self, "category_code", CATEGORIES.code(category_name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Task records are read-only; cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Task records are read-only; cannot delete {name!r}")
+
+    @classmethod
+    def from_row(cls, cursor, row):
+        """sqlite3 row_factory."""
+        return cls(*row)
+
+    @property
+    def priority(self):
+        return PRIORITIES.names[self.priority_code]
+
+    @property
+    def category(self):
+        return CATEGORIES.names[self.category_code]
+
+    def astuple(self):
+        return (self.task_id, self.title, self.description, self.priority, self.due_date, self.category)
+
+    def __iter__(self):
+        return iter(self.astuple())
+
+    def __getitem__(self, index):
+        return self.astuple()[index]
+
+    def __len__(self):
+        return 6
+
+    def __eq__(self, other):
+        if isinstance(other, (Task, tuple)):
+            return self.astuple() == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Task{self.astuple()!r}"
+
+
+class RecurringTask:
+    """One get_recurring_tasks row without a per-row __dict__.
+
+    Unpacks like the (rtask_id, title, description, start_date,
+    recurrence_pattern, last_completed_date, status) tuple it replaces,
+    with start_day and last_completed_day as day ordinals.
+    """
+
+    __slots__ = ("rtask_id", "title", "description", "start_date", "start_day",
+                 "last_completed_date", "last_completed_day", "pattern_code", "status_code")
+
+    def __init__(self, rtask_id, title, description, start_date, recurrence_pattern, last_completed_date, status):
+        self.rtask_id = rtask_id
+        self.title = title
+        self.description = description
+        self.start_date = start_date
+        self.start_day = day_ordinal(start_date)
+        self.pattern_code = PATTERNS.code(recurrence_pattern)
+        self.last_completed_date = last_completed_date
+        self.last_completed_day = day_ordinal(last_completed_date)
+        self.status_code = STATUSES.code(status)
+
+    @classmethod
+    def from_row(cls, cursor, row):
+        """sqlite3 row_factory."""
+        return cls(*row)
+
+    @property
+    def recurrence_pattern(self):
+        return PATTERNS.names[self.pattern_code]
+
+    @property
+    def status(self):
+        return STATUSES.names[self.status_code]
+
+    @status.setter
+    def status(self, status):
+        self.status_code = STATUSES.code(status)
+
+    def astuple(self):
+        return (self.rtask_id, self.title, self.description, self.start_date,
+                self.recurrence_pattern, self.last_completed_date, self.status)
+
+    def __iter__(self):
+        return iter(self.astuple())
+
+    def __getitem__(self, index):
+        return self.astuple()[index]
+
+    def __len__(self):
+        return 7
+
+    def __eq__(self, other):
+        if isinstance(other, (RecurringTask, tuple)):
+            return self.astuple() == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"RecurringTask{self.astuple()!r}"
@@ -6,19 +6,44 @@ import tkinter.messagebox
 from tkcalendar import Calendar #install sa bash yung tkcalendar "pip install tkcalendar"
 from datetime import datetime, timedelta
 import babel.numbers
+from bisect import insort
+from taskModels import TreeviewModel
 
 dbName = "timePlanDB.db"
 
+# callbacks(old_rows, new_rows) run after every task write, see AddTaskListener
+_taskListeners = []
+
 def Connect():
     conn = sqlite3.connect(dbName)
     return conn
 
+def AddTaskListener(callback):
+    # old_rows/new_rows are the (rowid, user_id, category_id, due_date, title)
+    # rows before and after the write; both are None after a bulk update
+    _taskListeners.append(callback)
+
+def RemoveTaskListener(callback):
+    if callback in _taskListeners:
+        _taskListeners.remove(callback)
+
+def _NotifyTasksChanged(old_rows=None, new_rows=None):
+    for callback in list(_taskListeners):
+        callback(old_rows, new_rows)
+
+def _SnapshotTasks(cursor, where, params):
+    cursor.execute(f'SELECT rowid, user_id, category_id, due_date, title FROM tasks WHERE {where}', params)
+    return cursor.fetchall()
+
+# Sort order of the task trees: urgent first, then by due date (none first)
+TASK_PAGE_ORDER = "priority_rank, due_key, id"
+
 def CheckAndUpdateSchema():
     conn = Connect()
     cursor = conn.cursor()
     
-    # get current columns in the tasks table
-    cursor.execute("PRAGMA table_info(tasks)")
+    # get current columns in the tasks table (xinfo also lists generated columns)
+    cursor.execute("PRAGMA table_xinfo(tasks)")
     columns = cursor.fetchall()
     column_names = [col[1] for col in columns]
     
@@ -26,6 +51,17 @@ def CheckAndUpdateSchema():
     if 'recurrence_pattern' not in column_names:
         cursor.execute('ALTER TABLE tasks ADD COLUMN recurrence_pattern TEXT')
         conn.commit()
+
+    # sort key columns of the task trees, indexed so each page is a range scan
+    if 'priority_rank' not in column_names:
+        cursor.execute("ALTER TABLE tasks ADD COLUMN priority_rank INTEGER GENERATED ALWAYS AS (CASE WHEN priority = 'Urgent' THEN 1 ELSE 2 END) VIRTUAL")
+        conn.commit()
+    if 'due_key' not in column_names:
+        cursor.execute("ALTER TABLE tasks ADD COLUMN due_key TEXT GENERATED ALWAYS AS (IFNULL(due_date, '')) VIRTUAL")
+        conn.commit()
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS tasks_page_order ON tasks (user_id, {TASK_PAGE_ORDER})")
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS tasks_category_page_order ON tasks (user_id, category_id, {TASK_PAGE_ORDER})")
+    conn.commit()
     
     conn.close()
 
@@ -58,6 +94,10 @@ def CreateTable():
     # check and update schema if needed
     CheckAndUpdateSchema()
 
+def TaskPageKey(row):
+    # Sort key of a task tree row (id, title, description, due_date, category_id, priority, ...)
+    return (1 if row[5] == 'Urgent' else 2, row[3] or '', row[0])
+
 def AddTask(title, description, category_id, priority, dueDate, isRecurring, user_id, recurrence_pattern=None):
     print(f"Adding task to database: Title={title}, CategoryID={category_id}, Priority={priority}")
     conn = Connect()
@@ -68,6 +108,7 @@ def AddTask(title, description, category_id, priority, dueDate, isRecurring, use
             last_completed_date, user_id, recurrence_pattern
         ) VALUES (?, ?, ?, ?, ?, ?, NULL, ?, ?)''', 
             (title, description, category_id, priority, dueDate, isRecurring, user_id, recurrence_pattern))
+        new_rows = _SnapshotTasks(cursor, 'rowid = ?', (cursor.lastrowid,))
         conn.commit()
         print("Task added successfully to database")
     except Exception as e:
@@ -75,6 +116,7 @@ def AddTask(title, description, category_id, priority, dueDate, isRecurring, use
         raise e
     finally:
         conn.close()
+    _NotifyTasksChanged([], new_rows)
 
 def GetTasksFiltered(user_id, category_filter=None, priority_filter=None):
     conn = Connect()
@@ -108,9 +150,11 @@ def GetTasksFiltered(user_id, category_filter=None, priority_filter=None):
 def DeleteTask(taskId, user_id):
     conn = Connect()
     cursor = conn.cursor()
+    old_rows = _SnapshotTasks(cursor, 'task_id = ? AND user_id = ?', (taskId, user_id))
     cursor.execute('DELETE FROM tasks WHERE task_id = ? AND user_id = ?', (taskId, user_id))
     conn.commit()
     conn.close()
+    _NotifyTasksChanged(old_rows, [])
 
 def UpdateTask(taskId, **kwargs):
     conn = Connect()
@@ -118,9 +162,12 @@ def UpdateTask(taskId, **kwargs):
     fields = ', '.join([f"{key}=?" for key in kwargs])
     values = list(kwargs.values())
     values.append(taskId)
+    old_rows = _SnapshotTasks(cursor, 'task_id = ?', (taskId,))
     cursor.execute(f'UPDATE tasks SET {fields} WHERE task_id = ?', values)
+    new_rows = _SnapshotTasks(cursor, 'task_id = ?', (taskId,))
     conn.commit()
     conn.close()
+    _NotifyTasksChanged(old_rows, new_rows)
 
 def CreateUserTable():
     conn = Connect()
@@ -168,17 +215,24 @@ def UpdateTaskStatus(taskId, new_status):
     result = cursor.fetchone()
     if result:
         category_id = result[0]
+        old_rows = _SnapshotTasks(cursor, 'task_id = ?', (taskId,))
         cursor.execute('UPDATE tasks SET category_id = ? WHERE task_id = ?', (category_id, taskId))
+        new_rows = _SnapshotTasks(cursor, 'task_id = ?', (taskId,))
         conn.commit()
+        conn.close()
+        _NotifyTasksChanged(old_rows, new_rows)
+        return
     conn.close()
 
 def MarkRecurringTaskComplete(taskId):
     conn = Connect()
     cursor = conn.cursor()
     today = cursor.execute("SELECT date('now', 'localtime')").fetchone()[0]
+    old_rows = _SnapshotTasks(cursor, 'task_id = ?', (taskId,))
     cursor.execute('UPDATE tasks SET last_completed_date = ? WHERE task_id = ?', (today, taskId))
     conn.commit()
     conn.close()
+    _NotifyTasksChanged(old_rows, old_rows)  # Dashboard fields are unchanged
 
 def UpdateMissedTasks(user_id):
     conn = Connect()
@@ -200,8 +254,76 @@ def UpdateMissedTasks(user_id):
             AND due_date != ''
         ''', (missed_category_id, user_id))
         conn.commit()
+        if cursor.rowcount:
+            conn.close()
+            _NotifyTasksChanged()  # Bulk update: listeners reload
+            return
     conn.close()
 
+class DashboardStats:
+    """Per-user dashboard numbers, kept current from task change notifications.
+
+    Category counts and the sorted list of upcoming on-going tasks are loaded
+    once; after that each task write only adjusts the rows it touched, so
+    reading the totals and the next five tasks does not query the database.
+    """
+
+    UPCOMING_LIMIT = 5
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.counts = {}  # category_id -> number of tasks
+        self.upcoming = []  # sorted (due_date, rowid, title) of on-going tasks
+        self.category_ids = {}
+        self.reload()
+
+    def reload(self):
+        conn = Connect()
+        cursor = conn.cursor()
+        cursor.execute("SELECT category_name, category_id FROM task_category WHERE category_name IN ('On-going', 'Done', 'Missed')")
+        self.category_ids = dict(cursor.fetchall())
+        cursor.execute('SELECT category_id, COUNT(*) FROM tasks WHERE user_id = ? GROUP BY category_id', (self.user_id,))
+        self.counts = dict(cursor.fetchall())
+        cursor.execute('''
+            SELECT due_date, rowid, title FROM tasks
+            WHERE user_id = ? AND category_id = ? AND due_date >= date('now', 'localtime')
+            ORDER BY due_date, rowid
+        ''', (self.user_id, self.category_ids.get('On-going')))
+        self.upcoming = cursor.fetchall()
+        conn.close()
+
+    def apply(self, old_rows, new_rows):
+        """Update the numbers from the rows a write changed; (None, None) means reload."""
+        if old_rows is None and new_rows is None:
+            self.reload()
+            return
+        ongoing_id = self.category_ids.get('On-going')
+        for rowid, user_id, category_id, due_date, title in old_rows:
+            if user_id != self.user_id:
+                continue
+            self.counts[category_id] = self.counts.get(category_id, 1) - 1
+            if category_id == ongoing_id and (due_date, rowid, title) in self.upcoming:
+                self.upcoming.remove((due_date, rowid, title))
+        today = datetime.now().strftime('%Y-%m-%d')
+        for rowid, user_id, category_id, due_date, title in new_rows:
+            if user_id != self.user_id:
+                continue
+            self.counts[category_id] = self.counts.get(category_id, 0) + 1
+            if category_id == ongoing_id and due_date and due_date >= today:
+                insort(self.upcoming, (due_date, rowid, title))
+
+    def totals(self):
+        """Return (total, on-going, done, missed) task counts."""
+        count = lambda name: self.counts.get(self.category_ids.get(name), 0)
+        return sum(self.counts.values()), count('On-going'), count('Done'), count('Missed')
+
+    def next_upcoming(self):
+        """Return up to UPCOMING_LIMIT (title, due_date, day) tuples, soonest first."""
+        today = datetime.now().strftime('%Y-%m-%d')
+        while self.upcoming and self.upcoming[0][0] < today:
+            self.upcoming.pop(0)  # Due date passed since it was loaded
+        return [(title, due_date, due_date[8:10]) for due_date, rowid, title in self.upcoming[:self.UPCOMING_LIMIT]]
+
 class LoginWindow(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -342,6 +464,12 @@ class TimePlanApp(tk.Tk):
 
         CreateTable()
         UpdateMissedTasks(self.user_id)
+
+        # dashboard numbers are updated from task write notifications, not polled
+        self.dashboard_stats = DashboardStats(self.user_id)
+        self._dashboard_job = None
+        AddTaskListener(self._on_tasks_changed)
+        self._schedule_midnight_refresh()
         
         # configure styles
         style = ttk.Style()
@@ -467,6 +595,8 @@ class TimePlanApp(tk.Tk):
                                           font=("Arial", 14, "bold"), bg="white",
                                           padx=10, pady=10)
         self.progress_frame.pack(fill="x", pady=(0, 20))
+        self.progress_labels = [self.progress_circle(self.progress_frame, label, 0)
+                                for label in ("ON-GOING", "DONE", "MISSED")]
 
         # calendar Section
         calendar_frame = tk.LabelFrame(main_frame, text="Calendar", 
@@ -488,6 +618,11 @@ class TimePlanApp(tk.Tk):
                                           padx=10, pady=10)
         self.upcoming_frame.pack(fill="x")
 
+        # fixed slots for the upcoming tasks; update_dashboard fills or hides them
+        colors = ["#8b3ffc", "#d3a8f9"]  # Alternate colors
+        self.upcoming_slots = [self.schedule_box(self.upcoming_frame, "", "", "", colors[i % len(colors)])
+                               for i in range(DashboardStats.UPCOMING_LIMIT)]
+
         return dashboard_frame
 
     def create_task_view(self):
@@ -711,6 +846,10 @@ class TimePlanApp(tk.Tk):
         self.recurring_tab.add(self.monthly_tab, text="Monthly")
         self.recurring_tab.add(self.annual_tab, text="Annually")
 
+        # initialize task IDs dictionary, shared by the models of all trees
+        self.task_ids = {}
+        self.tree_models = {}  # treeview -> TreeviewModel
+
         # create treeviews for each tab
         self.create_tab_treeview(self.all_tasks_tab, "All")
         self.create_tab_treeview(self.ongoing_tab, "On-going")
@@ -718,9 +857,6 @@ class TimePlanApp(tk.Tk):
         self.create_tab_treeview(self.missed_tab, "Missed")
         self.create_tab_treeview(self.done_tab, "Done")
 
-        # initialize task IDs dictionary
-        self.task_ids = {}
-
         # bind tab change event
         self.task_notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
@@ -769,6 +905,7 @@ class TimePlanApp(tk.Tk):
 
             # store tree reference
             self.recurring_trees[pattern] = tree
+            self.tree_models[tree] = TreeviewModel(tree, self.task_ids)
 
             # add action buttons
             action_frame = ttk.Frame(tab)
@@ -800,207 +937,170 @@ class TimePlanApp(tk.Tk):
                     btn.configure(bg="white", fg="black")
 
         try:
-            # clear all trees first
-            for category in ["ongoing", "missed", "done"]:
-                tree = getattr(self, f"{category}_tree")
-                if tree and tree.winfo_exists():
-                    for item in tree.get_children():
-                        tree.delete(item)
-            
-            # clear recurring trees
-            for tree in self.recurring_trees.values():
-                if tree and tree.winfo_exists():
-                    for item in tree.get_children():
-                        tree.delete(item)
-
-            # clear all tasks tree
-            if self.all_tasks_tree and self.all_tasks_tree.winfo_exists():
-                for item in self.all_tasks_tree.get_children():
-                    self.all_tasks_tree.delete(item)
-
             # update missed tasks
             UpdateMissedTasks(self.user_id)
-            
-            # get tasks - always get tasks for the selected date
-            conn = Connect()
-            cursor = conn.cursor()
-            
+
+            # Recurring tasks are matched in SQL, then checked against the date in Python
             if selected_date is not None:
-                cursor.execute('''
-                    SELECT 
-                        id, title, description, due_date, category_id, priority, 
-                        last_completed_date, recurrence_pattern,
-                        date('now', 'localtime') as today
-                    FROM tasks 
-                    WHERE user_id = ? 
-                    AND (
-                        date(due_date) = date(?) 
-                        OR (
-                            category_id IN (
-                                SELECT category_id FROM task_category WHERE category_name = 'Recurring'
-                            ) 
-                            AND recurrence_pattern IS NOT NULL
+                where = '''
+                    date(due_date) = date(?)
+                    OR (
+                        category_id IN (
+                            SELECT category_id FROM task_category WHERE category_name = 'Recurring'
                         )
+                        AND recurrence_pattern IS NOT NULL
                     )
-                    ORDER BY 
-                        CASE 
-                            WHEN priority = 'Urgent' THEN 1 
-                            ELSE 2 
-                        END,
-                        due_date ASC
-                ''', (self.user_id, selected_date.strftime("%Y-%m-%d")))
+                '''
+                params = (selected_date.strftime("%Y-%m-%d"),)
+                selected_day = selected_date.date() if isinstance(selected_date, datetime) else selected_date
             else:
                 # If no date selected, show today's tasks
-                today = datetime.now()
-                cursor.execute('''
-                    SELECT 
-                        id, title, description, due_date, category_id, priority, 
-                        last_completed_date, recurrence_pattern,
-                        date('now', 'localtime') as today
-                    FROM tasks 
-                    WHERE user_id = ? 
-                    AND (date(due_date) = date('now', 'localtime') OR category_id IN (SELECT category_id FROM task_category WHERE category_name = 'Recurring'))
-                    ORDER BY 
-                        CASE 
-                            WHEN priority = 'Urgent' THEN 1 
-                            ELSE 2 
-                        END,
-                        due_date ASC
-                ''', (self.user_id,))
-            
-            tasks = cursor.fetchall()
-            conn.close()
-
-            # clear task IDs dictionary
-            self.task_ids.clear()
-
-            # Get current date for comparisons
-            current_date = datetime.now().date()
-            selected_datetime = selected_date.date() if isinstance(selected_date, datetime) else selected_date
+                where = "date(due_date) = date('now', 'localtime') OR category_id IN (SELECT category_id FROM task_category WHERE category_name = 'Recurring')"
+                params = ()
+                selected_day = datetime.now().date()
 
-            # process tasks for each category
-            for task in tasks:
-                task_id, title, desc, date, category_id, priority, last_completed, pattern, today = task
-                
-                # For recurring tasks, check if they actually occur on the selected date
-                if category_id in [3] and pattern:  # 3 is the ID for 'Recurring'
-                    task_date = datetime.strptime(date, '%Y-%m-%d').date()
-                    temp_date = task_date
-                    is_on_date = False
-                    
-                    # Check if this recurring task occurs on the selected date
-                    while temp_date <= selected_datetime:
-                        if temp_date == selected_datetime:
-                            is_on_date = True
-                            break
-                            
-                        # Calculate next occurrence based on pattern
-                        if pattern == "Daily":
-                            temp_date += timedelta(days=1)
-                        elif pattern == "Weekly":
-                            temp_date += timedelta(days=7)
-                        elif pattern == "Monthly":
-                            # Handle month rollover
-                            year = temp_date.year + (temp_date.month // 12)
-                            month = (temp_date.month % 12) + 1
-                            try:
-                                temp_date = temp_date.replace(year=year, month=month)
-                            except ValueError:
-                                if month == 2 and temp_date.day > 28:
-                                    temp_date = temp_date.replace(year=year, month=month, day=28)
-                                else:
-                                    if month == 12:
-                                        next_month = datetime(year + 1, 1, 1)
-                                    else:
-                                        next_month = datetime(year, month + 1, 1)
-                                    last_day = (next_month - timedelta(days=1)).day
-                                    temp_date = temp_date.replace(year=year, month=month, day=last_day)
-                        elif pattern == "Annually":
-                            try:
-                                temp_date = temp_date.replace(year=temp_date.year + 1)
-                            except ValueError:
-                                temp_date = temp_date.replace(year=temp_date.year + 1, month=2, day=28)
-                    
-                    # Only add the task if it occurs on the selected date
-                    if not is_on_date:
-                        continue
-                
-                # Add to All Tasks tab
-                if self.all_tasks_tree:
-                    status = ""
-                    if category_id == 2:  # 2 is the ID for 'On-going'
-                        status = "🔔 Active" if priority == "Urgent" else "📝 Active"
-                    elif category_id == 3:  # 3 is the ID for 'Recurring'
-                        status = "✅ Done Today" if last_completed == today else "⏳ Pending"
-                    elif category_id == 4:  # 4 is the ID for 'Missed'
-                        status = "❌ Missed"
-                    elif category_id == 5:  # 5 is the ID for 'Done'
-                        status = "✅ Completed"
-                    
-                    values = (title, date, category_id, 
-                             f"⚡ {priority}" if priority else "", 
-                             status)
-                    item_id = self.all_tasks_tree.insert("", tk.END, values=values)
-                    
-                    # Apply appropriate tag
-                    if category_id == 5:
-                        self.all_tasks_tree.item(item_id, tags=('completed',))
-                    elif category_id == 4:
-                        self.all_tasks_tree.item(item_id, tags=('missed',))
-                    elif category_id == 3:
-                        self.all_tasks_tree.item(item_id, tags=('recurring',))
-                    elif priority == "Urgent":
-                        self.all_tasks_tree.item(item_id, tags=('urgent',))
-                    
-                    self.task_ids[item_id] = task_id
-
-                if category_id == 2:  # 2 is the ID for 'On-going'
-                    tree = self.ongoing_tree
-                    status = "🔔 Active" if priority == "Urgent" else "📝 Active"
-                    values = (title, date, f"⚡ {priority}" if priority else "", status)
-                    item_id = tree.insert("", tk.END, values=values)
-                    if priority == "Urgent":
-                        tree.item(item_id, tags=('urgent',))
-                    self.task_ids[item_id] = task_id
-                
-                elif category_id == 3:  # 3 is the ID for 'Recurring'
-                    # skip if no pattern is set
-                    if not pattern:
-                        continue
-                        
-                    # get the appropriate tree for this pattern
-                    tree = self.recurring_trees.get(pattern)
-                    if not tree:
-                        continue
-
-                    # For all tasks view, just show the recurring task with its base date
-                    status = "✅ Done Today" if last_completed == today else "⏳ Pending"
-                    values = (title, date, status)
-                    item_id = tree.insert("", tk.END, values=values)
-                    if last_completed == today:
-                        tree.item(item_id, tags=('completed',))
-                    else:
-                        tree.item(item_id, tags=('pending',))
-                    self.task_ids[item_id] = task_id
-                
-                elif category_id == 4:  # 4 is the ID for 'Missed'
-                    tree = self.missed_tree
-                    values = (title, date, "❌ Missed")
-                    item_id = tree.insert("", tk.END, values=values)
-                    tree.item(item_id, tags=('missed',))
-                    self.task_ids[item_id] = task_id
-                
-                elif category_id == 5:  # 5 is the ID for 'Done'
-                    tree = self.done_tree
-                    values = (title, date, "✅ Completed")
-                    item_id = tree.insert("", tk.END, values=values)
-                    tree.item(item_id, tags=('completed',))
-                    self.task_ids[item_id] = task_id
+            self._load_task_trees(where, params, keep=lambda row: self._occurs_on(row, selected_day))
 
         except Exception as e:
             print(f"Error filtering tasks: {str(e)}")
             tkinter.messagebox.showerror("Error", f"Failed to filter tasks: {str(e)}")
 
+    def _load_task_trees(self, where, params, keep=None):
+        # Each tree pages in its own rows; only the first page of each is queried here
+        select = '''
+            SELECT
+                id, title, description, due_date, category_id, priority,
+                last_completed_date, recurrence_pattern,
+                date('now', 'localtime') as today
+            FROM tasks
+            WHERE user_id = ? AND ({where}) {extra} {after}
+            ORDER BY {order}
+            LIMIT ?
+        '''
+        sources = [
+            (self.all_tasks_tree, "", (), self._all_tasks_item),
+            (self.ongoing_tree, "AND category_id = 2", (), self._ongoing_item),  # 2 is the ID for 'On-going'
+            (self.missed_tree, "AND category_id = 4", (), self._missed_item),    # 4 is the ID for 'Missed'
+            (self.done_tree, "AND category_id = 5", (), self._done_item),        # 5 is the ID for 'Done'
+        ]
+        for pattern, tree in self.recurring_trees.items():
+            # 3 is the ID for 'Recurring'
+            sources.append((tree, "AND category_id = 3 AND recurrence_pattern = ?", (pattern,), self._recurring_item))
+
+        for tree, extra, extra_params, make_item in sources:
+            if not (tree and tree.winfo_exists()):
+                continue
+            first_query = select.format(where=where, extra=extra, after="", order=TASK_PAGE_ORDER)
+            next_query = select.format(where=where, extra=extra, order=TASK_PAGE_ORDER,
+                                       after=f"AND ({TASK_PAGE_ORDER}) > (?, ?, ?)")
+            args = (self.user_id, *params, *extra_params)
+
+            def fetch_page(after, limit, first_query=first_query, next_query=next_query, args=args):
+                conn = Connect()
+                try:
+                    if after is None:
+                        return conn.execute(first_query, (*args, limit)).fetchall()
+                    return conn.execute(next_query, (*args, *after, limit)).fetchall()
+                finally:
+                    conn.close()
+
+            def transform(row, make_item=make_item):
+                if keep is not None and not keep(row):
+                    return None
+                return make_item(row)
+
+            self.tree_models[tree].set_rows(fetch_page, transform, TaskPageKey)
+
+    def _occurs_on(self, row, selected_day):
+        # For recurring tasks, check if they actually occur on the selected date
+        task_id, title, desc, date, category_id, priority, last_completed, pattern, today = row
+        if category_id not in [3] or not pattern:  # 3 is the ID for 'Recurring'
+            return True
+
+        temp_date = datetime.strptime(date, '%Y-%m-%d').date()
+        while temp_date <= selected_day:
+            if temp_date == selected_day:
+                return True
+
+            # Calculate next occurrence based on pattern
+            if pattern == "Daily":
+                temp_date += timedelta(days=1)
+            elif pattern == "Weekly":
+                temp_date += timedelta(days=7)
+            elif pattern == "Monthly":
+                # Handle month rollover
+                year = temp_date.year + (temp_date.month // 12)
+                month = (temp_date.month % 12) + 1
+                try:
+                    temp_date = temp_date.replace(year=year, month=month)
+                except ValueError:
+                    if month == 2 and temp_date.day > 28:
+                        temp_date = temp_date.replace(year=year, month=month, day=28)
+                    else:
+                        if month == 12:
+                            next_month = datetime(year + 1, 1, 1)
+                        else:
+                            next_month = datetime(year, month + 1, 1)
+                        last_day = (next_month - timedelta(days=1)).day
+                        temp_date = temp_date.replace(year=year, month=month, day=last_day)
+            elif pattern == "Annually":
+                try:
+                    temp_date = temp_date.replace(year=temp_date.year + 1)
+                except ValueError:
+                    temp_date = temp_date.replace(year=temp_date.year + 1, month=2, day=28)
+            else:
+                return False
+        return False
+
+    # Turn a task row into (task_id, values, tags) for each kind of tree
+    def _all_tasks_item(self, row):
+        task_id, title, desc, date, category_id, priority, last_completed, pattern, today = row
+        status = ""
+        if category_id == 2:  # 2 is the ID for 'On-going'
+            status = "🔔 Active" if priority == "Urgent" else "📝 Active"
+        elif category_id == 3:  # 3 is the ID for 'Recurring'
+            status = "✅ Done Today" if last_completed == today else "⏳ Pending"
+        elif category_id == 4:  # 4 is the ID for 'Missed'
+            status = "❌ Missed"
+        elif category_id == 5:  # 5 is the ID for 'Done'
+            status = "✅ Completed"
+
+        # Apply appropriate tag
+        tags = ()
+        if category_id == 5:
+            tags = ('completed',)
+        elif category_id == 4:
+            tags = ('overdue',)
+        elif category_id == 3:
+            tags = ('recurring',)
+        elif priority == "Urgent":
+            tags = ('urgent',)
+
+        values = (title, date, category_id,
+                  f"⚡ {priority}" if priority else "",
+                  status)
+        return task_id, values, tags
+
+    def _ongoing_item(self, row):
+        task_id, title, desc, date, category_id, priority, last_completed, pattern, today = row
+        status = "🔔 Active" if priority == "Urgent" else "📝 Active"
+        values = (title, date, f"⚡ {priority}" if priority else "", status)
+        return task_id, values, ('urgent',) if priority == "Urgent" else ()
+
+    def _recurring_item(self, row):
+        task_id, title, desc, date, category_id, priority, last_completed, pattern, today = row
+        status = "✅ Done Today" if last_completed == today else "⏳ Pending"
+        tags = ('completed',) if last_completed == today else ('pending',)
+        return task_id, (title, date, status), tags
+
+    def _missed_item(self, row):
+        task_id, title, desc, date, category_id, priority, last_completed, pattern, today = row
+        return task_id, (title, date, "❌ Missed"), ('overdue',)
+
+    def _done_item(self, row):
+        task_id, title, desc, date, category_id, priority, last_completed, pattern, today = row
+        return task_id, (title, date, "✅ Completed"), ('completed',)
+
     def create_tab_treeview(self, tab, category):
         # Create a frame for the treeview and its scrollbar
         tree_frame = ttk.Frame(tab)
@@ -1048,6 +1148,8 @@ class TimePlanApp(tk.Tk):
         tree.tag_configure('urgent', background='#fff3e0')     # light orange
         tree.tag_configure('recurring', background='#e3f2fd')  # light blue
 
+        self.tree_models[tree] = TreeviewModel(tree, self.task_ids)
+
         # store tree reference with correct name
         if category == "All":
             self.all_tasks_tree = tree
@@ -1212,89 +1314,77 @@ class TimePlanApp(tk.Tk):
         if tkinter.messagebox.askyesno("Exit", "Are you sure you want to exit the application?"):
             self.destroy()
 
+    def destroy(self):
+        RemoveTaskListener(self._on_tasks_changed)
+        super().destroy()
+
+    def _on_tasks_changed(self, old_rows, new_rows):
+        self.dashboard_stats.apply(old_rows, new_rows)
+        # several writes in one handler cause a single repaint
+        if self._dashboard_job is None:
+            self._dashboard_job = self.after_idle(self.update_dashboard)
+
+    def _schedule_midnight_refresh(self):
+        # upcoming tasks roll over at local midnight even when nothing is written
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        self.after(int((midnight - now).total_seconds() * 1000) + 1000, self._midnight_refresh)
+
+    def _midnight_refresh(self):
+        self.update_dashboard()
+        self._schedule_midnight_refresh()
+
     def update_dashboard(self):
-        # clear existing widgets
-        for widget in self.progress_frame.winfo_children():
-            widget.destroy()
-        for widget in self.upcoming_frame.winfo_children():
-            widget.destroy()
+        # reads the incrementally kept numbers and updates the widgets in place
+        self._dashboard_job = None
+        if not self.dashboard_view:
+            return
+        total, ongoing, done, missed = self.dashboard_stats.totals()
 
-        # get task statistics
-        conn = Connect()
-        cursor = conn.cursor()
-        
-        # get total tasks
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN category_id = (SELECT category_id FROM task_category WHERE category_name = 'On-going') THEN 1 ELSE 0 END) as ongoing,
-                SUM(CASE WHEN category_id = (SELECT category_id FROM task_category WHERE category_name = 'Done') THEN 1 ELSE 0 END) as done,
-                SUM(CASE WHEN category_id = (SELECT category_id FROM task_category WHERE category_name = 'Missed') THEN 1 ELSE 0 END) as missed
-            FROM tasks 
-            WHERE user_id = ?
-        ''', (self.user_id,))
-        
-        stats = cursor.fetchone()
-        total = stats[0] if stats and stats[0] else 0
-        
         # calculate percentages
-        ongoing_percent = round((stats[1] / total * 100) if stats[1] and total else 0)
-        done_percent = round((stats[2] / total * 100) if stats[2] and total else 0)
-        missed_percent = round((stats[3] / total * 100) if stats[3] and total else 0)
-        
-        # display progress circles
-        self.progress_circle(self.progress_frame, "ON-GOING", ongoing_percent)
-        self.progress_circle(self.progress_frame, "DONE", done_percent)
-        self.progress_circle(self.progress_frame, "MISSED", missed_percent)
-        
-        # get upcoming tasks
-        cursor.execute('''
-            SELECT title, due_date, strftime('%d', due_date) as day
-            FROM tasks 
-            WHERE user_id = ? 
-            AND category_id = (SELECT category_id FROM task_category WHERE category_name = 'On-going')
-            AND due_date >= date('now')
-            ORDER BY due_date
-            LIMIT 5
-        ''', (self.user_id,))
-        
-        upcoming_tasks = cursor.fetchall()
-        
-        # display upcoming tasks
-        colors = ["#8b3ffc", "#d3a8f9"]  # Alternate colors
-        for i, task in enumerate(upcoming_tasks):
-            title, due_date, day = task
-            self.schedule_box(
-                self.upcoming_frame,
-                day,
-                title,
-                due_date,
-                colors[i % len(colors)]
-            )
-            
-        conn.close()
+        ongoing_percent = round((ongoing / total * 100) if ongoing and total else 0)
+        done_percent = round((done / total * 100) if done and total else 0)
+        missed_percent = round((missed / total * 100) if missed and total else 0)
+        for label, percent in zip(self.progress_labels, (ongoing_percent, done_percent, missed_percent)):
+            label.config(text=f"{percent}%")
 
-        # schedule next update
-        self.after(60000, self.update_dashboard)  # Update every minute
+        # display upcoming tasks
+        upcoming_tasks = self.dashboard_stats.next_upcoming()
+        for i, slot in enumerate(self.upcoming_slots):
+            frame, day_label, title_label, time_label = slot
+            if i < len(upcoming_tasks):
+                title, due_date, day = upcoming_tasks[i]
+                day_label.config(text=day)
+                title_label.config(text=title)
+                time_label.config(text=due_date)
+                frame.pack(pady=10, fill="x")
+            else:
+                frame.pack_forget()
 
     def progress_circle(self, frame, label, percent):
         f = tk.Frame(frame, bg="white", bd=1, relief="solid")
         f.pack(side="left", padx=10)
         tk.Label(f, text=label, font=("Arial", 10, "bold"), bg="white").pack(pady=5)
-        tk.Label(f, text=f"{percent}%", font=("Arial", 12, "bold"),
-                bg="white", fg="#8a3ff6").pack(pady=5)
+        percent_label = tk.Label(f, text=f"{percent}%", font=("Arial", 12, "bold"),
+                bg="white", fg="#8a3ff6")
+        percent_label.pack(pady=5)
+        return percent_label
 
     def schedule_box(self, frame, day, title, time, color):
         f = tk.Frame(frame, bg=color, padx=10, pady=10)
         f.pack(pady=10, fill="x")
-        tk.Label(f, text=day, bg=color, fg="white",
-                font=("Arial", 12, "bold")).pack(side="left")
+        day_label = tk.Label(f, text=day, bg=color, fg="white",
+                font=("Arial", 12, "bold"))
+        day_label.pack(side="left")
         details = tk.Frame(f, bg=color)
         details.pack(side="left", padx=10)
-        tk.Label(details, text=title, bg=color, fg="white",
-                font=("Arial", 12, "bold")).pack(anchor="w")
-        tk.Label(details, text=time, bg=color, fg="white",
-                font=("Arial", 10)).pack(anchor="w")
+        title_label = tk.Label(details, text=title, bg=color, fg="white",
+                font=("Arial", 12, "bold"))
+        title_label.pack(anchor="w")
+        time_label = tk.Label(details, text=time, bg=color, fg="white",
+                font=("Arial", 10))
+        time_label.pack(anchor="w")
+        return f, day_label, title_label, time_label
 
     def _on_mousewheel(self, event):
         self.main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -1632,117 +1722,8 @@ class TimePlanApp(tk.Tk):
             btn.configure(bg="white", fg="black")
 
         try:
-            # Clear all trees first
-            for category in ["ongoing", "missed", "done"]:
-                tree = getattr(self, f"{category}_tree")
-                if tree and tree.winfo_exists():
-                    for item in tree.get_children():
-                        tree.delete(item)
-            
-            # Clear recurring trees
-            for tree in self.recurring_trees.values():
-                if tree and tree.winfo_exists():
-                    for item in tree.get_children():
-                        tree.delete(item)
-
-            # Clear all tasks tree
-            if self.all_tasks_tree and self.all_tasks_tree.winfo_exists():
-                for item in self.all_tasks_tree.get_children():
-                    self.all_tasks_tree.delete(item)
-
             # Get all tasks
-            conn = Connect()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT 
-                    id, title, description, due_date, category_id, priority, 
-                    last_completed_date, recurrence_pattern,
-                    date('now', 'localtime') as today
-                FROM tasks 
-                WHERE user_id = ? 
-                ORDER BY 
-                    CASE 
-                        WHEN priority = 'Urgent' THEN 1 
-                        ELSE 2 
-                    END,
-                    due_date ASC
-            ''', (self.user_id,))
-            
-            tasks = cursor.fetchall()
-            conn.close()
-
-            # Clear task IDs dictionary
-            self.task_ids.clear()
-
-            # Process tasks for each category
-            for task in tasks:
-                task_id, title, desc, date, category_id, priority, last_completed, pattern, today = task
-                
-                # Add to All Tasks tab
-                if self.all_tasks_tree:
-                    status = ""
-                    if category_id == 2:  # 2 is the ID for 'On-going'
-                        status = "🔔 Active" if priority == "Urgent" else "📝 Active"
-                    elif category_id == 3:  # 3 is the ID for 'Recurring'
-                        status = "✅ Done Today" if last_completed == today else "⏳ Pending"
-                    elif category_id == 4:  # 4 is the ID for 'Missed'
-                        status = "❌ Missed"
-                    elif category_id == 5:  # 5 is the ID for 'Done'
-                        status = "✅ Completed"
-                    
-                    values = (title, date, category_id, 
-                             f"⚡ {priority}" if priority else "", 
-                             status)
-                    item_id = self.all_tasks_tree.insert("", tk.END, values=values)
-                    
-                    # Apply appropriate tag
-                    if category_id == 5:
-                        self.all_tasks_tree.item(item_id, tags=('completed',))
-                    elif category_id == 4:
-                        self.all_tasks_tree.item(item_id, tags=('overdue',))
-                    elif category_id == 3:
-                        self.all_tasks_tree.item(item_id, tags=('recurring',))
-                    elif priority == "Urgent":
-                        self.all_tasks_tree.item(item_id, tags=('urgent',))
-                    
-                    self.task_ids[item_id] = task_id
-
-                # Add to respective category tabs
-                if category_id == 2:  # 2 is the ID for 'On-going'
-                    tree = self.ongoing_tree
-                    status = "🔔 Active" if priority == "Urgent" else "📝 Active"
-                    values = (title, date, f"⚡ {priority}" if priority else "", status)
-                    item_id = tree.insert("", tk.END, values=values)
-                    if priority == "Urgent":
-                        tree.item(item_id, tags=('urgent',))
-                    self.task_ids[item_id] = task_id
-                
-                elif category_id == 3:  # 3 is the ID for 'Recurring'
-                    tree = self.recurring_trees.get(pattern)
-                    if tree:
-                        status = "✅ Done Today" if last_completed == today else "⏳ Pending"
-                        values = (title, date, status)
-                        item_id = tree.insert("", tk.END, values=values)
-                        if last_completed == today:
-                            tree.item(item_id, tags=('completed',))
-                        else:
-                            tree.item(item_id, tags=('pending',))
-                        self.task_ids[item_id] = task_id
-                
-                elif category_id == 4:  # 4 is the ID for 'Missed'
-                    tree = self.missed_tree
-                    values = (title, date, "❌ Missed")
-                    item_id = tree.insert("", tk.END, values=values)
-                    tree.item(item_id, tags=('overdue',))
-                    self.task_ids[item_id] = task_id
-                
-                elif category_id == 5:  # 5 is the ID for 'Done'
-                    tree = self.done_tree
-                    values = (title, date, "✅ Completed")
-                    item_id = tree.insert("", tk.END, values=values)
-                    tree.item(item_id, tags=('completed',))
-                    self.task_ids[item_id] = task_id
+            self._load_task_trees("1", ())
 
         except Exception as e:
             print(f"Error showing all tasks: {str(e)}")
@@ -1,129 +1,128 @@
+import time
+_MODULE_START = time.perf_counter()  # Start of the startup profile
+
+import argparse
 import customtkinter as ctk
 import os
-from PIL import Image
-from databaseManagement import DatabaseManager
+import tkinter as tk
+from collections import OrderedDict
+from styleRegistry import StyleRegistry
+from iconCache import IconCache
+from perfTools import ActionProfiler, IdleTracker, StartupProfiler, StallWatchdog, tracer, traced
+from renderScheduler import RenderScheduler
+from dbBackup import BackupManager
+from taskRecords import day_ordinal
 from datetime import datetime, timedelta
 import pytz
 from tkinter import messagebox  # <-- Add this import
-from tkinter import ttk  # <-- Add this import for ttk.Button
 
-# Import the calendar widget from tkcalendar
-from tkcalendar import Calendar
+# tkcalendar, ttk, PIL and the database module are imported on first use
+# so that the window shell can appear before they load
+
+_IMPORTS_DONE = time.perf_counter()
 
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
 class TimePlanApp(ctk.CTk):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.title("TimePlan")
-        self.geometry("1200x700")
-        self.configure(bg="#F8F3FB")
+    TASK_DETAIL_CACHE_SIZE = 64
+    TASK_PREFETCH_RADIUS = 2
+    TASK_RENDER_FIRST_BATCH = 25      # Rows painted synchronously, about one screenful
+    TASK_RENDER_FRAME_BUDGET = 0.012  # Seconds of row building per event-loop turn
+    EXTERNAL_CHANGE_POLL_MS = 2000    # How often to look for writes from other processes
+    BACKUP_INTERVAL_HOURS = 24        # Take a background snapshot when the newest is older than this
+    ARCHIVE_HORIZON_DAYS = 90         # Completed/Missed tasks older than this move to the archive
+    ARCHIVE_STEP_MS = 200             # Pause between archive batches so the UI keeps up
+    MAINTENANCE_IDLE_SECONDS = 30     # Database maintenance only runs after this long without input
+    MAINTENANCE_POLL_MS = 5000
+    MAINTENANCE_STEP_MS = 50          # Gap between maintenance steps; idleness is re-checked each time
+
+    def __init__(self, profiler=None, profile_actions=None, **kwargs):
+        self.profiler = profiler if profiler is not None else StartupProfiler()
+
+        with self.profiler.phase("window"):
+            super().__init__(**kwargs)
+            self.title("TimePlan")
+            self.geometry("1200x700")
+            self.configure(bg="#F8F3FB")
+
+            # Shared fonts, colors and images for every widget in the app
+            icon_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".icon_cache")
+            self.styles = StyleRegistry(icon_cache=IconCache(icon_cache_dir))
 
         self.sidebar_expanded = True
         self.sidebar_width = 240
         self.sidebar_collapsed_width = 64
+        self.current_page = None  # Track current page: "tasks", "calendar" or "habit"
         
-        # For task detail pane
+        # For task detail pane (built lazily on the first task click)
         self.selected_task = None
+        self.detail_pane = None
         self.detail_pane_visible = False
         self.detail_pane_width = 340
-        
-        self.db_manager = DatabaseManager()
-        self.current_user_id = 1        # Pre-fetch category IDs
-        self.completed_category_id = self.db_manager.get_category_id_by_name("Completed")
-        self.on_going_category_id = self.db_manager.get_category_id_by_name("On-going") # For un-completing tasks
-        self.missed_category_id = self.db_manager.get_category_id_by_name("Missed") # For past due tasks
-          # Get all category names for task editing
-        self.all_categories = [cat[0] for cat in self.db_manager.get_task_categories()]
-        
-        if not self.completed_category_id:
-            print("ERROR: 'Completed' category not found. Please ensure databaseManagement.py initializes it.")
-        if not self.on_going_category_id:
-            print("ERROR: 'On-going' category not found. Please ensure databaseManagement.py initializes it.")
-        if not self.missed_category_id:
-            print("ERROR: 'Missed' category not found. Please ensure databaseManagement.py initializes it.")
-
-        # Load sidebar icons (rest of the icon loading code)
-        self.icons = {}
-        icon_folder = os.path.join(os.path.dirname(__file__), "icons")
-        icon_files = {
-            "Tasks": "tasks.png", "Calendar": "calendar.png", "Habit": "habit2.png",
-            "Add Task": "addTask.png", "Search Task": "search.png", "Profile": "profile.png",
-            "Sign Out": "signOut.png"
-        }
-        for key, filename in icon_files.items():
-            path = os.path.join(icon_folder, filename)
-            if os.path.exists(path):
-                img = Image.open(path)
-                w, h = img.size
-                side = min(w, h)
-                left = (w - side) // 2
-                top = (h - side) // 2
-                right = left + side
-                bottom = top + side
-                img = img.crop((left, top, right, bottom)).resize((56, 56), Image.LANCZOS)
-                self.icons[key] = ctk.CTkImage(light_image=img, dark_image=img, size=(56, 56))
-            else:
-                print(f"Warning: Sidebar icon not found: {path}")
-                self.icons[key] = None
-
-        self.nav_icons = {}
-        nav_icon_files = {
-            "Today": "today.png", "Next 7 Days": "next7Days.png", "All Tasks": "allTasks.png",
-            "On-going": "onGoing.png", "Completed": "completed.png", "Missed": "missing.png"
-        }
-        icon_size_nav = (40, 40)
-        for key, filename in nav_icon_files.items():
-            path = os.path.join(icon_folder, filename)
-            if os.path.exists(path):
-                img = Image.open(path)
-                w, h = img.size
-                side = min(w, h)
-                left = (w - side) // 2
-                top = (h - side) // 2
-                right = left + side
-                bottom = top + side
-                img = img.crop((left, top, right, bottom))
-                img = img.resize(icon_size_nav, Image.LANCZOS)
-                self.nav_icons[key] = ctk.CTkImage(light_image=img, dark_image=img, size=icon_size_nav)
-            else:
-                print(f"Warning: Navigation icon not found: {path}")
-                self.nav_icons[key] = None
-
-        logo_path = os.path.join(icon_folder, "logoKuno.png")
-        if os.path.exists(logo_path):
-            logo_img = Image.open(logo_path)
-            w, h = logo_img.size
-            side = min(w, h)
-            left = (w - side) // 2
-            top = (h - side) // 2
-            right = left + side
-            bottom = top + side
-            logo_img = logo_img.crop((left, top, right, bottom)).resize((40, 40), Image.LANCZOS)
-            self.logo_image = ctk.CTkImage(light_image=logo_img, dark_image=logo_img, size=(40, 40))
-        else:
-            self.logo_image = None
-
+        self._task_detail_cache = OrderedDict()  # LRU of recently viewed task rows
+        self._prefetch_job = None
+        self.task_list_ids = []  # Task IDs in the order shown by the current list
+
+        # Progressive rendering state for the task list
+        self._task_render_job = None
+        self._task_render_rows = []
+        self._task_render_index = 0
+        self._task_render_context = {}
+
+        # Dialogs and forms are built on first use, then hidden and re-filled
+        self.add_task_fields = None
+        self.edit_task_fields = None
+        self.add_habit_fields = None
+        self.edit_habit_fields = None
+        self._editing_task_id = None
+        self.dialog_open_times = {}  # name -> [(milliseconds, built)]
+
+        # The database is opened after the first paint, see _finish_startup
+        self.db_manager = None
+        self.current_user_id = 1
+        self.watchdog = None  # perfTools.StallWatchdog, see enable_stall_watchdog()
+        # Ctrl+Shift+P profiles the next N actions; --profile-actions N starts it after startup
+        self.action_profiler = ActionProfiler(self, actions=profile_actions or 5)
+        self._profile_after_startup = profile_actions is not None
+
+        # Page refreshes requested by event handlers are coalesced per event-loop tick
+        self.render_scheduler = RenderScheduler(self)
+        self.render_scheduler.register("layout", self.position_collapse_button)
+        self.render_scheduler.register("list", self.show_tasks_page)
+        self.render_scheduler.register("calendar", self.show_calendar_page)
+        self.render_scheduler.register("habits", self.show_habit_page)
+        self.render_scheduler.register("detail", self.show_task_detail)
+
+        with self.profiler.phase("window shell"):
+            self._build_shell()
+
+        # Load icons and data once the shell has been drawn
+        self._shell_ready_time = time.perf_counter()
+        self.after_idle(self.after, 0, self._finish_startup)
+
+    def _build_shell(self):
+        """Create the sidebar, navbar and content frames without icons or data."""
         self.sidebar = ctk.CTkFrame(self, width=self.sidebar_width, corner_radius=0, fg_color="#C576E0")
         self.sidebar.pack(side="left", fill="y")
         self.sidebar.pack_propagate(False)
 
         sidebar_logo_frame = ctk.CTkFrame(self.sidebar, fg_color="#C576E0")
         sidebar_logo_frame.pack(fill="x", pady=(8, 0), padx=8)
-        if self.logo_image:
-            ctk.CTkLabel(sidebar_logo_frame, image=self.logo_image, text="", width=40, height=40).pack(side="left", padx=(0, 8))
-        ctk.CTkLabel(
+        self.logo_label = ctk.CTkLabel(sidebar_logo_frame, text="", width=40, height=40)
+        self.logo_title_label = ctk.CTkLabel(
             sidebar_logo_frame,
             text="TimePlan",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=self.styles.font(size=22, weight="bold"),
             text_color="white",
             bg_color="#C576E0"
-        ).pack(side="left", pady=0)
+        )
+        self.logo_title_label.pack(side="left", pady=0)
 
         self.navbar = ctk.CTkFrame(self, width=300, fg_color="#F3E6F8")
         self.navbar_nav_items = []
+        self.navbar_badges = {}  # filter name -> count label, see update_nav_badges()
         nav_items_data = [
             "Today", "Next 7 Days", "All Tasks",
             "On-going", "Completed", "Missed"
@@ -134,11 +133,10 @@ class TimePlanApp(ctk.CTk):
             btn = ctk.CTkButton(
                 self.navbar,
                 text=name,
-                image=self.nav_icons.get(name),
                 compound="left",
                 width=180,
                 height=40,
-                font=ctk.CTkFont(size=16, weight="bold"),
+                font=self.styles.font(size=16, weight="bold"),
                 fg_color="transparent",
                 text_color="#A85BC2",
                 hover_color="#E5C6F2",
@@ -149,6 +147,14 @@ class TimePlanApp(ctk.CTk):
             btn.pack(pady=6, anchor="w") 
             self.navbar_nav_items.append(btn)
 
+            badge = ctk.CTkLabel(
+                btn, text="", width=28, height=20, corner_radius=10,
+                fg_color="#E5C6F2", text_color="#6A057F",
+                font=self.styles.font(size=12, weight="bold")
+            )
+            badge.bind("<Button-1>", lambda e, filter_name=name: self.show_tasks_page(filter_name))
+            self.navbar_badges[name] = badge
+
         self.content = ctk.CTkFrame(self, fg_color="#F8F3FB")
         self.content.pack(side="left", fill="both", expand=True, padx=8, pady=8)
 
@@ -165,15 +171,16 @@ class TimePlanApp(ctk.CTk):
             b = ctk.CTkButton(
                 self.sidebar,
                 text=btn_text,
-                image=self.icons.get(btn_text),
                 compound="left",
                 width=200,
                 height=60,
-                font=ctk.CTkFont(size=16, weight="bold"),
+                font=self.styles.font(size=16, weight="bold"),
                 fg_color="#C576E0",
                 hover_color="#A85BC2",
                 text_color="white",
                 anchor="w",
+                # Enabled once the database is ready
+                state="disabled",
                 command=btn_cmd
             )
             b.pack(pady=2, padx=8, fill="none")
@@ -188,7 +195,7 @@ class TimePlanApp(ctk.CTk):
             fg_color="#C576E0",
             hover_color="#A85BC2",
             text_color="white",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             corner_radius=0,
             border_width=0,
             command=self.toggle_sidebar
@@ -196,31 +203,200 @@ class TimePlanApp(ctk.CTk):
         
         self.position_collapse_button()
         self.bind("<Configure>", self.on_window_configure)
+        # Arrow keys move through the task list while the detail pane follows
+        self.bind("<Up>", lambda e: self.on_task_navigation_key(e, -1))
+        self.bind("<Down>", lambda e: self.on_task_navigation_key(e, 1))
+        self.bind("<Control-Shift-KeyPress-P>", self.action_profiler.toggle)
+
+    def _finish_startup(self):
+        """Second startup stage, run after the window shell has been painted."""
+        self.profiler.mark("wait for first paint", self._shell_ready_time)
+
+        icons_start = time.perf_counter()
+        self._load_icons()
+        icon_cache = self.styles.icon_cache
+        self.profiler.mark("icons", icons_start,
+                           note=f"{icon_cache.hits} from cache, {icon_cache.misses} resized")
+
+        with self.profiler.phase("database"):
+            self._load_database()
+
+        with self.profiler.phase("first page"):
+            for b in self.sidebar_buttons:
+                b.configure(state="normal")
+            self.show_tasks_page('All Tasks')
+            self.update_idletasks()
+
+        self.profiler.report()
+        self.db_manager.check_external_changes()  # Record the starting data_version
+        self.after(self.EXTERNAL_CHANGE_POLL_MS, self._poll_external_changes)
+        archive = self.db_manager.archive
+        self.backup_manager = BackupManager(self.db_manager.db_name, archive_path=archive.path if archive else None)
+        if self.backup_manager.is_due(self.BACKUP_INTERVAL_HOURS):
+            # Runs on a worker thread and copies a few pages per step, so the UI stays responsive
+            self.backup_manager.start_background()
+        if self.db_manager.archive is not None:
+            self.after(self.ARCHIVE_STEP_MS, self._archive_step)
+        self.idle_tracker = IdleTracker(self)
+        self.after(self.MAINTENANCE_POLL_MS, self._maintenance_tick)
+        if self._profile_after_startup:
+            self.action_profiler.start()
+
+    def enable_stall_watchdog(self, threshold_ms=250):
+        """Start logging main-thread stalls; Ctrl+Shift+M exports the responsiveness metrics."""
+        self.watchdog = StallWatchdog(self, threshold=threshold_ms / 1000)
+        self.watchdog.start()
+        self.bind("<Control-Shift-KeyPress-M>", self.export_responsiveness)
+
+    def export_responsiveness(self, event=None):
+        if self.watchdog is None:
+            return
+        path = os.path.abspath(time.strftime("responsiveness_%Y%m%d_%H%M%S.json"))
+        try:
+            self.watchdog.export(path)
+        except OSError as e:
+            print(f"Error writing responsiveness metrics: {e}")
+
+    def _archive_step(self):
+        """Archive one batch of old tasks per call; refresh the task views once it is done."""
+        moved = self.db_manager.archive.archive_batch()
+        if moved:
+            self._archived_this_run += moved
+            self.after(self.ARCHIVE_STEP_MS, self._archive_step)
+            return
+        if self._archived_this_run:
+            print(f"Archived {self._archived_this_run} old tasks to {self.db_manager.archive.path}")
+            self._forget_cached_tasks()
+            if self.current_page == "tasks":
+                self.render_scheduler.mark_dirty("list", self.get_current_filter())
+            elif self.current_page == "calendar":
+                self.render_scheduler.mark_dirty("calendar")
+            self._archived_this_run = 0
+
+    def _maintenance_tick(self):
+        """Run one database maintenance step if the user has been idle for a while."""
+        delay = self.MAINTENANCE_POLL_MS
+        busy = self.backup_manager.is_running() or self._archived_this_run
+        if not busy and self.idle_tracker.idle_for() >= self.MAINTENANCE_IDLE_SECONDS:
+            if self.backup_manager.is_due(self.BACKUP_INTERVAL_HOURS):
+                # Also picks up a backup that gave up on concurrent writes, once its retry delay passed
+                self.backup_manager.start_background()
+            elif self.db_manager.run_maintenance_step():
+                delay = self.MAINTENANCE_STEP_MS  # More may be due
+        self.after(delay, self._maintenance_tick)
+
+    def _poll_external_changes(self):
+        """Refresh only the views whose tables another process has written to."""
+        changed = self.db_manager.check_external_changes()
+        if changed & {"tasks", "task_category", "priority"}:
+            self._forget_cached_tasks()
+            if self.current_page == "tasks":
+                self.render_scheduler.mark_dirty("list", self.get_current_filter())
+                if self.detail_pane_visible and self.selected_task is not None:
+                    if self.db_manager.get_task_by_id(self.selected_task):
+                        self.render_scheduler.mark_dirty("detail", self.selected_task)
+            elif self.current_page == "calendar":
+                self.render_scheduler.mark_dirty("calendar")
+        if "recurring_tasks" in changed and self.current_page == "habit":
+            self.render_scheduler.mark_dirty("habits")
+        self.after(self.EXTERNAL_CHANGE_POLL_MS, self._poll_external_changes)
+
+    def _load_icons(self):
+        """Load the sidebar, navbar and logo icons into the already-built buttons."""
+        icon_folder = os.path.join(os.path.dirname(__file__), "icons")
+        icon_files = {
+            "Tasks": "tasks.png", "Calendar": "calendar.png", "Habit": "habit2.png",
+            "Add Task": "addTask.png", "Search Task": "search.png", "Profile": "profile.png",
+            "Sign Out": "signOut.png"
+        }
+        self.icons = {}
+        for key, filename in icon_files.items():
+            path = os.path.join(icon_folder, filename)
+            self.icons[key] = self.styles.icon(path, (56, 56))
+            if self.icons[key] is None:
+                print(f"Warning: Sidebar icon not found: {path}")
+
+        nav_icon_files = {
+            "Today": "today.png", "Next 7 Days": "next7Days.png", "All Tasks": "allTasks.png",
+            "On-going": "onGoing.png", "Completed": "completed.png", "Missed": "missing.png"
+        }
+        icon_size_nav = (40, 40)
+        self.nav_icons = {}
+        for key, filename in nav_icon_files.items():
+            path = os.path.join(icon_folder, filename)
+            self.nav_icons[key] = self.styles.icon(path, icon_size_nav)
+            if self.nav_icons[key] is None:
+                print(f"Warning: Navigation icon not found: {path}")
+
+        self.logo_image = self.styles.icon(os.path.join(icon_folder, "logoKuno.png"), (40, 40))
+        self.styles.icon_cache.save_index()
+
+        for b in self.sidebar_buttons:
+            if self.icons.get(b.cget("text")):
+                b.configure(image=self.icons[b.cget("text")])
+        for btn in self.navbar_nav_items:
+            if self.nav_icons.get(btn.cget("text")):
+                btn.configure(image=self.nav_icons[btn.cget("text")])
+        if self.logo_image:
+            self.logo_label.configure(image=self.logo_image)
+            self.logo_label.pack(side="left", padx=(0, 8), before=self.logo_title_label)
 
-        self.show_tasks_page('All Tasks')
+    def _load_database(self):
+        """Open the database and pre-fetch the category IDs used by the views."""
+        from databaseManagement import DatabaseManager
 
-        self.current_page = "tasks"  # Track current page: "tasks" or "calendar"
+        self.db_manager = DatabaseManager()
+        if self.db_manager.needs_auto_vacuum_conversion():
+            # One-time rebuild under an exclusive lock: done before the first query of the
+            # session, so nothing in the app waits on it later
+            status = ctk.CTkLabel(self.content, text="Optimizing the database (one-time)...",
+                                  font=self.styles.font(size=16), text_color="#6A057F")
+            status.pack(pady=40)
+            self.update_idletasks()
+            self.db_manager.convert_to_incremental_vacuum()
+            status.destroy()
+        # Filter switches are served from an in-memory index when numpy is available
+        self.db_manager.enable_task_index()
+        # Keep the hot tasks table small; history views read the archive too
+        self.db_manager.enable_archive(horizon_days=self.ARCHIVE_HORIZON_DAYS)
+        self._archived_this_run = 0
+        # Pre-fetch category IDs
+        self.completed_category_id = self.db_manager.get_category_id_by_name("Completed")
+        self.on_going_category_id = self.db_manager.get_category_id_by_name("On-going") # For un-completing tasks
+        self.missed_category_id = self.db_manager.get_category_id_by_name("Missed") # For past due tasks
+        # Get all category names for task editing
+        self.all_categories = [cat[0] for cat in self.db_manager.get_task_categories()]
+        
+        if not self.completed_category_id:
+            print("ERROR: 'Completed' category not found. Please ensure databaseManagement.py initializes it.")
+        if not self.on_going_category_id:
+            print("ERROR: 'On-going' category not found. Please ensure databaseManagement.py initializes it.")
+        if not self.missed_category_id:
+            print("ERROR: 'Missed' category not found. Please ensure databaseManagement.py initializes it.")
 
     def position_collapse_button(self):
-        self.update_idletasks()
         current_width = self.sidebar_width if self.sidebar_expanded else self.sidebar_collapsed_width
         x_pos = current_width
         self.collapse_btn.place(x=x_pos, rely=0.5, anchor="w")
 
     def on_window_configure(self, event):
         if event.widget == self:
-            self.position_collapse_button()
+            # A window drag fires <Configure> continuously; reposition once per tick
+            self.render_scheduler.mark_dirty("layout")
 
     def clear_content(self):
+        self._cancel_task_render()
         for widget in self.content.winfo_children():
             widget.destroy()
 
+    @traced()
     def show_tasks_page(self, filter_type='All Tasks'):
         self.navbar.pack_forget()
         self.navbar.pack(side="left", fill="y", padx=(40, 0))
 
         # Update the filter buttons
         self.update_filter_buttons(filter_type)
+        self.update_nav_badges()
         
         # Set current page to tasks
         self.current_page = "tasks"
@@ -232,167 +408,203 @@ class TimePlanApp(ctk.CTk):
         self.content.pack_forget()
         self.content.pack(side="left", fill="both", expand=True, padx=8, pady=8)
         
-        self.clear_content()
+        with tracer.span("clear content", "render"):
+            self.clear_content()
 
         ctk.CTkLabel(
             self.content,
             text=f"{filter_type} Tasks",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.styles.font(size=24, weight="bold"),
             text_color="#A85BC2"
         ).pack(anchor="nw", pady=(10, 0), padx=10)
 
         self.task_scroll_frame = ctk.CTkScrollableFrame(self.content, fg_color="transparent")
         self.task_scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
-        # Fetch tasks from the database based on filter type
+        # Fetch tasks from the database based on filter type, already sorted by due date
         tasks = self.db_manager.get_tasks(user_id=self.current_user_id, filter_type=filter_type)
-        
-        # Additional sorting based on due date (nearest first)
-        if filter_type in ['All Tasks', 'On-going']:
-            def get_due_date(task):
-                due_date_str = task[4]  # due_date is at index 4
-                if due_date_str:
-                    try:
-                        return datetime.strptime(due_date_str, '%Y-%m-%d').date()
-                    except ValueError:
-                        return datetime.max.date()
-                return datetime.max.date()  # Tasks with no due date will appear at the end
-            tasks = sorted(tasks, key=get_due_date)
+
+        self.task_list_ids = [task[0] for task in tasks]
 
         if not tasks:
             ctk.CTkLabel(self.task_scroll_frame, text="No tasks found for this filter.",
-                         font=ctk.CTkFont(size=16), text_color="#6A057F").pack(pady=20)
+                         font=self.styles.font(size=16), text_color="#6A057F").pack(pady=20)
             return
 
-        MISSED_BG_COLOR = "#FFCDD2" # Light Red
-        COMPLETED_BG_COLOR = "#C8E6C9" # Light Green
-        ONGOING_BG_COLOR = "white" # Default for uncompleted, non-missed tasks
-
         philippines_timezone = pytz.timezone('Asia/Manila')
         current_local_date = datetime.now(philippines_timezone).date()
 
-        for i, task in enumerate(tasks):
+        # Paint the first screenful now and the rest in small time-boxed chunks
+        self._task_render_rows = tasks
+        self._task_render_index = 0
+        self._task_render_context = {
+            "parent": self.task_scroll_frame,
+            "filter_type": filter_type,
+            "current_local_date": current_local_date,
+            # One query for the recurring indicator instead of one per task
+            "recurring_ids": self.db_manager.get_recurring_task_ids(),
+        }
+        with tracer.span("build rows", "render"):
+            self._render_task_rows(self.TASK_RENDER_FIRST_BATCH)
+        self._schedule_task_render()
+
+    def _render_task_rows(self, max_rows=None, deadline=None):
+        """Build task rows from the pending list until max_rows or the deadline is reached."""
+        rows = self._task_render_rows
+        built = 0
+        while self._task_render_index < len(rows):
+            if max_rows is not None and built >= max_rows:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            i = self._task_render_index
+            self._task_render_index += 1
+            task = rows[i]
             if len(task) != 6:
                 print(f"Error: Task {i} has unexpected number of elements: {len(task)}. Expected 6. Task data: {task}")
                 continue
-            
-            task_id, title, description, priority, due_date, category_name = task
+            self._create_task_row(task, **self._task_render_context)
+            built += 1
 
-            frame_bg_color = ONGOING_BG_COLOR
-            title_color = "#333333"
-            is_completed_by_category = (category_name == "Completed")
-            is_missed = False
-            
-            if not is_completed_by_category and due_date:
-                try:
-                    due_date_obj = datetime.strptime(due_date, '%Y-%m-%d').date()
-                    if due_date_obj < current_local_date:
-                        is_missed = True
-                        # Do NOT update the database here to avoid UI lag
-                        # Only update the UI to show as missed
-                        # If you want to update the DB, do it in a batch elsewhere
-                        category_name = "Missed"
-                except ValueError:
-                    pass
-
-            if is_completed_by_category:
-                frame_bg_color = COMPLETED_BG_COLOR
-                title_color = "gray"
-            elif is_missed:
-                frame_bg_color = MISSED_BG_COLOR
-                title_color = "red"
-            
-            task_frame = ctk.CTkFrame(self.task_scroll_frame, fg_color=frame_bg_color, corner_radius=10,
-                                      border_width=1, border_color="#E5C6F2", cursor="hand2")
-            task_frame.pack(fill="x", pady=5, padx=5)
-            def on_task_click(event, tid=task_id):
-                self.selected_task = tid
-                self.show_task_detail(tid)
-            task_frame.bind("<Button-1>", on_task_click)
-
-            task_frame.grid_columnconfigure(0, weight=0)
-            task_frame.grid_columnconfigure(1, weight=1)
-            task_frame.grid_columnconfigure(2, weight=0)
-            task_frame.grid_rowconfigure(0, weight=0)
-            task_frame.grid_rowconfigure(1, weight=0)
-            task_frame.grid_rowconfigure(2, weight=1)
+    def _schedule_task_render(self):
+        if self._task_render_index < len(self._task_render_rows):
+            self._task_render_job = self.after(0, self._render_task_chunk)
+        else:
+            self._task_render_job = None
+
+    @traced("render chunk", "render")
+    def _render_task_chunk(self):
+        """Add one batch of rows within the frame budget, then yield to the event loop."""
+        self._task_render_job = None
+        self._render_task_rows(deadline=time.perf_counter() + self.TASK_RENDER_FRAME_BUDGET)
+        self._schedule_task_render()
+
+    def _cancel_task_render(self):
+        """Stop adding rows to a task list that is being replaced."""
+        if self._task_render_job is not None:
+            self.after_cancel(self._task_render_job)
+            self._task_render_job = None
+        self._task_render_rows = []
+        self._task_render_index = 0
+
+    def _create_task_row(self, task, parent, filter_type, current_local_date, recurring_ids):
+        """Build one task card in the task list."""
+        task_id, title, description, priority, due_date, category_name = task
 
-            status_var = ctk.StringVar(value="on" if is_completed_by_category else "off")
-            status_checkbox = ctk.CTkCheckBox(task_frame, text="", variable=status_var,
-                                              onvalue="on", offvalue="off",
-                                              command=lambda tid=task_id, svar=status_var, current_cat_name=category_name, ft=filter_type: self.toggle_task_completion(tid, svar, current_cat_name, ft))
-            status_checkbox.grid(row=0, column=0, rowspan=3, padx=(10,0), pady=10, sticky="nsew")
-            def prevent_propagation(e):
-                e.widget.focus_set()
-                return "break"
-            status_checkbox.bind("<Button-1>", prevent_propagation, add="+")
+        is_completed_by_category = (category_name == "Completed")
+        is_missed = False
+        
+        if not is_completed_by_category and due_date:
+            try:
+                due_date_obj = datetime.strptime(due_date, '%Y-%m-%d').date()
+                if due_date_obj < current_local_date:
+                    is_missed = True
+                    # Do NOT update the database here to avoid UI lag
+                    # Only update the UI to show as missed
+                    # If you want to update the DB, do it in a batch elsewhere
+                    category_name = "Missed"
+            except ValueError:
+                pass
+
+        if is_completed_by_category:
+            frame_bg_color, title_color = self.styles.card_colors("Completed")
+        elif is_missed:
+            frame_bg_color, title_color = self.styles.card_colors("Missed")
+        else:
+            frame_bg_color, title_color = self.styles.card_colors("On-going")
+        
+        task_frame = ctk.CTkFrame(parent, fg_color=frame_bg_color, corner_radius=10,
+                                  border_width=1, border_color="#E5C6F2", cursor="hand2")
+        task_frame.pack(fill="x", pady=5, padx=5)
+        def on_task_click(event, tid=task_id):
+            self.selected_task = tid
+            self.show_task_detail(tid)
+        task_frame.bind("<Button-1>", on_task_click)
+
+        task_frame.grid_columnconfigure(0, weight=0)
+        task_frame.grid_columnconfigure(1, weight=1)
+        task_frame.grid_columnconfigure(2, weight=0)
+        task_frame.grid_rowconfigure(0, weight=0)
+        task_frame.grid_rowconfigure(1, weight=0)
+        task_frame.grid_rowconfigure(2, weight=1)
 
-            ctk.CTkLabel(task_frame, text=title, font=ctk.CTkFont(size=18, weight="bold"),
-                         text_color=title_color, anchor="w", wraplength=400
-                         ).grid(row=0, column=1, padx=(10, 5), pady=(10,0), sticky="ew")
+        status_var = ctk.StringVar(value="on" if is_completed_by_category else "off")
+        status_checkbox = ctk.CTkCheckBox(task_frame, text="", variable=status_var,
+                                          onvalue="on", offvalue="off",
+                                          command=lambda tid=task_id, svar=status_var, current_cat_name=category_name, ft=filter_type: self.toggle_task_completion(tid, svar, current_cat_name, ft))
+        status_checkbox.grid(row=0, column=0, rowspan=3, padx=(10,0), pady=10, sticky="nsew")
+        def prevent_propagation(e):
+            e.widget.focus_set()
+            return "break"
+        status_checkbox.bind("<Button-1>", prevent_propagation, add="+")
 
-            if priority:
-                display_priority_text = "⚠️ Urgent" if priority == "Urgent" else "Not urgent"
-                ctk.CTkLabel(task_frame, text=display_priority_text, font=ctk.CTkFont(size=14),
-                             text_color=title_color, anchor="w"
-                             ).grid(row=1, column=1, padx=(10, 5), pady=(0, 5), sticky="ew")
+        ctk.CTkLabel(task_frame, text=title, font=self.styles.font(size=18, weight="bold"),
+                     text_color=title_color, anchor="w", wraplength=400
+                     ).grid(row=0, column=1, padx=(10, 5), pady=(10,0), sticky="ew")
 
-            if description:
-                ctk.CTkLabel(task_frame, text=description, font=ctk.CTkFont(size=14),
-                             text_color=title_color, anchor="nw", wraplength=400
-                             ).grid(row=2, column=1, padx=(10, 5), pady=(0, 10), sticky="new")
-            else:
-                ctk.CTkLabel(task_frame, text="", font=ctk.CTkFont(size=1),
-                             text_color=title_color, anchor="w").grid(row=2, column=1, padx=(10, 5), pady=(0, 0), sticky="ew")
-
-            if category_name:
-                category_label = ctk.CTkLabel(task_frame, text=category_name, font=ctk.CTkFont(size=12, weight="bold"),
-                             text_color="#666666", anchor="ne", justify="right"
-                             )
-                category_label.grid(row=0, column=2, padx=10, pady=(10,0), sticky="ne")
-                category_label.bind("<Button-1>", lambda e, tid=task_id: on_task_click(e, tid))
-                category_label.configure(cursor="hand2")
-                
-                # Due date label (add this for calendar view task cards)
-                if due_date:
-                    try:
-                        due_date_obj = datetime.strptime(due_date, '%Y-%m-%d').date()
-                        if due_date_obj == current_local_date:
-                            formatted_date_str = "Due: Today"
-                        elif due_date_obj == (current_local_date + timedelta(days=1)):
-                            formatted_date_str = "Due: Tomorrow"
-                        else:
-                            formatted_date_str = f"Due: {due_date_obj.strftime('%b %d, %Y')}"
-                    except ValueError:
-                        formatted_date_str = "Due: Invalid Date"
-
-                    due_date_label = ctk.CTkLabel(
-                        task_frame,
-                        text=formatted_date_str,
-                        font=ctk.CTkFont(size=12),
-                        text_color="#666666",
-                        anchor="ne",
-                        justify="right"
-                    )
-                    due_date_label.grid(row=1, column=2, padx=10, pady=(0,10), sticky="ne")
-                    due_date_label.bind("<Button-1>", lambda e, tid=task_id: on_task_click(e, tid))
-                    due_date_label.configure(cursor="hand2")
+        if priority:
+            display_priority_text = "⚠️ Urgent" if priority == "Urgent" else "Not urgent"
+            ctk.CTkLabel(task_frame, text=display_priority_text, font=self.styles.font(size=14),
+                         text_color=title_color, anchor="w"
+                         ).grid(row=1, column=1, padx=(10, 5), pady=(0, 5), sticky="ew")
+
+        if description:
+            ctk.CTkLabel(task_frame, text=description, font=self.styles.font(size=14),
+                         text_color=title_color, anchor="nw", wraplength=400
+                         ).grid(row=2, column=1, padx=(10, 5), pady=(0, 10), sticky="new")
+        else:
+            ctk.CTkLabel(task_frame, text="", font=self.styles.font(size=1),
+                         text_color=title_color, anchor="w").grid(row=2, column=1, padx=(10, 5), pady=(0, 0), sticky="ew")
+
+        if category_name:
+            category_label = ctk.CTkLabel(task_frame, text=category_name, font=self.styles.font(size=12, weight="bold"),
+                         text_color="#666666", anchor="ne", justify="right"
+                         )
+            category_label.grid(row=0, column=2, padx=10, pady=(10,0), sticky="ne")
+            category_label.bind("<Button-1>", lambda e, tid=task_id: on_task_click(e, tid))
+            category_label.configure(cursor="hand2")
             
-            # Recurring task indicator (new)
-            is_recurring = self.db_manager.is_recurring_task(task_id)
-            if is_recurring:
-                recurring_label = ctk.CTkLabel(
+            # Due date label (add this for calendar view task cards)
+            if due_date:
+                try:
+                    due_date_obj = datetime.strptime(due_date, '%Y-%m-%d').date()
+                    if due_date_obj == current_local_date:
+                        formatted_date_str = "Due: Today"
+                    elif due_date_obj == (current_local_date + timedelta(days=1)):
+                        formatted_date_str = "Due: Tomorrow"
+                    else:
+                        formatted_date_str = f"Due: {due_date_obj.strftime('%b %d, %Y')}"
+                except ValueError:
+                    formatted_date_str = "Due: Invalid Date"
+
+                due_date_label = ctk.CTkLabel(
                     task_frame,
-                    text="🗓️ Recurring Task",
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    text_color="#4CAF50",
-                    anchor="se",
+                    text=formatted_date_str,
+                    font=self.styles.font(size=12),
+                    text_color="#666666",
+                    anchor="ne",
                     justify="right"
                 )
-                recurring_label.grid(row=2, column=2, padx=10, pady=(0, 10), sticky="se")
-                recurring_label.bind("<Button-1>", lambda e, tid=task_id: on_task_click(e, tid))
-                recurring_label.configure(cursor="hand2")
+                due_date_label.grid(row=1, column=2, padx=10, pady=(0,10), sticky="ne")
+                due_date_label.bind("<Button-1>", lambda e, tid=task_id: on_task_click(e, tid))
+                due_date_label.configure(cursor="hand2")
+        
+        # Recurring task indicator (new)
+        is_recurring = task_id in recurring_ids
+        if is_recurring:
+            recurring_label = ctk.CTkLabel(
+                task_frame,
+                text="🗓️ Recurring Task",
+                font=self.styles.font(size=12, weight="bold"),
+                text_color="#4CAF50",
+                anchor="se",
+                justify="right"
+            )
+            recurring_label.grid(row=2, column=2, padx=10, pady=(0, 10), sticky="se")
+            recurring_label.bind("<Button-1>", lambda e, tid=task_id: on_task_click(e, tid))
+            recurring_label.configure(cursor="hand2")
 
+    @traced()
     def toggle_task_completion(self, task_id, status_var, current_category_name, current_filter_type):
         new_category_id = None
         if status_var.get() == "on": # Task is being marked as Completed
@@ -411,15 +623,17 @@ class TimePlanApp(ctk.CTk):
                 return
 
         if self.db_manager.update_task_category(task_id, new_category_id):
+            self._forget_cached_tasks()
             # Refresh the view based on current page
             if self.current_page == "calendar":
-                self.show_calendar_page()
+                self.render_scheduler.mark_dirty("calendar")
             else:
-                self.show_tasks_page(current_filter_type)
+                self.render_scheduler.mark_dirty("list", current_filter_type)
         else:
             messagebox.showerror("Error", "Failed to update task status in database.")
             status_var.set("off" if status_var.get() == "on" else "on") # Revert checkbox on failure
 
+    @traced()
     def show_calendar_page(self):
         self.navbar.pack_forget()
         self.content.pack_forget()
@@ -435,34 +649,26 @@ class TimePlanApp(ctk.CTk):
         calendar_frame.pack(fill="x", padx=5, pady=5)
         
         # Get all tasks from database and organize by date
-        tasks = self.db_manager.get_tasks(user_id=self.current_user_id, filter_type='All Tasks')
-        # Create a dictionary mapping due dates to tasks
+        tasks = self.db_manager.get_tasks(user_id=self.current_user_id, filter_type='All Tasks', records=True)
+        # Create a dictionary mapping due dates to task records
         task_dates = {}
         
         # Add a heading for the calendar view
         ctk.CTkLabel(
             calendar_frame,
             text="Calendar View",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.styles.font(size=24, weight="bold"),
             text_color="#A85BC2"
         ).pack(anchor="nw", pady=(0, 10))
         
         # Process tasks and organize by date
         for task in tasks:
-            task_id, title, description, priority, due_date, category_name = task
-            if due_date:
+            if task.due_date:
                 # Ensure date format consistency - store as strings
-                date_key = due_date.strip()  # Remove any whitespace
+                date_key = task.due_date.strip()  # Remove any whitespace
                 if date_key not in task_dates:
                     task_dates[date_key] = []
-                task_dates[date_key].append({
-                    'id': task_id,  # Keep as 'id' for consistency with create_task_card
-                    'title': title,  # Keep as 'title' for consistency with create_task_card
-                    'description': description,
-                    'priority': priority,
-                    'due_date': date_key,
-                    'category': category_name
-                })
+                task_dates[date_key].append(task)
         
         philippines_timezone = pytz.timezone('Asia/Manila')
         current_local_date = datetime.now(philippines_timezone).date()
@@ -478,7 +684,7 @@ class TimePlanApp(ctk.CTk):
         selected_date_label = ctk.CTkLabel(
             tasks_header_frame,
             text="Select a date to view tasks",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.styles.font(size=16, weight="bold"),
             text_color="#A85BC2"
         )
         selected_date_label.pack(anchor="w")
@@ -488,6 +694,7 @@ class TimePlanApp(ctk.CTk):
         tasks_scroll_frame.pack(fill="both", expand=True)
         
         # Create custom calendar
+        from tkcalendar import Calendar
         cal = Calendar(calendar_frame, 
             selectmode='day',
             date_pattern='yyyy-mm-dd',
@@ -510,13 +717,13 @@ class TimePlanApp(ctk.CTk):
         # Configure calendar event tag for tasks - use calevent_create's tag format
         cal.tag_config("task_date", background='#F3E6F8')  # Light purple for task dates
         
-        # Use the proper method to mark dates with tasks
-        for date_str in task_dates.keys():
+        # Use the proper method to mark dates with tasks; the per-day counts come from the counter table
+        for date_str, count in self.db_manager.get_day_counts(self.current_user_id).items():
             try:
                 # Parse the date string to a date object
                 date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
                 # Mark the date on the calendar using calevent_create
-                cal.calevent_create(date_obj, "Task Due", "task_date")
+                cal.calevent_create(date_obj, f"{count} task{'s' if count != 1 else ''} due", "task_date")
             except (ValueError, AttributeError) as e:
                 print(f"Error marking date {date_str}: {str(e)}")
         
@@ -544,6 +751,7 @@ class TimePlanApp(ctk.CTk):
                 
                 # Get tasks for the selected date
                 date_tasks = task_dates.get(selected_date, [])
+                self.task_list_ids = [task.task_id for task in date_tasks]
                 
                 if date_tasks:
                     # Display tasks for the selected date
@@ -556,7 +764,7 @@ class TimePlanApp(ctk.CTk):
                     no_tasks_label = ctk.CTkLabel(
                         tasks_scroll_frame,
                         text=f"No tasks scheduled for this date.",
-                        font=ctk.CTkFont(size=14),
+                        font=self.styles.font(size=14),
                         text_color="#6A057F"
                     )
                     no_tasks_label.pack(pady=20)
@@ -587,7 +795,7 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             self.content,
             text="Add New Task",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.styles.font(size=24, weight="bold"),
             text_color="#A85BC2"
         ).pack(anchor="nw", pady=(10, 0), padx=10)
 
@@ -595,24 +803,24 @@ class TimePlanApp(ctk.CTk):
         form_frame.pack(fill="both", expand=True, padx=10, pady=10)
         form_frame.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(form_frame, text="Title:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+        ctk.CTkLabel(form_frame, text="Title:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
         self.task_title_entry = ctk.CTkEntry(form_frame, placeholder_text="Task title", width=300)
         self.task_title_entry.grid(row=0, column=1, padx=10, pady=(10, 5), sticky="ew")
 
-        ctk.CTkLabel(form_frame, text="Description:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Description:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=1, column=0, padx=10, pady=5, sticky="w")
         self.task_description_entry = ctk.CTkEntry(form_frame, placeholder_text="Optional description", width=300)
         self.task_description_entry.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
 
-        ctk.CTkLabel(form_frame, text="Priority:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Priority:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=2, column=0, padx=10, pady=5, sticky="w")
         self.task_priority_optionmenu = ctk.CTkOptionMenu(form_frame, values=["Urgent", "Not urgent"])
         self.task_priority_optionmenu.set("Not urgent")
         self.task_priority_optionmenu.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
 
-        ctk.CTkLabel(form_frame, text="Due Date:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Due Date:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=3, column=0, padx=10, pady=5, sticky="w")
         self.task_due_date_entry = ctk.CTkEntry(form_frame, placeholder_text="YYYY-MM-DD (optional)", width=300)
         self.task_due_date_entry.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
 
-        ctk.CTkLabel(form_frame, text="Category:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Category:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=4, column=0, padx=10, pady=5, sticky="w")
         
         # Get all categories and filter out 'Completed' for new task entry default
         # Assuming new tasks will start as "On-going" or "Missed"
@@ -630,9 +838,10 @@ class TimePlanApp(ctk.CTk):
         self.task_category_optionmenu.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
 
         ctk.CTkButton(form_frame, text="Add Task", command=self.submit_task,
-                      font=ctk.CTkFont(size=16, weight="bold"),
+                      font=self.styles.font(size=16, weight="bold"),
                       fg_color="#A85BC2", hover_color="#C576E0").grid(row=5, column=0, columnspan=2, pady=20)
 
+    @traced()
     def submit_task(self):
         title = self.task_title_entry.get()
         description = self.task_description_entry.get()
@@ -687,13 +896,13 @@ class TimePlanApp(ctk.CTk):
             # unless we're already in a filter that should show it (like All Tasks or On-going)
             if category_name == "On-going" and current_filter in ["All Tasks", "On-going"]:
                 # Stay in current filter if it would show the new task
-                self.show_tasks_page(current_filter)
+                self.render_scheduler.mark_dirty("list", current_filter)
             else:
                 # Otherwise show All Tasks to ensure it's visible
-                self.show_tasks_page('All Tasks')
+                self.render_scheduler.mark_dirty("list", 'All Tasks')
             
             # Show the details of the newly created task
-            self.show_task_detail(new_task_id)
+            self.render_scheduler.mark_dirty("detail", new_task_id)
         else:
             messagebox.showerror("Error", "Failed to add task. Check console for database errors.")
 
@@ -711,7 +920,7 @@ class TimePlanApp(ctk.CTk):
             self.sidebar_expanded = True
             self.collapse_btn.configure(text="◀")
         
-        self.after(10, self.position_collapse_button)
+        self.render_scheduler.mark_dirty("layout")
 
     def select_task(self, task_id):
         """Select a task to view/edit details."""
@@ -746,33 +955,33 @@ class TimePlanApp(ctk.CTk):
             self.task_detail_pane.pack(side="right", fill="y", padx=(10, 0), pady=10)
             
             # Title
-            self.task_detail_title = ctk.CTkLabel(self.task_detail_pane, text="", font=ctk.CTkFont(size=18, weight="bold"),
+            self.task_detail_title = ctk.CTkLabel(self.task_detail_pane, text="", font=self.styles.font(size=18, weight="bold"),
                                                   text_color="#333333", anchor="w", wraplength=300)
             self.task_detail_title.pack(anchor="nw", pady=(0, 10))
             
             # Description
-            self.task_detail_description = ctk.CTkLabel(self.task_detail_pane, text="", font=ctk.CTkFont(size=14),
+            self.task_detail_description = ctk.CTkLabel(self.task_detail_pane, text="", font=self.styles.font(size=14),
                                                          text_color="#333333", anchor="w", wraplength=300)
             self.task_detail_description.pack(anchor="nw", pady=(0, 10))
             
             # Priority
-            self.task_detail_priority = ctk.CTkLabel(self.task_detail_pane, text="", font=ctk.CTkFont(size=14),
+            self.task_detail_priority = ctk.CTkLabel(self.task_detail_pane, text="", font=self.styles.font(size=14),
                                                       text_color="#333333", anchor="w")
             self.task_detail_priority.pack(anchor="nw", pady=(0, 10))
             
             # Due Date
-            self.task_detail_due_date = ctk.CTkLabel(self.task_detail_pane, text="", font=ctk.CTkFont(size=14),
+            self.task_detail_due_date = ctk.CTkLabel(self.task_detail_pane, text="", font=self.styles.font(size=14),
                                                        text_color="#333333", anchor="w")
             self.task_detail_due_date.pack(anchor="nw", pady=(0, 10))
             
             # Category
-            self.task_detail_category = ctk.CTkLabel(self.task_detail_pane, text="", font=ctk.CTkFont(size=14),
+            self.task_detail_category = ctk.CTkLabel(self.task_detail_pane, text="", font=self.styles.font(size=14),
                                                        text_color="#333333", anchor="w")
             self.task_detail_category.pack(anchor="nw", pady=(0, 10))
 
             # Edit button
             self.edit_task_button = ctk.CTkButton(self.task_detail_pane, text="Edit Task", command=self.show_edit_task_page,
-                                                   font=ctk.CTkFont(size=16, weight="bold"),
+                                                   font=self.styles.font(size=16, weight="bold"),
                                                    fg_color="#A85BC2", hover_color="#C576E0")
             self.edit_task_button.pack(side="bottom", fill="x", pady=10)
         
@@ -801,7 +1010,7 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             self.content,
             text="Edit Task",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.styles.font(size=24, weight="bold"),
             text_color="#A85BC2"
         ).pack(anchor="nw", pady=(10, 0), padx=10)
 
@@ -809,22 +1018,22 @@ class TimePlanApp(ctk.CTk):
         form_frame.pack(fill="both", expand=True, padx=10, pady=10)
         form_frame.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(form_frame, text="Title:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+        ctk.CTkLabel(form_frame, text="Title:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
         self.edit_task_title_entry = ctk.CTkEntry(form_frame, placeholder_text="Task title", width=300)
         self.edit_task_title_entry.grid(row=0, column=1, padx=10, pady=(10, 5), sticky="ew")
         self.edit_task_title_entry.insert(0, title)
 
-        ctk.CTkLabel(form_frame, text="Description:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Description:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=1, column=0, padx=10, pady=5, sticky="w")
         self.edit_task_description_entry = ctk.CTkEntry(form_frame, placeholder_text="Optional description", width=300)
         self.edit_task_description_entry.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
         self.edit_task_description_entry.insert(0, description if description else "")
 
-        ctk.CTkLabel(form_frame, text="Priority:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Priority:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=2, column=0, padx=10, pady=5, sticky="w")
         self.edit_task_priority_optionmenu = ctk.CTkOptionMenu(form_frame, values=["Urgent", "Not urgent"])
         self.edit_task_priority_optionmenu.set(priority)
         self.edit_task_priority_optionmenu.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
         
-        ctk.CTkLabel(form_frame, text="Due Date:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Due Date:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=3, column=0, padx=10, pady=5, sticky="w")
         
         # Create a container frame for due date entry and calendar
         due_date_container = ctk.CTkFrame(form_frame, fg_color="transparent")
@@ -838,6 +1047,7 @@ class TimePlanApp(ctk.CTk):
           # Calendar widget below the entry
         calendar_frame = ctk.CTkFrame(due_date_container, fg_color="#FFFFFF", corner_radius=5)
         calendar_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))          # Calendar directly in the form
+        from tkcalendar import Calendar
         cal = Calendar(calendar_frame, selectmode='day', date_pattern='yyyy-mm-dd',
                        background="#FFFFFF", 
                        selectbackground="#A85BC2",
@@ -863,14 +1073,14 @@ class TimePlanApp(ctk.CTk):
         
         cal.pack(padx=5, pady=5, fill="both", expand=True)
 
-        ctk.CTkLabel(form_frame, text="Category:", font=ctk.CTkFont(size=16, weight="bold"), anchor="w").grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(form_frame, text="Category:", font=self.styles.font(size=16, weight="bold"), anchor="w").grid(row=4, column=0, padx=10, pady=5, sticky="w")
         
         self.edit_task_category_optionmenu = ctk.CTkOptionMenu(form_frame, values=self.all_categories)
         self.edit_task_category_optionmenu.set(category_name)
         self.edit_task_category_optionmenu.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
         
         ctk.CTkButton(form_frame, text="Save Changes", command=self.save_task_changes,
-                      font=ctk.CTkFont(size=16, weight="bold"),
+                      font=self.styles.font(size=16, weight="bold"),
                       fg_color="#A85BC2", hover_color="#C576E0").grid(row=5, column=0, columnspan=2, pady=20)
 
     def save_task_changes(self):
@@ -921,56 +1131,32 @@ class TimePlanApp(ctk.CTk):
         current_filter = self.get_current_filter()
         
         if self.db_manager.update_task(task_id, task_title, description, priority, due_date, category_id):
+            self._forget_cached_tasks()
             # Show success popup
             messagebox.showinfo("Success", "Task updated successfully!")
               # Refresh the task list with the current filter
-            self.show_tasks_page(current_filter)
+            self.render_scheduler.mark_dirty("list", current_filter)
             # Show updated task details
-            self.show_task_detail(task_id)
+            self.render_scheduler.mark_dirty("detail", task_id)
         else:
             messagebox.showerror("Error", "Failed to update task. Check console for database errors.")
             
-    def show_task_detail(self, task_id):
-        # Note: task_id is already stored in self.selected_task by the click handler
-        
-        # Ensure the detail pane exists and is visible before fetching task data
-        # This gives the appearance of instant responsiveness
-        if not hasattr(self, 'detail_pane') or not self.detail_pane_visible:
-            # Create a fresh detail pane immediately
-            self.detail_pane = ctk.CTkFrame(self, width=self.detail_pane_width, fg_color="#F3E6F8", corner_radius=0)
-            self.detail_pane.pack(side="right", fill="y")
-            # Prevent the pane from resizing smaller than our defined width
-            self.detail_pane.pack_propagate(False)
-            self.detail_pane_visible = True
-            
-            # Create an immediate loading message while fetching data
-            loading_label = ctk.CTkLabel(
-                self.detail_pane,
-                text="Loading task details...",
-                font=ctk.CTkFont(size=16),
-                text_color="#A85BC2"
-            )
-            loading_label.pack(expand=True)
-            self.update_idletasks()  # Force immediate UI update
-            
-        # Now fetch the task details from the database
-        task = self.get_task_by_id(task_id)
-        if not task:
-            print(f"Error: Could not find task with ID {task_id}")
-            # If task no longer exists, hide the detail pane
-            self.hide_task_detail()
-            return
-            
-        # Unpack task data
-        task_id, title, description, priority, due_date, category_name = task
-        
-        # Clear existing content in detail pane
-        for widget in self.detail_pane.winfo_children():
-            widget.destroy()
-            
+    def _build_detail_pane(self):
+        """Build the task detail pane once; later clicks only update its fields."""
+        self.detail_pane = ctk.CTkFrame(self, width=self.detail_pane_width, fg_color="#F3E6F8", corner_radius=0)
+        # Prevent the pane from resizing smaller than our defined width
+        self.detail_pane.pack_propagate(False)
+
+        # Read-only view of the selected task
+        self.detail_view_frame = ctk.CTkFrame(self.detail_pane, fg_color="transparent")
+        self.detail_view_frame.pack(fill="both", expand=True)
+
+        # Container for the edit form, shown in place of the view frame
+        self.detail_edit_frame = ctk.CTkFrame(self.detail_pane, fg_color="transparent")
+
         # Create a close button at the top right
         close_btn = ctk.CTkButton(
-            self.detail_pane,
+            self.detail_view_frame,
             text="✕",
             width=30,
             height=30,
@@ -984,184 +1170,253 @@ class TimePlanApp(ctk.CTk):
 
         # Task title
         ctk.CTkLabel(
-            self.detail_pane,
+            self.detail_view_frame,
             text="Task Details",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self.styles.font(size=20, weight="bold"),
             text_color="#A85BC2"
         ).pack(anchor="nw", padx=20, pady=(0, 20))
-        
+
         # Create detail fields
-        fields_frame = ctk.CTkFrame(self.detail_pane, fg_color="transparent")
+        fields_frame = ctk.CTkFrame(self.detail_view_frame, fg_color="transparent")
         fields_frame.pack(fill="x", padx=20, pady=0)
-        
-        # Title
-        ctk.CTkLabel(
-            fields_frame, 
-            text="Title:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#6A057F"
-        ).pack(anchor="w", pady=(5, 0))
-        
-        ctk.CTkLabel(
-            fields_frame,
-            text=title,
-            font=ctk.CTkFont(size=16),
-            wraplength=280,
-            text_color="#333333"
-        ).pack(anchor="w", pady=(0, 10), fill="x")
-        
-        # Due Date
-        ctk.CTkLabel(
-            fields_frame, 
-            text="Due Date:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#6A057F"
-        ).pack(anchor="w", pady=(5, 0))
-        
-        due_date_text = f"{due_date}" if due_date else "Not set"
-        ctk.CTkLabel(
-            fields_frame,
-            text=due_date_text,
-            font=ctk.CTkFont(size=16),
-            text_color="#333333"
-        ).pack(anchor="w", pady=(0, 10))
-        
-        # Category
-        ctk.CTkLabel(
-            fields_frame, 
-            text="Category:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#6A057F"
-        ).pack(anchor="w", pady=(5, 0))
-        
-        ctk.CTkLabel(
-            fields_frame,
-            text=category_name,
-            font=ctk.CTkFont(size=16),
-            text_color="#333333"
-        ).pack(anchor="w", pady=(0, 10))
-        
-        # Priority
-        ctk.CTkLabel(
-            fields_frame, 
-            text="Priority:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#6A057F"
-        ).pack(anchor="w", pady=(5, 0))
-        
-        priority_text = priority
-        ctk.CTkLabel(
-            fields_frame,
-            text=priority_text,
-            font=ctk.CTkFont(size=16),
-            text_color="#333333"
-        ).pack(anchor="w", pady=(0, 10))
-        
-        # Description
-        ctk.CTkLabel(
-            fields_frame, 
-            text="Description:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#6A057F"
-        ).pack(anchor="w", pady=(5, 0))
-        
-        description_text = description if description else "No description"
-        desc_label = ctk.CTkLabel(
-            fields_frame,
-            text=description_text,
-            font=ctk.CTkFont(size=16),
-            wraplength=280,
-            text_color="#333333",
-            justify="left"
-        )
-        desc_label.pack(anchor="w", pady=(0, 20), fill="x")
-        
+
+        # One caption and one value label per field, updated in place by show_task_detail
+        self.detail_fields = {}
+        detail_field_specs = [
+            ("title", "Title:", {"wraplength": 280}, {"pady": (0, 10), "fill": "x"}),
+            ("due_date", "Due Date:", {}, {"pady": (0, 10)}),
+            ("category", "Category:", {}, {"pady": (0, 10)}),
+            ("priority", "Priority:", {}, {"pady": (0, 10)}),
+            ("description", "Description:", {"wraplength": 280, "justify": "left"}, {"pady": (0, 20), "fill": "x"}),
+        ]
+        for key, caption, label_options, pack_options in detail_field_specs:
+            ctk.CTkLabel(
+                fields_frame,
+                text=caption,
+                font=self.styles.font(size=14, weight="bold"),
+                text_color="#6A057F"
+            ).pack(anchor="w", pady=(5, 0))
+
+            value_label = ctk.CTkLabel(
+                fields_frame,
+                text="",
+                font=self.styles.font(size=16),
+                text_color="#333333",
+                **label_options
+            )
+            value_label.pack(anchor="w", **pack_options)
+            self.detail_fields[key] = value_label
+
         # Add action buttons
-        btn_frame = ctk.CTkFrame(self.detail_pane, fg_color="transparent")
+        btn_frame = ctk.CTkFrame(self.detail_view_frame, fg_color="transparent")
         btn_frame.pack(fill="x", padx=20, pady=20)
-        
+
         edit_btn = ctk.CTkButton(
             btn_frame,
             text="Edit Task",
-            command=lambda: self.show_edit_task_form(task_id),
+            command=lambda: self.show_edit_task_form(self.selected_task),
             fg_color="#A85BC2",
             hover_color="#C576E0",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             height=35
         )
         edit_btn.pack(fill="x", pady=(0, 10))
-        
+
         delete_btn = ctk.CTkButton(
             btn_frame,
             text="Delete Task",
-            command=lambda: self.confirm_delete_task(task_id),
+            command=lambda: self.confirm_delete_task(self.selected_task),
             fg_color="#E57373",
             hover_color="#EF5350",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             height=35
         )
         delete_btn.pack(fill="x")
-    
-    def hide_task_detail(self):
-        if self.detail_pane_visible:
-            self.detail_pane.pack_forget()
-            self.detail_pane_visible = False
-            # Clear the selected task ID so we can select the same task again
-            self.selected_task = None
-    
-    def get_task_by_id(self, task_id):
-        # Query the database for a specific task
-        query = """
-            SELECT t.task_id, t.task_title, t.description, p.priority_name, t.due_date, tc.category_name 
-            FROM tasks t 
-            JOIN task_category tc ON t.category_id = tc.category_id 
-            LEFT JOIN priority p ON t.priority_id = p.priority_id
-            WHERE t.task_id = ?
-        """
-        result = self.db_manager._fetch_one(query, (task_id,))
-        return result
 
-    def show_edit_task_form(self, task_id):
-        # Clear detail pane first
-        for widget in self.detail_pane.winfo_children():
-            widget.destroy()
-            
-        task = self.get_task_by_id(task_id)
+    @traced()
+    def show_task_detail(self, task_id):
+        task = self._get_cached_task(task_id)
         if not task:
             print(f"Error: Could not find task with ID {task_id}")
+            # If task no longer exists, hide the detail pane
+            self.hide_task_detail()
             return
-            
+
+        if self.detail_pane is None:
+            self._build_detail_pane()
+
+        # Unpack task data
         task_id, title, description, priority, due_date, category_name = task
-        
-        # Detail heading
+        self.selected_task = task_id
+
+        # Update the existing field widgets in place
+        self.detail_fields["title"].configure(text=title)
+        self.detail_fields["due_date"].configure(text=f"{due_date}" if due_date else "Not set")
+        self.detail_fields["category"].configure(text=category_name)
+        self.detail_fields["priority"].configure(text=priority)
+        self.detail_fields["description"].configure(text=description if description else "No description")
+
+        # Switch back from the edit form if it was open
+        if self.detail_edit_frame.winfo_manager():
+            self.detail_edit_frame.pack_forget()
+            self.detail_view_frame.pack(fill="both", expand=True)
+
+        if not self.detail_pane_visible:
+            self.detail_pane.pack(side="right", fill="y")
+            self.detail_pane_visible = True
+
+        # Warm the cache for the tasks next to this one in the list
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.after_idle(self._prefetch_neighbour_tasks, task_id)
+
+    def _get_cached_task(self, task_id):
+        """Return a task row from the recently-viewed LRU, loading it on a miss."""
+        task = self._task_detail_cache.get(task_id)
+        if task is not None:
+            self._task_detail_cache.move_to_end(task_id)
+            return task
+        task = self.get_task_by_id(task_id)
+        if task:
+            self._remember_task(task)
+        return task
+
+    def _remember_task(self, task):
+        self._task_detail_cache[task[0]] = task
+        self._task_detail_cache.move_to_end(task[0])
+        while len(self._task_detail_cache) > self.TASK_DETAIL_CACHE_SIZE:
+            self._task_detail_cache.popitem(last=False)
+
+    def _forget_cached_tasks(self):
+        """Drop cached task rows after any task write."""
+        self._task_detail_cache.clear()
+
+    def _prefetch_neighbour_tasks(self, task_id):
+        """Load the tasks around task_id in the current list into the LRU."""
+        self._prefetch_job = None
+        if task_id not in self.task_list_ids:
+            return
+        index = self.task_list_ids.index(task_id)
+        start = max(0, index - self.TASK_PREFETCH_RADIUS)
+        neighbours = self.task_list_ids[start:index + self.TASK_PREFETCH_RADIUS + 1]
+        missing = [tid for tid in neighbours if tid not in self._task_detail_cache]
+        if missing:
+            for task in self.db_manager.get_tasks_by_ids(missing):
+                self._remember_task(task)
+
+    def select_adjacent_task(self, step):
+        """Move the detail pane selection up or down the current task list."""
+        if not self.task_list_ids:
+            return
+        if self.selected_task in self.task_list_ids:
+            index = self.task_list_ids.index(self.selected_task) + step
+        else:
+            index = 0 if step > 0 else len(self.task_list_ids) - 1
+        index = max(0, min(index, len(self.task_list_ids) - 1))
+        self.show_task_detail(self.task_list_ids[index])
+
+    def on_task_navigation_key(self, event, step):
+        # Leave arrow keys alone while the user is typing in a field
+        if isinstance(event.widget, (tk.Entry, tk.Text)):
+            return None
+        if self.current_page not in ("tasks", "calendar"):
+            return None
+        self.select_adjacent_task(step)
+        return "break"
+
+    def hide_task_detail(self):
+        self.render_scheduler.discard("detail")
+        if self.detail_pane_visible:
+            self.detail_pane.pack_forget()
+            self.detail_pane_visible = False
+        # Clear the selected task ID so we can select the same task again
+        self.selected_task = None
+    
+    def get_task_by_id(self, task_id):
+        # Query the database for a specific task (archived tasks included)
+        return self.db_manager.get_task_by_id(task_id)
+
+    def _refuse_archived(self, task_id):
+        """Tell the user an archived task cannot be changed; returns True if task_id is archived."""
+        if self.db_manager.is_archived(task_id):
+            messagebox.showinfo("Archived Task", "This task has been archived and can only be viewed.")
+            return True
+        return False
+
+    def show_edit_task_form(self, task_id):
+        if self._refuse_archived(task_id):
+            return
+        start_time = time.perf_counter()
+        task = self._get_cached_task(task_id)
+        if not task:
+            print(f"Error: Could not find task with ID {task_id}")
+            return
+
+        # The edit form is built once and re-filled for each task
+        built = self.edit_task_fields is None
+        if built:
+            self._build_edit_task_form()
+        fields = self.edit_task_fields
+
+        task_id, title, description, priority, due_date, category_name = task
+        self._editing_task_id = task_id
+
+        fields["title"].delete(0, ctk.END)
+        fields["title"].insert(0, title)
+
+        editable_categories = fields["categories"]
+        if category_name in editable_categories:
+            fields["category"].set(category_name)
+        else:
+            # Default to first category if current one is not editable
+            fields["category"].set(editable_categories[0])
+
+        fields["due_date"].set(due_date if due_date else "")
+        self._reset_calendar(fields["calendar"], due_date)
+
+        fields["priority"].set(priority if priority in ["Urgent", "Not urgent"] else "Not urgent")
+
+        fields["description"].delete("1.0", ctk.END)
+        if description:
+            fields["description"].insert("1.0", description)
+
+        # Swap the read-only view for the edit form
+        self.detail_view_frame.pack_forget()
+        self.detail_edit_frame.pack(fill="both", expand=True)
+        self._record_dialog_open("edit_task", start_time, built)
+
+    def _build_edit_task_form(self):
+        """Build the edit task form inside the detail pane."""
+        fields = {}
+
+        # Detail heading
         ctk.CTkLabel(
-            self.detail_pane,
+            self.detail_edit_frame,
             text="Edit Task",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self.styles.font(size=20, weight="bold"),
             text_color="#A85BC2"
         ).pack(anchor="nw", padx=20, pady=(20, 20))
         
         # Create edit form
-        form_frame = ctk.CTkScrollableFrame(self.detail_pane, fg_color="transparent")
+        form_frame = ctk.CTkScrollableFrame(self.detail_edit_frame, fg_color="transparent")
         form_frame.pack(fill="both", expand=True, padx=20, pady=0)
         
         # Title
         ctk.CTkLabel(
             form_frame, 
             text="Title:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             text_color="#6A057F"
         ).pack(anchor="w", pady=(5, 0))
         
-        title_entry = ctk.CTkEntry(form_frame, width=280)
-        title_entry.insert(0, title)
-        title_entry.pack(anchor="w", pady=(0, 10), fill="x")
+        fields["title"] = ctk.CTkEntry(form_frame, width=280)
+        fields["title"].pack(anchor="w", pady=(0, 10), fill="x")
         
         # Category
         ctk.CTkLabel(
             form_frame, 
             text="Category:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             text_color="#6A057F"
         ).pack(anchor="w", pady=(5, 0))
         
@@ -1169,25 +1424,22 @@ class TimePlanApp(ctk.CTk):
         editable_categories = [cat for cat in self.all_categories if cat not in ["Completed", "Missed"]]
         if not editable_categories:
             editable_categories = ["On-going"]  # Fallback
+        fields["categories"] = editable_categories
             
-        category_menu = ctk.CTkOptionMenu(form_frame, values=editable_categories)
-        if category_name in editable_categories:
-            category_menu.set(category_name)
-        else:
-            # Default to first category if current one is not editable
-            category_menu.set(editable_categories[0])
-        category_menu.pack(anchor="w", pady=(0, 10), fill="x")
+        fields["category"] = ctk.CTkOptionMenu(form_frame, values=editable_categories)
+        fields["category"].pack(anchor="w", pady=(0, 10), fill="x")
         
         # Due Date
         ctk.CTkLabel(
             form_frame, 
             text="Due Date:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             text_color="#6A057F"
         ).pack(anchor="w", pady=(5, 0))
         
         # Date entry and calendar in the same frame
-        due_date_var = ctk.StringVar(value=due_date if due_date else "")
+        due_date_var = ctk.StringVar(value="")
+        fields["due_date"] = due_date_var
         
         date_label_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
         date_label_frame.pack(fill="x", pady=(0, 5))
@@ -1199,6 +1451,7 @@ class TimePlanApp(ctk.CTk):
         calendar_frame = ctk.CTkFrame(form_frame, fg_color="#FFFFFF", corner_radius=5)
         calendar_frame.pack(fill="x", pady=(0, 10), padx=5)
         # Calendar widget directly embedded in the form
+        from tkcalendar import Calendar
         cal = Calendar(calendar_frame, selectmode='day', date_pattern='yyyy-mm-dd',
                        background="#FFFFFF", 
                        selectbackground="#A85BC2",
@@ -1209,99 +1462,39 @@ class TimePlanApp(ctk.CTk):
                        font=("Arial", 10),
                        showmonth=True,
                        foreground="black")
+        fields["calendar"] = cal
         
         def on_date_selected(event=None):
-            selected_date = cal.get_date()
-            due_date_var.set(selected_date)
+            due_date_var.set(cal.get_date())
         
         cal.bind("<<CalendarSelected>>", on_date_selected)
-        
-        if due_date:
-            try:
-                cal.selection_set(due_date)
-            except:
-                pass
-        
         cal.pack(padx=5, pady=5, fill="both", expand=True)
         
         # Priority
         ctk.CTkLabel(
             form_frame, 
             text="Priority:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             text_color="#6A057F"
         ).pack(anchor="w", pady=(5, 0))
         
-        priority_menu = ctk.CTkOptionMenu(form_frame, values=["Urgent", "Not urgent"])
-        priority_menu.set(priority if priority in ["Urgent", "Not urgent"] else "Not urgent")
-        priority_menu.pack(anchor="w", pady=(0, 10), fill="x")
+        fields["priority"] = ctk.CTkOptionMenu(form_frame, values=["Urgent", "Not urgent"])
+        fields["priority"].pack(anchor="w", pady=(0, 10), fill="x")
         
         # Description
         ctk.CTkLabel(
             form_frame, 
             text="Description:", 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             text_color="#6A057F"
         ).pack(anchor="w", pady=(5, 0))
         
-        description_textbox = ctk.CTkTextbox(form_frame, height=100, width=280)
-        if description:
-            description_textbox.insert("1.0", description)
-        description_textbox.pack(anchor="w", pady=(0, 20), fill="x")
+        fields["description"] = ctk.CTkTextbox(form_frame, height=100, width=280)
+        fields["description"].pack(anchor="w", pady=(0, 20), fill="x")
         
         # Button Frame
-        btn_frame = ctk.CTkFrame(self.detail_pane, fg_color="transparent")
+        btn_frame = ctk.CTkFrame(self.detail_edit_frame, fg_color="transparent")
         btn_frame.pack(fill="x", padx=20, pady=(0, 20))
-        
-        # Define save_habit function
-        def save_habit():
-            new_title = title_entry.get().strip()
-            new_category = category_menu.get()
-            new_due_date = due_date_var.get().strip()
-            new_priority = priority_menu.get()
-            new_description = description_textbox.get("1.0", ctk.END).strip()
-
-            if not new_title:
-                messagebox.showwarning("Warning", "Task title cannot be empty.")
-                return
-
-            if new_due_date:
-                try:
-                    datetime.strptime(new_due_date, '%Y-%m-%d')
-                except ValueError:
-                    messagebox.showwarning("Warning", "Due date must be in YYYY-MM-DD format (e.g., 2025-06-30).")
-                    return
-
-            category_id = self.db_manager.get_category_id_by_name(new_category)
-            if category_id is None:
-                messagebox.showwarning("Warning", "Invalid category selected.")
-                return
-
-            success = self.db_manager.update_task(
-                task_id,
-                new_title,
-                new_description if new_description else None,
-                new_priority,
-                new_due_date if new_due_date else None,
-                category_id
-            )
-            if success:
-                messagebox.showinfo("Success", "Task updated successfully!")
-                self.hide_task_detail()
-                self.show_tasks_page(self.get_current_filter())
-            else:
-                messagebox.showerror("Error", "Failed to update task.")
-
-        # Define delete_habit function
-        def delete_habit():
-            if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this task?"):
-                success = self.db_manager.delete_task(task_id)
-                if success:
-                    messagebox.showinfo("Success", "Task deleted successfully!")
-                    self.hide_task_detail()
-                    self.show_tasks_page(self.get_current_filter())
-                else:
-                    messagebox.showerror("Error", "Failed to delete task.")
 
         # Save button (now on the left)
         ctk.CTkButton(
@@ -1309,7 +1502,7 @@ class TimePlanApp(ctk.CTk):
             text="Save",
             fg_color="#4CAF50",
             hover_color="#388E3C",
-            command=save_habit
+            command=self._save_edit_task_form
         ).pack(side="left", padx=(0, 10), fill="x", expand=True)
         
         # Delete button (now on the right)
@@ -1318,22 +1511,107 @@ class TimePlanApp(ctk.CTk):
             text="Delete",
             fg_color="#FF5252",
             hover_color="#FF1744",
-            command=delete_habit
+            command=self._delete_edit_task_form
         ).pack(side="left", padx=(0, 10), fill="x", expand=True)
+
+        self.edit_task_fields = fields
+
+    def _save_edit_task_form(self):
+        fields = self.edit_task_fields
+        task_id = self._editing_task_id
+        new_title = fields["title"].get().strip()
+        new_category = fields["category"].get()
+        new_due_date = fields["due_date"].get().strip()
+        new_priority = fields["priority"].get()
+        new_description = fields["description"].get("1.0", ctk.END).strip()
+
+        if not new_title:
+            messagebox.showwarning("Warning", "Task title cannot be empty.")
+            return
+
+        if new_due_date:
+            try:
+                datetime.strptime(new_due_date, '%Y-%m-%d')
+            except ValueError:
+                messagebox.showwarning("Warning", "Due date must be in YYYY-MM-DD format (e.g., 2025-06-30).")
+                return
+
+        category_id = self.db_manager.get_category_id_by_name(new_category)
+        if category_id is None:
+            messagebox.showwarning("Warning", "Invalid category selected.")
+            return
+
+        success = self.db_manager.update_task(
+            task_id,
+            new_title,
+            new_description if new_description else None,
+            new_priority,
+            new_due_date if new_due_date else None,
+            category_id
+        )
+        if success:
+            self._forget_cached_tasks()
+            messagebox.showinfo("Success", "Task updated successfully!")
+            self.hide_task_detail()
+            self.render_scheduler.mark_dirty("list", self.get_current_filter())
+        else:
+            messagebox.showerror("Error", "Failed to update task.")
+
+    def _delete_edit_task_form(self):
+        if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this task?"):
+            success = self.db_manager.delete_task(self._editing_task_id)
+            if success:
+                self._forget_cached_tasks()
+                messagebox.showinfo("Success", "Task deleted successfully!")
+                self.hide_task_detail()
+                self.render_scheduler.mark_dirty("list", self.get_current_filter())
+            else:
+                messagebox.showerror("Error", "Failed to delete task.")
+
+    def _reset_calendar(self, cal, date_str=None):
+        """Select date_str on a reused calendar, or clear it and show the current month."""
+        if date_str:
+            try:
+                cal.selection_set(date_str)
+                return
+            except Exception:
+                pass
+        cal.selection_clear()
+        philippines_timezone = pytz.timezone('Asia/Manila')
+        cal.see(datetime.now(philippines_timezone).date())
+
+    def _open_dialog(self, dialog, width, height, on_screen=False):
+        """Show a pre-built dialog centered over the main window (or the screen)."""
+        if on_screen:
+            x = (dialog.winfo_screenwidth() - width) // 2
+            y = (dialog.winfo_screenheight() - height) // 2
+        else:
+            x = self.winfo_rootx() + (self.winfo_width() - width) // 2
+            y = self.winfo_rooty() + (self.winfo_height() - height) // 2
+        dialog.geometry(f"{width}x{height}+{max(x, 0)}+{max(y, 0)}")
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+
+    def _close_dialog(self, dialog):
+        """Hide a pre-built dialog so the next open only has to re-fill it."""
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def _record_dialog_open(self, name, start_time, built):
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.dialog_open_times.setdefault(name, []).append((elapsed_ms, built))
+        print(f"Opened {name} in {elapsed_ms:.1f} ms ({'built' if built else 'reused'})")
     
+    @traced()
     def show_habit_page(self):
         """Display the habit page with recurring tasks grouped by recurrence pattern."""
         # Hide any open detail pane
-        self.selected_task = None
-        self.detail_pane_visible = False
+        self.hide_task_detail()
         
         # Hide task detail pane if it exists
         if hasattr(self, 'task_detail_pane'):
             self.task_detail_pane.pack_forget()
-        
-        # Hide calendar detail pane if it exists
-        if hasattr(self, 'detail_pane'):
-            self.detail_pane.pack_forget()
             
         self.navbar.pack_forget()
         self.content.pack_forget()
@@ -1347,7 +1625,7 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             self.content,
             text="Habits & Recurring Tasks",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.styles.font(size=24, weight="bold"),
             text_color="#A85BC2"
         ).pack(anchor="nw", pady=(10, 0), padx=10)
         
@@ -1380,7 +1658,7 @@ class TimePlanApp(ctk.CTk):
         add_habit_btn = ctk.CTkButton(
             habits_scroll_frame,
             text="Create New Habit",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.styles.font(size=14, weight="bold"),
             fg_color="#C576E0",
             hover_color="#A85BC2",
             command=self.show_add_recurring_task_dialog
@@ -1392,7 +1670,7 @@ class TimePlanApp(ctk.CTk):
             ctk.CTkLabel(
                 habits_scroll_frame,
                 text="No recurring tasks found. Create your first habit!",
-                font=ctk.CTkFont(size=16),
+                font=self.styles.font(size=16),
                 text_color="#6A057F"
             ).pack(pady=20)
             return
@@ -1423,7 +1701,7 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             section_frame,
             text=section_title,
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self.styles.font(size=18, weight="bold"),
             text_color="#6A057F"
         ).pack(anchor="nw", pady=(10, 5), padx=10)
         
@@ -1475,7 +1753,7 @@ class TimePlanApp(ctk.CTk):
             ctk.CTkLabel(
                 task_frame, 
                 text=rtask_title, 
-                font=ctk.CTkFont(size=16, weight="bold"),
+                font=self.styles.font(size=16, weight="bold"),
                 text_color="#333333", 
                 anchor="w", 
                 wraplength=400
@@ -1486,7 +1764,7 @@ class TimePlanApp(ctk.CTk):
                 ctk.CTkLabel(
                     task_frame, 
                     text=description, 
-                    font=ctk.CTkFont(size=14),
+                    font=self.styles.font(size=14),
                     text_color="#666666", 
                     anchor="w", 
                     wraplength=400
@@ -1497,7 +1775,7 @@ class TimePlanApp(ctk.CTk):
             ctk.CTkLabel(
                 task_frame, 
                 text=last_completed_text,
-                font=ctk.CTkFont(size=12),
+                font=self.styles.font(size=12),
                 text_color="#888888", 
                 anchor="e"
             ).grid(row=0, column=2, padx=(5, 10), pady=(10, 0), sticky="ne")
@@ -1506,7 +1784,7 @@ class TimePlanApp(ctk.CTk):
             edit_btn = ctk.CTkButton(
                 task_frame,
                 text="Edit",
-                font=ctk.CTkFont(size=12),
+                font=self.styles.font(size=12),
                 width=60,
                 height=24,
                 fg_color="#9575CD",
@@ -1517,180 +1795,27 @@ class TimePlanApp(ctk.CTk):
     
     def show_add_recurring_task_dialog(self):
         """Show dialog to add a new recurring task."""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("Add New Habit")
-        dialog.geometry("500x450")
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = self.winfo_rootx() + (self.winfo_width() - dialog.winfo_width()) // 2
-        y = self.winfo_rooty() + (self.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        # Title
-        ctk.CTkLabel(
-            dialog,
-            text="Create New Habit",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color="#6A057F"
-        ).pack(pady=(20, 10), padx=20)
-        
-        # Task title
-        ctk.CTkLabel(
-            dialog, 
-            text="Habit Title:",
-            font=ctk.CTkFont(size=14),
-            anchor="w"
-        ).pack(anchor="w", padx=20, pady=(10, 0))
-        
-        title_entry = ctk.CTkEntry(
-            dialog,
-            width=460,
-            placeholder_text="Enter habit title..."
-        )
-        title_entry.pack(padx=20, pady=5, fill="x")
-        
-        # Description
-        ctk.CTkLabel(
-            dialog,
-            text="Description (Optional):",
-            font=ctk.CTkFont(size=14),
-            anchor="w"
-        ).pack(anchor="w", padx=20, pady=(10, 0))
-        
-        description_entry = ctk.CTkEntry(
-            dialog,
-            width=460,
-            placeholder_text="Enter habit description..."
-        )
-        description_entry.pack(padx=20, pady=5, fill="x")
-        
-        # Start date
-        ctk.CTkLabel(
-            dialog,
-            text="Start Date:",
-            font=ctk.CTkFont(size=14),
-            anchor="w"
-        ).pack(anchor="w", padx=20, pady=(10, 0))
-        
-        def pick_date():
-            date_dialog = ctk.CTkToplevel(dialog)
-            date_dialog.title("Select Date")
-            date_dialog.geometry("300x300")
-            date_dialog.transient(dialog)
-            date_dialog.grab_set()
-            
-            cal = Calendar(date_dialog, selectmode='day', date_pattern='yyyy-mm-dd')
-            cal.pack(pady=20)
-            
-            def set_date():
-                selected_date = cal.get_date()
-                start_date_entry.delete(0, ctk.END)
-                start_date_entry.insert(0, selected_date)
-                date_dialog.destroy()
-            
-            ctk.CTkButton(
-                date_dialog,
-                text="Select",
-                command=set_date
-            ).pack(pady=10)
-        
-        date_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        date_frame.pack(fill="x", padx=20, pady=5)
-        
-        start_date_entry = ctk.CTkEntry(date_frame, width=360)
-        start_date_entry.pack(side="left", fill="x", expand=True)
-        
+        start_time = time.perf_counter()
+        built = self.add_habit_fields is None
+        if built:
+            self.add_habit_fields = self._build_habit_dialog("Add New Habit", "Create New Habit", edit_mode=False)
+        fields = self.add_habit_fields
+
+        fields["title"].delete(0, ctk.END)
+        fields["description"].delete(0, ctk.END)
         # Set default date to today
         philippines_timezone = pytz.timezone('Asia/Manila')
         current_local_date = datetime.now(philippines_timezone).date().strftime('%Y-%m-%d')
-        start_date_entry.insert(0, current_local_date)
-        
-        date_picker_btn = ctk.CTkButton(
-            date_frame,
-            text="📅",
-            width=30,
-            command=pick_date
-        )
-        date_picker_btn.pack(side="right", padx=(5, 0))
-        
-        # Recurrence pattern
-        ctk.CTkLabel(
-            dialog,
-            text="Recurrence Pattern:",
-            font=ctk.CTkFont(size=14),
-            anchor="w"
-        ).pack(anchor="w", padx=20, pady=(10, 0))
-        
-        recurrence_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        recurrence_frame.pack(fill="x", padx=20, pady=5)
-        
-        recurrence_var = ctk.StringVar(value="Daily")
-        recurrence_options = ["Daily", "Weekly", "Monthly", "Annual"]
-        
-        for i, option in enumerate(recurrence_options):
-            recurrence_btn = ctk.CTkRadioButton(
-                recurrence_frame,
-                text=option,
-                variable=recurrence_var,
-                value=option,
-                font=ctk.CTkFont(size=14)
-            )
-            recurrence_btn.pack(side="left", padx=(0 if i == 0 else 10, 0))
-        
-        # Buttons
-        buttons_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        buttons_frame.pack(fill="x", padx=20, pady=20)
-        
-        ctk.CTkButton(
-            buttons_frame,
-            text="Cancel",
-            fg_color="#E0E0E0",
-            text_color="#333333",
-            hover_color="#C0C0C0",
-            command=dialog.destroy
-        ).pack(side="left", padx=(0, 10), fill="x", expand=True)
-        
-        def save_habit():
-            rtask_title = title_entry.get().strip()
-            description = description_entry.get().strip()
-            start_date = start_date_entry.get().strip()
-            recurrence_pattern = recurrence_var.get()
-            
-            if not rtask_title:
-                messagebox.showwarning("Warning", "Please enter a habit title.")
-                return
-                
-            # Add the habit to the database
-            success = self.db_manager.add_recurring_task(
-                self.current_user_id,
-                rtask_title,
-                description if description else None,
-                start_date,
-                recurrence_pattern
-            )
-            
-            if success:
-                messagebox.showinfo("Success", "New habit created successfully!")
-                dialog.destroy()
-                # Refresh the habit page
-                if self.current_page == "habit":
-                    self.show_habit_page()
-            else:
-                messagebox.showerror("Error", "Failed to create habit. Please try again.")
-        
-        ctk.CTkButton(
-            buttons_frame,
-            text="Save",
-            fg_color="#C576E0",
-            hover_color="#A85BC2",
-            command=save_habit
-        ).pack(side="right", fill="x", expand=True)
+        fields["start_date"].delete(0, ctk.END)
+        fields["start_date"].insert(0, current_local_date)
+        fields["recurrence"].set("Daily")
+
+        self._open_dialog(fields["dialog"], 500, 450)
+        self._record_dialog_open("add_habit", start_time, built)
     
     def show_edit_recurring_task_dialog(self, rtask_id):
         """Show dialog to edit an existing recurring task."""
+        start_time = time.perf_counter()
         # Get the recurring task from database
         tasks = self.db_manager._fetch_all(
             "SELECT rtask_id, rtask_title, description, start_date, recurrence_pattern, last_completed_date FROM recurring_tasks WHERE rtask_id = ?", 
@@ -1703,25 +1828,55 @@ class TimePlanApp(ctk.CTk):
         
         task = tasks[0]
         rtask_id, rtask_title, description, start_date, recurrence_pattern, last_completed_date = task
-        
-        # Create dialog
+
+        built = self.edit_habit_fields is None
+        if built:
+            self.edit_habit_fields = self._build_habit_dialog("Edit Habit", "Edit Habit", edit_mode=True)
+        fields = self.edit_habit_fields
+        fields["rtask_id"] = rtask_id
+
+        fields["title"].delete(0, ctk.END)
+        fields["title"].insert(0, rtask_title)
+        fields["description"].delete(0, ctk.END)
+        if description:
+            fields["description"].insert(0, description)
+
+        fields["start_date"].delete(0, ctk.END)
+        if start_date:
+            fields["start_date"].insert(0, start_date)
+        else:
+            # Set default date to today
+            philippines_timezone = pytz.timezone('Asia/Manila')
+            current_local_date = datetime.now(philippines_timezone).date().strftime('%Y-%m-%d')
+            fields["start_date"].insert(0, current_local_date)
+
+        fields["recurrence"].set(recurrence_pattern.capitalize() if recurrence_pattern else "Daily")
+
+        # Last completed date (display only)
+        if last_completed_date:
+            fields["last_completed"].configure(text=last_completed_date)
+            fields["last_completed_frame"].pack(fill="x", padx=20, pady=(10, 0), before=fields["buttons_frame"])
+        else:
+            fields["last_completed_frame"].pack_forget()
+
+        self._open_dialog(fields["dialog"], 500, 490)
+        self._record_dialog_open("edit_habit", start_time, built)
+
+    def _build_habit_dialog(self, window_title, heading, edit_mode):
+        """Build the add/edit habit dialog once; it is hidden instead of destroyed on close."""
+        fields = {}
         dialog = ctk.CTkToplevel(self)
-        dialog.title("Edit Habit")
-        dialog.geometry("500x490")
+        dialog.withdraw()
+        dialog.title(window_title)
         dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = self.winfo_rootx() + (self.winfo_width() - dialog.winfo_width()) // 2
-        y = self.winfo_rooty() + (self.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._close_dialog(dialog))
+        fields["dialog"] = dialog
         
         # Title
         ctk.CTkLabel(
             dialog,
-            text="Edit Habit",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            text=heading,
+            font=self.styles.font(size=20, weight="bold"),
             text_color="#6A057F"
         ).pack(pady=(20, 10), padx=20)
         
@@ -1729,84 +1884,51 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             dialog, 
             text="Habit Title:",
-            font=ctk.CTkFont(size=14),
+            font=self.styles.font(size=14),
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(10, 0))
         
-        title_entry = ctk.CTkEntry(
+        fields["title"] = ctk.CTkEntry(
             dialog,
             width=460,
             placeholder_text="Enter habit title..."
         )
-        title_entry.insert(0, rtask_title)
-        title_entry.pack(padx=20, pady=5, fill="x")
+        fields["title"].pack(padx=20, pady=5, fill="x")
         
         # Description
         ctk.CTkLabel(
             dialog,
             text="Description (Optional):",
-            font=ctk.CTkFont(size=14),
+            font=self.styles.font(size=14),
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(10, 0))
         
-        description_entry = ctk.CTkEntry(
+        fields["description"] = ctk.CTkEntry(
             dialog,
             width=460,
             placeholder_text="Enter habit description..."
         )
-        if description:
-            description_entry.insert(0, description)
-        description_entry.pack(padx=20, pady=5, fill="x")
+        fields["description"].pack(padx=20, pady=5, fill="x")
         
         # Start date
         ctk.CTkLabel(
             dialog,
             text="Start Date:",
-            font=ctk.CTkFont(size=14),
+            font=self.styles.font(size=14),
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(10, 0))
         
-        def pick_date():
-            date_dialog = ctk.CTkToplevel(dialog)
-            date_dialog.title("Select Date")
-            date_dialog.geometry("300x300")
-            date_dialog.transient(dialog)
-            date_dialog.grab_set()
-            
-            cal = Calendar(date_dialog, selectmode='day', date_pattern='yyyy-mm-dd')
-            cal.pack(pady=20)
-            
-            def set_date():
-                selected_date = cal.get_date()
-                start_date_entry.delete(0, ctk.END)
-                start_date_entry.insert(0, selected_date)
-                date_dialog.destroy()
-            
-            ctk.CTkButton(
-                date_dialog,
-                text="Select",
-                command=set_date
-            ).pack(pady=10)
-        
         date_frame = ctk.CTkFrame(dialog, fg_color="transparent")
         date_frame.pack(fill="x", padx=20, pady=5)
         
-        start_date_entry = ctk.CTkEntry(date_frame, width=360)
-        start_date_entry.pack(side="left", fill="x", expand=True)
-        
-        if start_date:
-            start_date_entry.insert(0, start_date)
-        else:
-            # Set default date to today
-            philippines_timezone = pytz.timezone('Asia/Manila')
-            current_local_date = datetime.now(philippines_timezone).date().strftime('%Y-%m-%d')
-            start_date_entry.insert(0, current_local_date)
+        fields["start_date"] = ctk.CTkEntry(date_frame, width=360)
+        fields["start_date"].pack(side="left", fill="x", expand=True)
         
         date_picker_btn = ctk.CTkButton(
             date_frame,
             text="📅",
             width=30,
-            command=pick_date
+            command=lambda: self._show_habit_date_picker(fields)
         )
         date_picker_btn.pack(side="right", padx=(5, 0))
         
@@ -1814,110 +1936,202 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             dialog,
             text="Recurrence Pattern:",
-            font=ctk.CTkFont(size=14),
+            font=self.styles.font(size=14),
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(10, 0))
         
         recurrence_frame = ctk.CTkFrame(dialog, fg_color="transparent")
         recurrence_frame.pack(fill="x", padx=20, pady=5)
         
-        recurrence_var = ctk.StringVar(value=recurrence_pattern.capitalize() if recurrence_pattern else "Daily")
+        fields["recurrence"] = ctk.StringVar(value="Daily")
         recurrence_options = ["Daily", "Weekly", "Monthly", "Annual"]
         
         for i, option in enumerate(recurrence_options):
             recurrence_btn = ctk.CTkRadioButton(
                 recurrence_frame,
                 text=option,
-                variable=recurrence_var,
+                variable=fields["recurrence"],
                 value=option,
-                font=ctk.CTkFont(size=14)
+                font=self.styles.font(size=14)
             )
             recurrence_btn.pack(side="left", padx=(0 if i == 0 else 10, 0))
-        
-        # Last completed date (display only)
-        if last_completed_date:
-            # Create a frame for the last completed date to place it on the right
+
+        # Buttons
+        buttons_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        fields["buttons_frame"] = buttons_frame
+
+        if edit_mode:
+            # Last completed date (display only), packed only when the habit has one
             last_completed_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-            last_completed_frame.pack(fill="x", padx=20, pady=(10, 0))
+            fields["last_completed_frame"] = last_completed_frame
             
             # Add explanation text
             ctk.CTkLabel(
                 last_completed_frame,
                 text="Last done:",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self.styles.font(size=14, weight="bold"),
                 text_color="#6A057F"
             ).pack(side="left")
             
             # Add date
-            ctk.CTkLabel(
+            fields["last_completed"] = ctk.CTkLabel(
                 last_completed_frame,
-                text=last_completed_date,
-                font=ctk.CTkFont(size=14, slant="italic"),
+                text="",
+                font=self.styles.font(size=14, slant="italic"),
                 text_color="#888888"
-            ).pack(side="left", padx=(5, 0))
-        
-        # Define action functions
-        def delete_habit():
-            if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this habit?"):
-                success = self.db_manager.delete_recurring_task(rtask_id)
-                if success:
-                    messagebox.showinfo("Success", "Habit deleted successfully!")
-                    dialog.destroy()
-                    # Refresh the habit page
-                    if self.current_page == "habit":
-                        self.show_habit_page()
-                else:
-                    messagebox.showerror("Error", "Failed to delete habit. Please try again.")
-        
-        def save_habit():
-            new_rtask_title = title_entry.get().strip()
-            new_description = description_entry.get().strip()
-            new_start_date = start_date_entry.get().strip()
-            new_recurrence_pattern = recurrence_var.get().lower()
+            )
+            fields["last_completed"].pack(side="left", padx=(5, 0))
+
+            buttons_frame.pack(fill="x", padx=20, pady=20)
+
+            # Save button (now on the left)
+            ctk.CTkButton(
+                buttons_frame,
+                text="Save",
+                fg_color="#4CAF50",
+                hover_color="#388E3C",
+                command=self._save_edited_habit
+            ).pack(side="left", padx=(0, 10), fill="x", expand=True)
             
-            if not new_rtask_title:
-                messagebox.showwarning("Warning", "Please enter a habit title.")
-                return
+            # Delete button (now on the right)
+            ctk.CTkButton(
+                buttons_frame,
+                text="Delete",
+                fg_color="#FF5252",
+                hover_color="#FF1744",
+                command=self._delete_edited_habit
+            ).pack(side="left", padx=(0, 10), fill="x", expand=True)
+        else:
+            buttons_frame.pack(fill="x", padx=20, pady=20)
+
+            ctk.CTkButton(
+                buttons_frame,
+                text="Cancel",
+                fg_color="#E0E0E0",
+                text_color="#333333",
+                hover_color="#C0C0C0",
+                command=lambda: self._close_dialog(dialog)
+            ).pack(side="left", padx=(0, 10), fill="x", expand=True)
+
+            ctk.CTkButton(
+                buttons_frame,
+                text="Save",
+                fg_color="#C576E0",
+                hover_color="#A85BC2",
+                command=self._save_new_habit
+            ).pack(side="right", fill="x", expand=True)
+
+        return fields
+
+    def _show_habit_date_picker(self, fields):
+        """Show the start date picker of a habit dialog, building it on first use."""
+        picker = fields.get("date_picker")
+        if picker is None:
+            picker = ctk.CTkToplevel(fields["dialog"])
+            picker.withdraw()
+            picker.title("Select Date")
+            picker.transient(fields["dialog"])
             
-            # Update the habit in the database
-            success = self.db_manager.update_recurring_task(
-                rtask_id,
-                new_rtask_title,
-                new_description if new_description else None,
-                new_start_date,
-                new_recurrence_pattern
-            )
+            def close_picker():
+                # Hand the grab back to the habit dialog however the picker closes
+                self._close_dialog(picker)
+                fields["dialog"].grab_set()
+            
+            picker.protocol("WM_DELETE_WINDOW", close_picker)
             
+            from tkcalendar import Calendar
+            cal = Calendar(picker, selectmode='day', date_pattern='yyyy-mm-dd')
+            cal.pack(pady=20)
+            
+            def set_date():
+                fields["start_date"].delete(0, ctk.END)
+                fields["start_date"].insert(0, cal.get_date())
+                close_picker()
+            
+            ctk.CTkButton(
+                picker,
+                text="Select",
+                command=set_date
+            ).pack(pady=10)
+            fields["date_picker"] = picker
+            fields["date_picker_calendar"] = cal
+
+        self._reset_calendar(fields["date_picker_calendar"], fields["start_date"].get().strip())
+        picker.geometry("300x300")
+        picker.deiconify()
+        picker.lift()
+        picker.grab_set()
+
+    def _save_new_habit(self):
+        fields = self.add_habit_fields
+        rtask_title = fields["title"].get().strip()
+        description = fields["description"].get().strip()
+        start_date = fields["start_date"].get().strip()
+        recurrence_pattern = fields["recurrence"].get()
+        
+        if not rtask_title:
+            messagebox.showwarning("Warning", "Please enter a habit title.")
+            return
+            
+        # Add the habit to the database
+        success = self.db_manager.add_recurring_task(
+            self.current_user_id,
+            rtask_title,
+            description if description else None,
+            start_date,
+            recurrence_pattern
+        )
+        
+        if success:
+            messagebox.showinfo("Success", "New habit created successfully!")
+            self._close_dialog(fields["dialog"])
+            # Refresh the habit page
+            if self.current_page == "habit":
+                self.render_scheduler.mark_dirty("habits")
+        else:
+            messagebox.showerror("Error", "Failed to create habit. Please try again.")
+
+    def _save_edited_habit(self):
+        fields = self.edit_habit_fields
+        new_rtask_title = fields["title"].get().strip()
+        new_description = fields["description"].get().strip()
+        new_start_date = fields["start_date"].get().strip()
+        new_recurrence_pattern = fields["recurrence"].get().lower()
+        
+        if not new_rtask_title:
+            messagebox.showwarning("Warning", "Please enter a habit title.")
+            return
+        
+        # Update the habit in the database
+        success = self.db_manager.update_recurring_task(
+            fields["rtask_id"],
+            new_rtask_title,
+            new_description if new_description else None,
+            new_start_date,
+            new_recurrence_pattern
+        )
+        
+        if success:
+            messagebox.showinfo("Success", "Habit updated successfully!")
+            self._close_dialog(fields["dialog"])
+            # Refresh the habit page
+            if self.current_page == "habit":
+                self.render_scheduler.mark_dirty("habits")
+        else:
+            messagebox.showerror("Error", "Failed to update habit. Please try again.")
+
+    def _delete_edited_habit(self):
+        fields = self.edit_habit_fields
+        if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this habit?"):
+            success = self.db_manager.delete_recurring_task(fields["rtask_id"])
             if success:
-                messagebox.showinfo("Success", "Habit updated successfully!")
-                dialog.destroy()
+                messagebox.showinfo("Success", "Habit deleted successfully!")
+                self._close_dialog(fields["dialog"])
                 # Refresh the habit page
                 if self.current_page == "habit":
-                    self.show_habit_page()
+                    self.render_scheduler.mark_dirty("habits")
             else:
-                messagebox.showerror("Error", "Failed to update habit. Please try again.")
-        
-        # Buttons
-        buttons_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        buttons_frame.pack(fill="x", padx=20, pady=20)
-        
-        # Save button (now on the left)
-        ctk.CTkButton(
-            buttons_frame,
-            text="Save",
-            fg_color="#4CAF50",
-            hover_color="#388E3C",
-            command=save_habit
-        ).pack(side="left", padx=(0, 10), fill="x", expand=True)
-        
-        # Delete button (now on the right)
-        ctk.CTkButton(
-            buttons_frame,
-            text="Delete",
-            fg_color="#FF5252",
-            hover_color="#FF1744",
-            command=delete_habit
-        ).pack(side="left", padx=(0, 10), fill="x", expand=True)
+                messagebox.showerror("Error", "Failed to delete habit. Please try again.")
     
     def toggle_habit_completion(self, rtask_id, status_var):
         """Toggle completion status of a recurring task."""
@@ -1932,9 +2146,11 @@ class TimePlanApp(ctk.CTk):
             self.db_manager.remove_recurring_task_completion(rtask_id, current_local_date)
         
         # Refresh the habit page to show updated status
-        self.show_habit_page()
+        self.render_scheduler.mark_dirty("habits")
 
     def confirm_delete_task(self, task_id):
+        if self._refuse_archived(task_id):
+            return
         confirm = messagebox.askyesno(
             title="Confirm Delete",
             message="Are you sure you want to delete this task? This action cannot be undone."
@@ -1946,6 +2162,7 @@ class TimePlanApp(ctk.CTk):
             
             success = self.db_manager.delete_task(task_id)
             if success:
+                self._forget_cached_tasks()
                 # Show success popup
                 messagebox.showinfo("Success", "Task deleted successfully!")
                 
@@ -1955,11 +2172,11 @@ class TimePlanApp(ctk.CTk):
                 # Determine which page to return to based on where the user came from
                 if self.current_page == "calendar":
                     # If user was on calendar page, return there
-                    self.show_calendar_page()
+                    self.render_scheduler.mark_dirty("calendar")
                               
                 else:
                     # Otherwise, refresh the task list with the current filter
-                    self.show_tasks_page(current_filter)
+                    self.render_scheduler.mark_dirty("list", current_filter)
             else:
                 messagebox.showerror("Error", "Failed to delete task.")
 
@@ -1972,6 +2189,17 @@ class TimePlanApp(ctk.CTk):
                 break
         return current_filter
         
+    def update_nav_badges(self):
+        """Show the task count of each filter next to its button (read from the counter tables)."""
+        counts = self.db_manager.get_filter_counts(self.current_user_id)
+        for name, badge in self.navbar_badges.items():
+            count = counts.get(name, 0)
+            if count:
+                badge.configure(text=str(count))
+                badge.place(relx=1.0, rely=0.5, x=-10, anchor="e")
+            else:
+                badge.place_forget()
+
     def update_filter_buttons(self, selected_filter):
         """Update the filter buttons to highlight the selected one."""
         for btn in self.navbar_nav_items:
@@ -1997,21 +2225,32 @@ class TimePlanApp(ctk.CTk):
             return self.on_Going_category_id
 
     def show_add_task_dialog(self):
+        start_time = time.perf_counter()
+        built = self.add_task_fields is None
+        if built:
+            self._build_add_task_dialog()
+        fields = self.add_task_fields
+
+        # Reset the form for a new task
+        fields["title"].delete(0, ctk.END)
+        fields["description"].delete("1.0", ctk.END)
+        fields["priority"].set("Not urgent")
+        fields["due_date"].set("")
+        self._reset_calendar(fields["calendar"])
+
+        self._open_dialog(fields["dialog"], 400, 600, on_screen=True)
+        self._record_dialog_open("add_task", start_time, built)
+
+    def _build_add_task_dialog(self):
+        """Build the add task popup once; it is hidden instead of destroyed on close."""
+        fields = {}
         # Create the popup window
         dialog = ctk.CTkToplevel(self)
+        dialog.withdraw()
         dialog.title("Add New Task")
-        dialog.geometry("400x600")  # More compact size
         dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center the dialog on the screen
-        window_width = 400
-        window_height = 600
-        screen_width = dialog.winfo_screenwidth()
-        screen_height = dialog.winfo_screenheight()
-        center_x = int((screen_width - window_width) / 2)
-        center_y = int((screen_height - window_height) / 2)
-        dialog.geometry(f"{window_width}x{window_height}+{center_x}+{center_y}")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._close_dialog(dialog))
+        fields["dialog"] = dialog
 
         # Create a scrollable frame
         scroll_container = ctk.CTkScrollableFrame(dialog, fg_color="white", corner_radius=10)
@@ -2021,29 +2260,29 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             scroll_container,
             text="Add New Task",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.styles.font(size=24, weight="bold"),
             text_color="#A85BC2"
         ).pack(pady=(10, 20))
 
         # Title
-        ctk.CTkLabel(scroll_container, text="Title:", font=ctk.CTkFont(size=14, weight="bold"), text_color="#6A057F").pack(anchor="w")
-        title_entry = ctk.CTkEntry(scroll_container, placeholder_text="Task title")
-        title_entry.pack(fill="x", pady=(0, 15))
+        ctk.CTkLabel(scroll_container, text="Title:", font=self.styles.font(size=14, weight="bold"), text_color="#6A057F").pack(anchor="w")
+        fields["title"] = ctk.CTkEntry(scroll_container, placeholder_text="Task title")
+        fields["title"].pack(fill="x", pady=(0, 15))
 
         # Description
-        ctk.CTkLabel(scroll_container, text="Description:", font=ctk.CTkFont(size=14, weight="bold"), text_color="#6A057F").pack(anchor="w")
-        description_entry = ctk.CTkTextbox(scroll_container, height=80)  # Reduced height
-        description_entry.pack(fill="x", pady=(0, 15))
+        ctk.CTkLabel(scroll_container, text="Description:", font=self.styles.font(size=14, weight="bold"), text_color="#6A057F").pack(anchor="w")
+        fields["description"] = ctk.CTkTextbox(scroll_container, height=80)  # Reduced height
+        fields["description"].pack(fill="x", pady=(0, 15))
 
         # Priority
-        ctk.CTkLabel(scroll_container, text="Priority:", font=ctk.CTkFont(size=14, weight="bold"), text_color="#6A057F").pack(anchor="w")
-        priority_menu = ctk.CTkOptionMenu(scroll_container, values=["Not urgent", "Urgent"])
-        priority_menu.set("Not urgent")
-        priority_menu.pack(fill="x", pady=(0, 15))
+        ctk.CTkLabel(scroll_container, text="Priority:", font=self.styles.font(size=14, weight="bold"), text_color="#6A057F").pack(anchor="w")
+        fields["priority"] = ctk.CTkOptionMenu(scroll_container, values=["Not urgent", "Urgent"])
+        fields["priority"].pack(fill="x", pady=(0, 15))
 
         # Due Date
-        ctk.CTkLabel(scroll_container, text="Due Date:", font=ctk.CTkFont(size=14, weight="bold"), anchor="w").pack(anchor="w")
+        ctk.CTkLabel(scroll_container, text="Due Date:", font=self.styles.font(size=14, weight="bold"), anchor="w").pack(anchor="w")
         due_date_var = ctk.StringVar()
+        fields["due_date"] = due_date_var
         due_date_entry = ctk.CTkEntry(scroll_container, textvariable=due_date_var)
         due_date_entry.pack(fill="x", pady=(0, 5))
 
@@ -2051,6 +2290,7 @@ class TimePlanApp(ctk.CTk):
         calendar_frame = ctk.CTkFrame(scroll_container, fg_color="#FFFFFF", corner_radius=5)
         calendar_frame.pack(fill="x", pady=(0, 10), padx=5)
 
+        from tkcalendar import Calendar
         cal = Calendar(calendar_frame, selectmode='day', date_pattern='yyyy-mm-dd',
                       background="#FFFFFF",
                       selectbackground="#A85BC2",
@@ -2061,6 +2301,7 @@ class TimePlanApp(ctk.CTk):
                       font=("Arial", 10),
                       showmonth=True,
                       foreground="black")
+        fields["calendar"] = cal
 
         def on_date_selected(event=None):
             due_date_var.set(cal.get_date())
@@ -2068,45 +2309,48 @@ class TimePlanApp(ctk.CTk):
         cal.bind("<<CalendarSelected>>", on_date_selected)
         cal.pack(padx=5, pady=5, fill="x")
 
-        # Add Task Button
-        def save_task():
-            title = title_entry.get().strip()
-            if not title:
-                messagebox.showerror("Error", "Title is required!")
-                return
-
-            description = description_entry.get("1.0", ctk.END).strip()
-            due_date = due_date_var.get()
-            priority = priority_menu.get()
-
-            # Determine category based on due date
-            category_id = self.determine_category_by_date(due_date)
-
-            success = self.db_manager.add_task(
-                self.current_user_id,
-                title,
-                description if description else None,
-                priority,
-                due_date if due_date else None,
-                category_id
-            )
-
-            if success:
-                messagebox.showinfo("Success", "Task added successfully!")
-                dialog.destroy()
-                self.show_tasks_page("All Tasks")
-            else:
-                messagebox.showerror("Error", "Failed to add task!")
-
         save_btn = ctk.CTkButton(
             scroll_container,
             text="Add Task",
-            command=save_task,
+            command=self._save_add_task_dialog,
             fg_color="#A85BC2",
             hover_color="#C576E0"
         )
         save_btn.pack(fill="x", pady=20)
 
+        self.add_task_fields = fields
+
+    def _save_add_task_dialog(self):
+        fields = self.add_task_fields
+        title = fields["title"].get().strip()
+        if not title:
+            messagebox.showerror("Error", "Title is required!")
+            return
+
+        description = fields["description"].get("1.0", ctk.END).strip()
+        due_date = fields["due_date"].get()
+        priority = fields["priority"].get()
+
+        # Determine category based on due date
+        category_id = self.determine_category_by_date(due_date)
+
+        success = self.db_manager.add_task(
+            self.current_user_id,
+            title,
+            description if description else None,
+            priority,
+            due_date if due_date else None,
+            category_id
+        )
+
+        if success:
+            messagebox.showinfo("Success", "Task added successfully!")
+            self._close_dialog(fields["dialog"])
+            self.render_scheduler.mark_dirty("list", "All Tasks")
+        else:
+            messagebox.showerror("Error", "Failed to add task!")
+
+    @traced()
     def show_search_dialog(self):
         # Create the popup window
         dialog = ctk.CTkToplevel(self)
@@ -2132,7 +2376,7 @@ class TimePlanApp(ctk.CTk):
         ctk.CTkLabel(
             content_frame,
             text="Search Task",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.styles.font(size=24, weight="bold"),
             text_color="#A85BC2"
         ).pack(pady=(20, 30))
 
@@ -2146,7 +2390,7 @@ class TimePlanApp(ctk.CTk):
             placeholder_text="Enter task title to search...",
             textvariable=search_var,
             height=40,
-            font=ctk.CTkFont(size=14)
+            font=self.styles.font(size=14)
         )
         search_entry.pack(fill="x", side="left", expand=True)
 
@@ -2158,12 +2402,13 @@ class TimePlanApp(ctk.CTk):
         results_label = ctk.CTkLabel(
             results_frame,
             text="No results found",
-            font=ctk.CTkFont(size=12),
+            font=self.styles.font(size=12),
             text_color="#666666"
         )
         results_label.pack(fill="x", pady=(10, 0))
 
         # Combobox for results
+        from tkinter import ttk
         results_combobox = ttk.Combobox(
             results_frame,
             state="readonly",
@@ -2186,16 +2431,9 @@ class TimePlanApp(ctk.CTk):
                 task_type.clear()
                 return
 
-            # Search for regular tasks in database
-            regular_query = """
-                SELECT t.task_id, t.task_title, t.due_date, tc.category_name
-                FROM tasks t
-                JOIN task_category tc ON t.category_id = tc.category_id
-                WHERE LOWER(t.task_title) LIKE ? AND t.user_id = ?
-                ORDER BY t.due_date DESC
-            """
+            # Search for regular tasks in database, archived ones included
             search_pattern = f"%{search_text}%"
-            regular_results = self.db_manager._fetch_all(regular_query, (search_pattern, self.current_user_id))
+            regular_results = self.db_manager.get_task_history(self.current_user_id, title_like=search_pattern)
             
             # Search for recurring tasks in database
             recurring_query = """
@@ -2219,7 +2457,7 @@ class TimePlanApp(ctk.CTk):
             task_type.clear()
             
             # Add regular tasks
-            for task_id, title, due_date, category in regular_results:
+            for task_id, title, _, _, due_date, category in regular_results:
                 if due_date:
                     display_text = f"{title} ({category} - Due: {due_date})"
                 else:
@@ -2249,21 +2487,14 @@ class TimePlanApp(ctk.CTk):
                 dialog.destroy()
                 
                 if task_type[selected] == "regular":
-                    # Regular task selected
-                    # Get the category of the selected task
-                    query = """
-                        SELECT tc.category_name 
-                        FROM tasks t 
-                        JOIN task_category tc ON t.category_id = tc.category_id 
-                        WHERE t.task_id = ?
-                    """
-                    result = self.db_manager._fetch_one(query, (item_id,))
+                    # Regular task selected; get_task_by_id finds archived ones too
+                    result = self.get_task_by_id(item_id)
                     if result:
-                        category_name = result[0]
+                        category_name = result[5]
                         # Show the appropriate filtered page
-                        self.show_tasks_page(category_name)
+                        self.render_scheduler.mark_dirty("list", category_name)
                         # Show the task details
-                        self.show_task_detail(item_id)
+                        self.render_scheduler.mark_dirty("detail", item_id)
                 else:
                     # Recurring task selected
                     # Show the habit page
@@ -2279,44 +2510,33 @@ class TimePlanApp(ctk.CTk):
         search_entry.focus_set()
         
     def create_task_card(self, task_frame, task):
-        """Helper function to create a task card with unified styling"""
-        # Define color constants
-        ONGOING_BG_COLOR = "white"  # Default for uncompleted, non-missed tasks
-        MISSED_BG_COLOR = "#FFCDD2" # Light Red
-        COMPLETED_BG_COLOR = "#C8E6C9" # Light Green
-
-        task_id = task['id']  # Keep as 'id' since this is used for calendar view dictionary
-        category_name = task['category']
-        due_date = task.get('due_date', None)
-        title = task['title']  # Keep as 'title' since this is used for calendar view dictionarytle']  # Keep as 'title' since this is used for calendar view dictionary
-        description = task.get('description', '')
-        priority = task.get('priority', '')
+        """Helper function to create a task card with unified styling from a taskRecords.Task"""
+        task_id = task.task_id
+        category_name = task.category
+        due_date = task.due_date
+        title = task.title
+        description = task.description or ''
+        priority = task.priority or ''
 
         # Get current date for comparison
         philippines_timezone = pytz.timezone('Asia/Manila')
         current_local_date = datetime.now(philippines_timezone).date()
 
         # Determine task status and colors
-        frame_bg_color = ONGOING_BG_COLOR
-        title_color = "#333333"
         is_completed_by_category = (category_name == "Completed")
         is_missed = False
 
-        if not is_completed_by_category and due_date:
-            try:
-                due_date_obj = datetime.strptime(due_date, '%Y-%m-%d').date()
-                if due_date_obj < current_local_date:
-                    is_missed = True
-                    category_name = "Missed"
-            except ValueError:
-                pass
+        # due_day is pre-parsed; tasks without a valid due date are never missed
+        if not is_completed_by_category and task.due_day < day_ordinal(current_local_date):
+            is_missed = True
+            category_name = "Missed"
 
         if is_completed_by_category:
-            frame_bg_color = COMPLETED_BG_COLOR
-            title_color = "gray"
+            frame_bg_color, title_color = self.styles.card_colors("Completed")
         elif is_missed:
-            frame_bg_color = MISSED_BG_COLOR
-            title_color = "red"
+            frame_bg_color, title_color = self.styles.card_colors("Missed")
+        else:
+            frame_bg_color, title_color = self.styles.card_colors("On-going")
         
         task_frame.configure(fg_color=frame_bg_color, border_width=1, border_color="#E5C6F2")
         
@@ -2357,7 +2577,7 @@ class TimePlanApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             task_frame,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.styles.font(size=16, weight="bold"),
             text_color=title_color,
             anchor="w",
             wraplength=400
@@ -2372,7 +2592,7 @@ class TimePlanApp(ctk.CTk):
             priority_label = ctk.CTkLabel(
                 task_frame,
                 text=display_priority_text,
-                font=ctk.CTkFont(size=14),
+                font=self.styles.font(size=14),
                 text_color=title_color,
                 anchor="w"
             )
@@ -2385,7 +2605,7 @@ class TimePlanApp(ctk.CTk):
             desc_label = ctk.CTkLabel(
                 task_frame,
                 text=description,
-                font=ctk.CTkFont(size=12),
+                font=self.styles.font(size=12),
                 text_color=title_color,
                 wraplength=400,
                 anchor="nw"
@@ -2398,7 +2618,7 @@ class TimePlanApp(ctk.CTk):
         category_label = ctk.CTkLabel(
             task_frame,
             text=category_name,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.styles.font(size=12, weight="bold"),
             text_color="#666666",
             anchor="ne"
         )
@@ -2406,7 +2626,7 @@ class TimePlanApp(ctk.CTk):
         category_label = ctk.CTkLabel(
             task_frame,
             text=category_name,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.styles.font(size=12, weight="bold"),
             text_color="#666666",
             anchor="ne"
         )
@@ -2430,7 +2650,7 @@ class TimePlanApp(ctk.CTk):
             due_date_label = ctk.CTkLabel(
                 task_frame,
                 text=formatted_date_str,
-                font=ctk.CTkFont(size=12),
+                font=self.styles.font(size=12),
                 text_color="#666666",
                 anchor="ne",
                 justify="right"
@@ -2444,5 +2664,29 @@ class TimePlanApp(ctk.CTk):
         # If you want to link them in the future, you could add a recurring_task_id reference in the tasks table
 # Application entry point
 if __name__ == "__main__":
-    app = TimePlanApp()
-    app.mainloop()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="TimePlan task planner")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print the time spent in each startup phase")
+    parser.add_argument("--watch-stalls", type=int, nargs="?", const=250, metavar="MS",
+                        help="log the stack of any handler blocking the UI for longer than MS (default 250)")
+    parser.add_argument("--profile-actions", type=int, metavar="N",
+                        help="run cProfile around the next N clicks/key presses after startup")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="record UI, render and SQL spans and write them to FILE as a Chrome trace")
+    args = parser.parse_args()
+
+    tracer.enabled = bool(args.trace)
+    profiler = StartupProfiler(enabled=args.profile_startup, start_time=_MODULE_START)
+    profiler.mark("imports", _MODULE_START, until=_IMPORTS_DONE)
+    app = TimePlanApp(profiler=profiler, profile_actions=args.profile_actions)
+    if args.watch_stalls:
+        app.enable_stall_watchdog(args.watch_stalls)
+    app.mainloop()
+    app.action_profiler.stop()  # Window closed mid-capture
+    if args.trace:
+        tracer.save(args.trace)
+    if app.watchdog is not None:
+        summary = app.watchdog.summary()
+        print(f"Event-loop lag: {summary['loop_lag_ms']}")
+        print(f"Input-to-paint latency: {summary['input_to_paint_ms']}")
+        print(f"Stalls over {summary['threshold_ms']:.0f} ms: {len(summary['stalls'])}")
\ No newline at end of file
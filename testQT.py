@@ -2,11 +2,11 @@ import sys
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QGridLayout,
     QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout,
-    QMessageBox, QFrame, QTreeWidget, QTreeWidgetItem,
+    QMessageBox, QFrame, QTreeWidget, QTreeWidgetItem, QTreeView,
     QStackedWidget, QCalendarWidget, QToolTip, QScrollArea
 )
-from PyQt6.QtCore import Qt, QRect, QSize
-from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtCore import Qt, QRect, QSize, QDate, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
 from datetime import datetime, date
 #
 import calendar
@@ -75,6 +75,17 @@ def CreateHabitsTable():
     conn.commit()
     conn.close()
 
+def CreateTaskPageIndex():
+    # Lets TaskTableModel read each page as a range scan in (due_date, id) order
+    conn = Connect()
+    try:
+        conn.execute('CREATE INDEX IF NOT EXISTS tasks_user_due_page ON tasks (user_id, due_date, id)')
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+    finally:
+        conn.close()
+
 class LoginWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -312,83 +323,206 @@ class CollapsibleSidebar(QWidget):
         self.is_expanded = not self.is_expanded
 
 class TaskCalendarWidget(QCalendarWidget):
+    """Calendar that draws a task count and dot on days that have tasks.
+
+    paintCell also runs for hover and focus repaints, so it only indexes
+    two precomputed arrays with one entry per visible cell. The index is the
+    cell's Julian day minus first_day. Only the visible range is loaded, and
+    after a reload only the cells whose count or status changed are
+    repainted.
+    """
+
+    VISIBLE_DAYS = 42  # 6 weeks
+    STATUS_COLORS = {
+        None: QColor("#2980b9"),
+        'Completed': QColor('#27ae60'),
+        'Missed': QColor('#e74c3c'),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.tasks = {}  # Dictionary to store tasks by date
-        
+        self.tasks = {}  # Dictionary to store tasks by date, visible range only
+        self.user_id = None
+        self.first_day = 0  # Julian day of the first visible cell
+        self.day_counts = [0] * self.VISIBLE_DAYS
+        self.day_status = [None] * self.VISIBLE_DAYS
+        self.update_first_day()
+        self.currentPageChanged.connect(self.on_page_changed)
+
+    def update_first_day(self):
+        first = QDate(self.yearShown(), self.monthShown(), 1)
+        offset = (first.dayOfWeek() - self.firstDayOfWeek().value) % 7
+        if offset == 0:
+            offset = 7  # Qt shows at least one day of the previous month
+        self.first_day = first.toJulianDay() - offset
+
+    def on_page_changed(self, year, month):
+        # The whole calendar repaints on a page change, so no per-cell updates
+        self.update_first_day()
+        if self.user_id is not None:
+            self.updateTasks(self.user_id, repaint_changed=False)
+        else:
+            self.setTasks(self.tasks, repaint_changed=False)
+
     def paintCell(self, painter: QPainter, rect: QRect, date):
         # Paint the original cell
         super().paintCell(painter, rect, date)
-        
-        # If there are tasks for this date
-        date_str = date.toString("yyyy-MM-dd")
-        if date_str in self.tasks:
-            # Draw a colored dot or task count
-            tasks = self.tasks[date_str]
-            task_count = len(tasks)
-            
-            if task_count > 0:
-                # Draw task count
-                painter.save()
-                painter.setPen(QColor("#2980b9"))
-                painter.drawText(
-                    rect, 
-                    Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight,
-                    f"{task_count}"
-                )
-                
-                # Draw colored dot
-                dot_size = 8
-                painter.setBrush(QColor("#2980b9"))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(
-                    rect.right() - dot_size - 4,
-                    rect.top() + 4,
-                    dot_size,
-                    dot_size
-                )
-                painter.restore()
-    
-    def updateTasks(self, user_id):
-        self.tasks.clear()
+
+        index = date.toJulianDay() - self.first_day
+        if 0 <= index < self.VISIBLE_DAYS and self.day_counts[index] > 0:
+            color = self.STATUS_COLORS[self.day_status[index]]
+
+            # Draw task count
+            painter.save()
+            painter.setPen(color)
+            painter.drawText(
+                rect,
+                Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight,
+                f"{self.day_counts[index]}"
+            )
+
+            # Draw colored dot
+            dot_size = 8
+            painter.setBrush(color)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(
+                rect.right() - dot_size - 4,
+                rect.top() + 4,
+                dot_size,
+                dot_size
+            )
+            painter.restore()
+
+    def setTasks(self, tasks, repaint_changed=True):
+        """Replace the tasks by date and recompute the per-cell counts and status."""
+        self.tasks = tasks
+        counts = [0] * self.VISIBLE_DAYS
+        status = [None] * self.VISIBLE_DAYS
+        for date_str, day_tasks in tasks.items():
+            index = QDate.fromString(date_str, "yyyy-MM-dd").toJulianDay() - self.first_day
+            if not 0 <= index < self.VISIBLE_DAYS:
+                continue
+            statuses = {task['status'] for task in day_tasks}
+            counts[index] = len(day_tasks)
+            if 'Missed' in statuses:
+                status[index] = 'Missed'
+            elif statuses == {'Completed'}:
+                status[index] = 'Completed'
+
+        changed = [
+            i for i in range(self.VISIBLE_DAYS)
+            if counts[i] != self.day_counts[i] or status[i] != self.day_status[i]
+        ]
+        self.day_counts = counts
+        self.day_status = status
+        if repaint_changed:
+            for i in changed:
+                self.updateCell(QDate.fromJulianDay(self.first_day + i))
+
+    def updateTasks(self, user_id, repaint_changed=True):
+        self.user_id = user_id
+        tasks = {}
         conn = Connect()
         cursor = conn.cursor()
-        
+
         try:
+            # Only the range the calendar currently shows
+            range_start = QDate.fromJulianDay(self.first_day).toString("yyyy-MM-dd")
+            range_end = QDate.fromJulianDay(self.first_day + self.VISIBLE_DAYS).toString("yyyy-MM-dd")
             cursor.execute("""
                 SELECT title, due_date, status 
                 FROM tasks 
                 WHERE user_id = ?
+                AND date(due_date) >= date(?)
+                AND date(due_date) < date(?)
                 AND due_date IS NOT NULL
                 AND due_date != ''
-            """, (user_id,))
-            
+            """, (user_id, range_start, range_end))
+
             for title, due_date, status in cursor.fetchall():
-                if due_date:  # Check if due_date is not None or empty
-                    try:
-                        # Handle different date formats
-                        if ' ' in due_date:  # If date contains time
-                            date_str = due_date.split()[0]  # Get just the date part
-                        else:
-                            date_str = due_date  # Use the whole string as date
-                            
-                        if date_str not in self.tasks:
-                            self.tasks[date_str] = []
-                        self.tasks[date_str].append({
-                            'title': title,
-                            'status': status
-                        })
-                    except Exception as e:
-                        print(f"Error processing date '{due_date}': {e}")
-                        continue
-            
-            self.updateCells()  # Refresh calendar display
-            
+                # Handle dates with a time part
+                date_str = due_date.split()[0] if ' ' in due_date else due_date
+                tasks.setdefault(date_str, []).append({
+                    'title': title,
+                    'status': status
+                })
+
+            self.setTasks(tasks, repaint_changed)
+
         except sqlite3.Error as e:
             print(f"Database error: {e}")
         finally:
             conn.close()
 
+class DayCell(QWidget):
+    """One cell of the PlannerWidget month grid, re-labelled instead of rebuilt.
+
+    The look of each state ("day", "today", "empty") comes from rules in the
+    planner's stylesheet that match the cell's "state" property, so a cell
+    is only re-polished when its state changes. Task rows are kept as a pool
+    of QTreeWidgetItems that are re-texted and hidden, never deleted.
+    """
+
+    STATUS_BRUSHES = {
+        'Completed': QBrush(QColor('#27ae60')),
+        'Missed': QBrush(QColor('#e74c3c')),
+    }
+    DEFAULT_BRUSH = QBrush()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("dayCell")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.state = None
+
+        cell_layout = QVBoxLayout(self)
+        cell_layout.setContentsMargins(5, 5, 5, 5)
+
+        # Date number
+        self.date_label = QLabel()
+        self.date_label.setObjectName("dayNumber")
+        cell_layout.addWidget(self.date_label)
+
+        # Task list
+        self.task_list = QTreeWidget()
+        self.task_list.setObjectName("dayTasks")
+        self.task_list.setHeaderHidden(True)
+        self.task_list.setMaximumHeight(100)
+        cell_layout.addWidget(self.task_list)
+
+    def set_state(self, state):
+        if state == self.state:
+            return
+        self.state = state
+        for widget in (self, self.date_label):
+            widget.setProperty("state", state)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def set_day(self, day, tasks, is_today):
+        self.set_state("today" if is_today else "day")
+        self.date_label.setText(f"{day}")
+        self.set_tasks(tasks)
+
+    def clear_day(self):
+        # Empty cell for days outside current month
+        self.set_state("empty")
+        self.date_label.setText("")
+        self.set_tasks(())
+
+    def set_tasks(self, tasks):
+        # The item pool only grows when a day has more tasks than this cell ever showed
+        while self.task_list.topLevelItemCount() < len(tasks):
+            self.task_list.addTopLevelItem(QTreeWidgetItem())
+        for i in range(self.task_list.topLevelItemCount()):
+            item = self.task_list.topLevelItem(i)
+            if i < len(tasks):
+                item.setText(0, tasks[i]['title'])
+                item.setForeground(0, self.STATUS_BRUSHES.get(tasks[i]['status'], self.DEFAULT_BRUSH))
+                item.setHidden(False)
+            else:
+                item.setHidden(True)
+
 class PlannerWidget(QWidget):
     def __init__(self, user_id, parent=None):
         super().__init__(parent)
@@ -422,104 +556,86 @@ class PlannerWidget(QWidget):
         # Create grid layout for calendar
         self.grid = QGridLayout()
         layout.addLayout(self.grid)
-        
-        # Initial calendar display
-        self.update_calendar()
-
-    def update_calendar(self):
-        # Clear existing grid
-        for i in reversed(range(self.grid.count())):
-            self.grid.itemAt(i).widget().setParent(None)
 
-        # Update month label
-        self.month_label.setText(self.current_date.strftime("%B %Y"))
-
-        # Add day headers
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        for i, day in enumerate(days):
-            label = QLabel(day)
-            label.setStyleSheet("""
+        # One stylesheet for the whole grid; cells pick their rules by state
+        self.setStyleSheet("""
+            QLabel#dayHeader {
                 padding: 10px;
                 background-color: #f0f0f0;
                 border: 1px solid #ddd;
                 font-weight: bold;
-            """)
-            self.grid.addWidget(label, 0, i)
-
-        # Get calendar data
-        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
-
-        # Add day cells
-        for row, week in enumerate(cal, 1):
-            for col, day in enumerate(week):
-                if day != 0:
-                    cell = self.create_day_cell(day)
-                    self.grid.addWidget(cell, row, col)
-                else:
-                    # Empty cell for days outside current month
-                    empty = QWidget()
-                    empty.setStyleSheet("background-color: #f9f9f9;")
-                    self.grid.addWidget(empty, row, col)
-
-    def create_day_cell(self, day):
-        cell = QWidget()
-        cell_layout = QVBoxLayout(cell)
-        cell_layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Format date string to match database format
-        date_str = f"{self.current_date.year}-{self.current_date.month:02d}-{day:02d}"
-        
-        # Highlight today's date
-        is_today = (date.today().strftime("%Y-%m-%d") == date_str)
-        
-        # Date number
-        date_label = QLabel(f"{day}")
-        if is_today:
-            date_label.setStyleSheet("""
+            }
+            QWidget#dayCell[state="day"] {
+                background-color: white;
+                border: 1px solid #ddd;
+            }
+            QWidget#dayCell[state="today"] {
+                background-color: #f0f7ff;
+                border: 1px solid #2980b9;
+            }
+            QWidget#dayCell[state="empty"] {
+                background-color: #f9f9f9;
+            }
+            QLabel#dayNumber {
                 font-weight: bold;
+            }
+            QLabel#dayNumber[state="today"] {
                 color: white;
                 background-color: #2980b9;
                 padding: 2px 5px;
                 border-radius: 2px;
-            """)
-        else:
-            date_label.setStyleSheet("font-weight: bold;")
-        cell_layout.addWidget(date_label)
-        
-        # Task list
-        task_list = QTreeWidget()
-        task_list.setHeaderHidden(True)
-        task_list.setMaximumHeight(100)
-        task_list.setStyleSheet("""
-            QTreeWidget {
+            }
+            QTreeWidget#dayTasks {
                 border: none;
                 background-color: transparent;
             }
-            QTreeWidget::item {
+            QTreeWidget#dayTasks::item {
                 padding: 2px;
             }
         """)
 
-        # Add tasks for this day
-        if date_str in self.tasks:
-            for task in self.tasks[date_str]:
-                item = QTreeWidgetItem([task['title']])
-                if task['status'] == 'Completed':
-                    item.setForeground(0, QColor('#27ae60'))
-                elif task['status'] == 'Missed':
-                    item.setForeground(0, QColor('#e74c3c'))
-                task_list.addTopLevelItem(item)
-
-        cell_layout.addWidget(task_list)
-        
-        # Style the cell
-        cell.setStyleSheet(f"""
-            QWidget {{
-                background-color: {'#f0f7ff' if is_today else 'white'};
-                border: 1px solid {'#2980b9' if is_today else '#ddd'};
-            }}
-        """)
-        return cell
+        # Add day headers
+        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        for i, day in enumerate(days):
+            label = QLabel(day)
+            label.setObjectName("dayHeader")
+            self.grid.addWidget(label, 0, i)
+
+        # Fixed pool of 6 weeks x 7 days, reused for every month
+        self.cells = []
+        for row in range(6):
+            week = []
+            for col in range(7):
+                cell = DayCell()
+                self.grid.addWidget(cell, row + 1, col)
+                week.append(cell)
+            self.cells.append(week)
+
+        # Initial calendar display
+        self.update_calendar()
+
+    def update_calendar(self):
+        # Update month label
+        self.month_label.setText(self.current_date.strftime("%B %Y"))
+
+        # Get calendar data
+        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
+        today_str = date.today().strftime("%Y-%m-%d")
+
+        # Re-label the day cells; rows past the month's last week are hidden
+        for row, cells in enumerate(self.cells):
+            week = cal[row] if row < len(cal) else None
+            for col, cell in enumerate(cells):
+                cell.setVisible(week is not None)
+                if week is None:
+                    continue
+                day = week[col]
+                if day == 0:
+                    cell.clear_day()
+                    continue
+                # Format date string to match database format
+                date_str = f"{self.current_date.year}-{self.current_date.month:02d}-{day:02d}"
+                cell.set_day(day, self.tasks.get(date_str, ()), date_str == today_str)
 
     def load_tasks(self):
         self.tasks.clear()
@@ -689,9 +805,6 @@ class HabitWidget(QWidget):
         task_item = selected_items[0]
         task_id = task_item.data(0, Qt.ItemDataRole.UserRole)
         
-        # Clear existing marks
-        self.calendar.tasks.clear()
-        
         # Get the last completed date for selected task
         conn = Connect()
         cursor = conn.cursor()
@@ -702,16 +815,104 @@ class HabitWidget(QWidget):
             ''', (task_id, self.user_id))
             result = cursor.fetchone()
             
+            marks = {}
             if result and result[0]:
                 last_completed = result[0]
-                self.calendar.tasks[last_completed] = True
-                
-            self.calendar.updateCell()
+                marks[last_completed] = [{'title': task_item.text(0), 'status': 'Completed'}]
+
+            # Replaces the existing marks; only the affected cells repaint
+            self.calendar.setTasks(marks)
         except sqlite3.Error as e:
             QMessageBox.warning(self, "Database Error", str(e))
         finally:
             conn.close()
 
+class TaskTableModel(QAbstractTableModel):
+    """Task rows for a QTreeView, fetched a page at a time as the view scrolls.
+
+    The view calls canFetchMore/fetchMore when it is scrolled near the end,
+    so only the visible pages are ever queried. Each page is its own
+    query on a fresh connection; no cursor stays open. Pages continue after
+    the last row's (due_date, id) instead of using OFFSET, so with
+    tasks_user_due_page each one is a range scan. The query must end in its
+    WHERE clause, since the page condition is appended to it.
+    """
+
+    HEADERS = ["Task", "Due Date", "Status"]
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # (id, title, due_date, status)
+        self.query = None
+        self.params = ()
+        self.exhausted = True
+
+    def set_query(self, query, params):
+        self.beginResetModel()
+        self.rows = []
+        self.query = query
+        self.params = params
+        self.exhausted = False
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = row[index.column() + 1]
+            return "" if value is None else str(value)
+        if role == Qt.ItemDataRole.UserRole:
+            return row[0]  # Task ID
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        query, params = self.query, self.params
+        if self.rows:
+            last_id, _, last_due = self.rows[-1][:3]
+            if last_due is None:
+                # NULL due dates sort first and never compare in a row value
+                query += " AND (due_date IS NOT NULL OR id > ?)"
+                params = (*params, last_id)
+            else:
+                query += " AND (due_date, id) > (?, ?)"
+                params = (*params, last_due, last_id)
+        query += " ORDER BY due_date, id LIMIT ?"
+        conn = Connect()
+        try:
+            page = conn.execute(query, (*params, self.PAGE_SIZE)).fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            page = []
+        finally:
+            conn.close()
+        if len(page) < self.PAGE_SIZE:
+            self.exhausted = True
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+            self.rows.extend(page)
+            self.endInsertRows()
+
+    def task_id(self, row):
+        return self.rows[row][0]
+
 class TimePlanMainWindow(QMainWindow):
     def __init__(self, user_id, username):
         super().__init__()
@@ -719,6 +920,7 @@ class TimePlanMainWindow(QMainWindow):
         self.username = username
         self.setWindowTitle("TimePlan")
         self.setMinimumSize(1000, 600)
+        CreateTaskPageIndex()
         
         # Create main widget and layout
         main_widget = QWidget()
@@ -832,15 +1034,18 @@ class TimePlanMainWindow(QMainWindow):
         content_layout.addWidget(header)
         
         # Add task list
-        self.task_list = QTreeWidget()
-        self.task_list.setHeaderLabels(["Task", "Due Date", "Status"])
+        self.task_model = TaskTableModel(self)
+        self.task_list = QTreeView()
+        self.task_list.setModel(self.task_model)
+        self.task_list.setRootIsDecorated(False)
+        self.task_list.setUniformRowHeights(True)  # Lets the view skip measuring every row
         self.task_list.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 border: 1px solid #dcdde1;
                 border-radius: 4px;
                 background-color: white;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 padding: 8px;
             }
         """)
@@ -858,7 +1063,6 @@ class TimePlanMainWindow(QMainWindow):
         self.load_tasks(category_id)
         
     def load_tasks(self, category):
-        self.task_list.clear()
         conn = Connect()
         cursor = conn.cursor()
         
@@ -905,17 +1109,12 @@ class TimePlanMainWindow(QMainWindow):
         }
         
         try:
-            cursor.execute(query_map[category], (self.user_id,))
-            tasks = cursor.fetchall()
-            
-            for task in tasks:
-                item = QTreeWidgetItem(self.task_list)
-                item.setText(0, task[1])  # Title
-                item.setText(1, task[2])  # Due Date
-                item.setText(2, task[3])  # Status
-                item.setData(0, Qt.ItemDataRole.UserRole, task[0])  # Store task ID
-            
-            self.task_count.setText(f"{len(tasks)} tasks")
+            # Rows are paged in by the model; only the count is queried here
+            cursor.execute(f"SELECT COUNT(*) FROM ({query_map[category]})", (self.user_id,))
+            count = cursor.fetchone()[0]
+            self.task_model.set_query(query_map[category], (self.user_id,))
+
+            self.task_count.setText(f"{count} tasks")
         except sqlite3.Error as e:
             print(f"Database error: {e}")
         finally:
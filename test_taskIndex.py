@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from databaseManagement import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "index.db"))
+    yield manager
+    manager._close()
+
+
+def test_category_ids_above_255(db):
+    assert db.enable_task_index()
+    for i in range(300):
+        db.add_category(f"Imported {i}")
+    category_id = db.get_category_id_by_name("Imported 299")
+    assert category_id > 255
+
+    db.get_tasks(1)  # Builds the index before the write, so the listener path is covered too
+    task_id = db.add_task(1, "High category", None, "Urgent", "2030-01-01", category_id)
+    tasks = db.get_tasks(1)
+
+    assert [row[0] for row in tasks] == [task_id]
+    assert tasks[0][5] == "Imported 299"
+    assert db.task_index.filter(1, 'All Tasks', "2030-01-01") == [task_id]
+
+
+def test_notification_with_more_than_999_ids(db):
+    assert db.enable_task_index()
+    db.get_tasks(1)
+    with db.conn:
+        db.conn.executemany(
+            "INSERT INTO tasks (user_id, task_title, priority_id, due_date, category_id) VALUES (1, ?, 2, '2030-01-01', 1)",
+            [(f"Task {i}",) for i in range(1500)])
+    task_ids = [row[0] for row in db._fetch_all("SELECT task_id FROM tasks")]
+    db._notify_tasks_changed(task_ids, 1)
+
+    assert db.task_index.count(1) == 1500
+
+
+def test_failed_refresh_invalidates_index(db):
+    assert db.enable_task_index()
+    task_id = db.add_task(1, "Before", None, "Urgent", "2030-01-01", 1)
+    db.get_tasks(1)
+    db.conn.execute("ALTER TABLE priority RENAME TO priority_gone")  # Makes the refresh query fail
+    db._notify_tasks_changed([task_id], 1)
+    db.conn.execute("ALTER TABLE priority_gone RENAME TO priority")
+
+    assert db.task_index.stats()["users"] == 0
+    assert db.task_index.filter(1, 'All Tasks', "2030-01-01") == [task_id]
+
+
+def test_cached_task_records_are_read_only(db):
+    db.add_task(1, "Shared", None, "Urgent", "2030-01-01", 1)
+    first = db.get_tasks(1, records=True)
+    second = db.get_tasks(1, records=True)
+    assert first[0] is second[0]  # Served from the cache
+
+    with pytest.raises(AttributeError):
+        first[0].title = "Changed"
+    assert second[0].title == "Shared"